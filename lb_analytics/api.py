@@ -2,6 +2,9 @@
 
 from lb_analytics.engine.aggregators.collectors import (
     aggregate_cli,
+    aggregate_ebpf,
+    aggregate_perf,
+    aggregate_procfs,
     aggregate_psutil,
 )
 from lb_analytics.engine.aggregators.data_handler import DataHandler, TestResult
@@ -19,6 +22,9 @@ __all__ = [
     "DataHandler",
     "TestResult",
     "aggregate_cli",
+    "aggregate_ebpf",
+    "aggregate_perf",
+    "aggregate_procfs",
     "aggregate_psutil",
     "Reporter",
 ]
@@ -1,6 +1,20 @@
 """Aggregators for metrics and collectors."""
 
 from lb_analytics.engine.aggregators.data_handler import DataHandler, TestResult
-from lb_analytics.engine.aggregators.collectors import aggregate_cli, aggregate_psutil
+from lb_analytics.engine.aggregators.collectors import (
+    aggregate_cli,
+    aggregate_ebpf,
+    aggregate_perf,
+    aggregate_procfs,
+    aggregate_psutil,
+)
 
-__all__ = ["DataHandler", "TestResult", "aggregate_cli", "aggregate_psutil"]
+__all__ = [
+    "DataHandler",
+    "TestResult",
+    "aggregate_cli",
+    "aggregate_ebpf",
+    "aggregate_perf",
+    "aggregate_procfs",
+    "aggregate_psutil",
+]
@@ -2,83 +2,228 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, List, Tuple, cast
 
 import numpy as np
 import pandas as pd
+from pandas.core.groupby import DataFrameGroupBy
 
+REPETITION_COLUMN = "repetition"
 
-def _safe_time_diff_seconds(index: pd.Index) -> float:
-    if len(index) <= 1:
-        return 1.0
-    time_diff = (index[-1] - index[0]).total_seconds()
-    return time_diff if time_diff > 0 else 1.0
+BatchAggregator = Callable[[pd.DataFrame], pd.DataFrame]
 
 
-def _update_cpu_metrics(summary: Dict[str, float], df: pd.DataFrame) -> None:
+def _group(df: pd.DataFrame) -> DataFrameGroupBy:
+    return df.groupby(REPETITION_COLUMN, observed=True, sort=True)
+
+
+def _empty_summary(grouped: DataFrameGroupBy) -> pd.DataFrame:
+    return pd.DataFrame(index=grouped.size().index)
+
+
+def _single_group(batch: BatchAggregator, df: pd.DataFrame) -> Dict[str, float]:
+    """Run a batch aggregator on a frame holding a single repetition."""
+    if df.empty:
+        return {}
+    frame = batch(df.assign(**{REPETITION_COLUMN: 0}))
+    if frame.empty:
+        return {}
+    return {str(key): value for key, value in frame.iloc[0].items()}
+
+
+def _span_seconds(df: pd.DataFrame, grouped: DataFrameGroupBy) -> pd.Series:
+    """Seconds between the first and last sample of each group (at least 1)."""
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return pd.Series(1.0, index=grouped.size().index)
+    stamps = pd.DataFrame(
+        {REPETITION_COLUMN: df[REPETITION_COLUMN].array, "_ts": df.index.array}
+    )
+    bounds = _group(stamps)["_ts"].agg(["first", "last"])
+    span = (bounds["last"] - bounds["first"]).dt.total_seconds()
+    return span.where(span > 0, 1.0)
+
+
+def _update_cpu_metrics(
+    summary: pd.DataFrame, df: pd.DataFrame, grouped: DataFrameGroupBy
+) -> None:
     if "cpu_percent" not in df.columns:
         return
-    summary["cpu_usage_percent_avg"] = df["cpu_percent"].mean()
-    summary["cpu_usage_percent_max"] = df["cpu_percent"].max()
-    summary["cpu_usage_percent_p95"] = df["cpu_percent"].quantile(0.95)
+    cpu = grouped["cpu_percent"]
+    summary["cpu_usage_percent_avg"] = cpu.mean()
+    summary["cpu_usage_percent_max"] = cpu.max()
+    summary["cpu_usage_percent_p95"] = cpu.quantile(0.95)
 
 
-def _update_memory_metrics(summary: Dict[str, float], df: pd.DataFrame) -> None:
+def _update_memory_metrics(
+    summary: pd.DataFrame, df: pd.DataFrame, grouped: DataFrameGroupBy
+) -> None:
     if "memory_usage" not in df.columns:
         return
-    summary["memory_usage_percent_avg"] = df["memory_usage"].mean()
-    summary["memory_usage_percent_max"] = df["memory_usage"].max()
-
-
-def _update_disk_metrics(summary: Dict[str, float], df: pd.DataFrame) -> None:
-    time_diff = _safe_time_diff_seconds(df.index)
-    if "disk_read_bytes" in df.columns:
-        read_diff = df["disk_read_bytes"].iloc[-1] - df["disk_read_bytes"].iloc[0]
-        summary["disk_read_mbps_avg"] = (read_diff / time_diff) / (1024 * 1024)
-    if "disk_write_bytes" in df.columns:
-        write_diff = df["disk_write_bytes"].iloc[-1] - df["disk_write_bytes"].iloc[0]
-        summary["disk_write_mbps_avg"] = (write_diff / time_diff) / (1024 * 1024)
-    if "disk_read_mbps_avg" not in summary and "disk_write_mbps_avg" not in summary:
-        return
-
-
-def _update_network_metrics(summary: Dict[str, float], df: pd.DataFrame) -> None:
-    time_diff = _safe_time_diff_seconds(df.index)
-    if "net_bytes_sent" in df.columns:
-        sent_diff = df["net_bytes_sent"].iloc[-1] - df["net_bytes_sent"].iloc[0]
-        summary["network_sent_mbps_avg"] = (sent_diff / time_diff) / (1024 * 1024)
-    if "net_bytes_recv" in df.columns:
-        recv_diff = df["net_bytes_recv"].iloc[-1] - df["net_bytes_recv"].iloc[0]
-        summary["network_recv_mbps_avg"] = (recv_diff / time_diff) / (1024 * 1024)
-    if (
-        "network_sent_mbps_avg" not in summary
-        and "network_recv_mbps_avg" not in summary
-    ):
+    memory = grouped["memory_usage"]
+    summary["memory_usage_percent_avg"] = memory.mean()
+    summary["memory_usage_percent_max"] = memory.max()
+
+
+def _update_counter_rates(
+    summary: pd.DataFrame,
+    df: pd.DataFrame,
+    grouped: DataFrameGroupBy,
+    counters: Dict[str, str],
+) -> None:
+    """Turn cumulative byte counters into MB/s over each group's span."""
+    present = [column for column in counters if column in df.columns]
+    if not present:
         return
+    first = grouped[present].first()
+    last = grouped[present].last()
+    span = _span_seconds(df, grouped)
+    rates = (last - first).div(span, axis=0) / (1024 * 1024)
+    for column in present:
+        summary[counters[column]] = rates[column]
+
+
+def aggregate_psutil_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate PSUtil collector data for every repetition at once.
+
+    Args:
+        df: Samples of all repetitions with a ``repetition`` column
+
+    Returns:
+        DataFrame indexed by repetition with one column per metric.
+    """
+    grouped = _group(df)
+    summary = _empty_summary(grouped)
+    _update_cpu_metrics(summary, df, grouped)
+    _update_memory_metrics(summary, df, grouped)
+    _update_counter_rates(
+        summary,
+        df,
+        grouped,
+        {
+            "disk_read_bytes": "disk_read_mbps_avg",
+            "disk_write_bytes": "disk_write_mbps_avg",
+            "net_bytes_sent": "network_sent_mbps_avg",
+            "net_bytes_recv": "network_recv_mbps_avg",
+        },
+    )
+    return summary
 
 
 def aggregate_psutil(df: pd.DataFrame) -> Dict[str, float]:
     """Aggregate PSUtil collector data."""
-    if df.empty:
-        return {}
+    return _single_group(aggregate_psutil_batch, df)
+
+
+def aggregate_procfs_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Batch form of :func:`aggregate_procfs`."""
+    summary = aggregate_psutil_batch(df)
+    grouped = _group(df)
+    if "cpu_percent" in df.columns:
+        summary["cpu_usage_percent_p99"] = grouped["cpu_percent"].quantile(0.99)
+    for resource in ("cpu", "memory", "io"):
+        column = f"psi_{resource}_some_avg10"
+        if column in df.columns:
+            summary[f"{column}_max"] = grouped[column].max()
+    return summary
 
-    summary: Dict[str, float] = {}
-    _update_cpu_metrics(summary, df)
-    _update_memory_metrics(summary, df)
-    _update_disk_metrics(summary, df)
-    _update_network_metrics(summary, df)
 
+def aggregate_procfs(df: pd.DataFrame) -> Dict[str, float]:
+    """Aggregate ProcfsCollector data (psutil-compatible columns plus tails)."""
+    return _single_group(aggregate_procfs_batch, df)
+
+
+def aggregate_perf_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Batch form of :func:`aggregate_perf`."""
+    grouped = _group(df)
+    summary = _empty_summary(grouped)
+    if "ipc" in df.columns:
+        summary["ipc_avg"] = grouped["ipc"].mean()
+        summary["ipc_min"] = grouped["ipc"].min()
+    for column in ("cache_miss_percent", "branch_miss_percent"):
+        if column in df.columns:
+            summary[f"{column}_avg"] = grouped[column].mean()
+            summary[f"{column}_max"] = grouped[column].max()
+    for column in ("cpu_cycles", "instructions", "task_clock", "context_switches"):
+        if column in df.columns:
+            summary[f"{column}_total"] = grouped[column].sum()
     return summary
 
 
-def aggregate_cli(df: pd.DataFrame) -> Dict[str, float]:
-    """Aggregate CLI collector data."""
-    summary: Dict[str, float] = {}
+def aggregate_perf(df: pd.DataFrame) -> Dict[str, float]:
+    """Aggregate PerfStatCollector data (IPC, miss rates, counter totals)."""
+    return _single_group(aggregate_perf_batch, df)
+
+
+def aggregate_ebpf_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Batch form of :func:`aggregate_ebpf`.
+
+    Bucket columns are named ``<name>_le_<upper>``; counts are summed per
+    repetition and p50/p99 report the upper bound of the bucket reaching the
+    quantile, as log2 histograms do.
+    """
+    buckets: Dict[str, List[Tuple[int, str]]] = {}
+    for column in df.columns:
+        name, sep, upper = str(column).rpartition("_le_")
+        if sep and upper.isdigit():
+            buckets.setdefault(name, []).append((int(upper), column))
+
+    grouped = _group(df)
+    summary = _empty_summary(grouped)
+    for name, columns in buckets.items():
+        columns.sort()
+        uppers = np.array([upper for upper, _ in columns], dtype=float)
+        counts = (
+            grouped[[column for _, column in columns]]
+            .sum()
+            .apply(pd.to_numeric, errors="coerce")
+            .fillna(0.0)
+            .to_numpy(dtype=float)
+        )
+        total = counts.sum(axis=1)
+        valid = total > 0
+        summary[f"{name}_count"] = np.where(valid, total, np.nan)
+        cumulative = counts.cumsum(axis=1)
+        for label, quantile in (("p50", 0.5), ("p99", 0.99)):
+            reached = (cumulative >= quantile * total[:, None]).argmax(axis=1)
+            summary[f"{name}_{label}"] = np.where(valid, uppers[reached], np.nan)
+    return summary
 
-    # Example: compute averages for numerical columns
-    for col in df.columns:
-        if pd.api.types.is_numeric_dtype(df[col]):
-            summary[f"{col}_avg"] = float(np.mean(df[col]))
-            summary[f"{col}_max"] = float(np.max(df[col]))
 
-    return summary
+def aggregate_ebpf(df: pd.DataFrame) -> Dict[str, float]:
+    """Aggregate EBPFCollector latency histograms into p50/p99 per histogram."""
+    summary = _single_group(aggregate_ebpf_batch, df)
+    return {key: value for key, value in summary.items() if pd.notna(value)}
+
+
+def aggregate_cli_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Batch form of :func:`aggregate_cli` (mean/max of numeric columns)."""
+    numeric = [
+        column
+        for column in df.columns
+        if column != REPETITION_COLUMN and pd.api.types.is_numeric_dtype(df[column])
+    ]
+    grouped = _group(df)
+    if not numeric:
+        return _empty_summary(grouped)
+    stats = grouped[numeric].agg(["mean", "max"]).astype(float)
+    stats.columns = [
+        f"{column}_{'avg' if stat == 'mean' else stat}"
+        for column, stat in cast(List[Tuple[str, str]], stats.columns.tolist())
+    ]
+    return stats
+
+
+def aggregate_cli(df: pd.DataFrame) -> Dict[str, float]:
+    """Aggregate CLI collector data."""
+    return _single_group(aggregate_cli_batch, df)
+
+
+# Batch counterparts used by DataHandler to aggregate all repetitions of a
+# collector with one groupby instead of one call per repetition.
+BATCH_AGGREGATORS: Dict[Callable[[pd.DataFrame], Dict[str, float]], BatchAggregator] = {
+    aggregate_psutil: aggregate_psutil_batch,
+    aggregate_procfs: aggregate_procfs_batch,
+    aggregate_perf: aggregate_perf_batch,
+    aggregate_ebpf: aggregate_ebpf_batch,
+    aggregate_cli: aggregate_cli_batch,
+}
@@ -8,12 +8,28 @@ DataFrames suitable for analysis and reporting.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, TypedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    SupportsInt,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 import pandas as pd
 
 from lb_analytics.engine.aggregators.collectors import (
+    BATCH_AGGREGATORS,
+    REPETITION_COLUMN,
     aggregate_cli,
+    aggregate_ebpf,
+    aggregate_perf,
+    aggregate_procfs,
     aggregate_psutil,
 )
 
@@ -24,7 +40,9 @@ class TestResult(TypedDict):
     """Structure of a single test repetition result."""
 
     repetition: int
-    metrics: Dict[str, List[Dict[str, Any]]]
+    # Either a reference to the per-repetition samples file (current format)
+    # or the raw samples embedded inline (runs produced by older releases).
+    metrics: Dict[str, Union[Dict[str, Any], List[Dict[str, Any]]]]
     start_time: Optional[str]
     end_time: Optional[str]
 
@@ -52,7 +70,10 @@ class DataHandler:
             self.collector_aggregators.update(
                 {
                     "PSUtilCollector": aggregate_psutil,
+                    "ProcfsCollector": aggregate_procfs,
                     "CLICollector": aggregate_cli,
+                    "PerfStatCollector": aggregate_perf,
+                    "EBPFCollector": aggregate_ebpf,
                 }
             )
 
@@ -63,44 +84,95 @@ class DataHandler:
         return pd.to_datetime(value)
 
     @staticmethod
-    def _filter_by_time(
-        df: pd.DataFrame,
-        start_time: Optional[pd.Timestamp],
-        end_time: Optional[pd.Timestamp],
-    ) -> pd.DataFrame:
-        if start_time and end_time:
-            return df[(df["timestamp"] >= start_time) & (df["timestamp"] <= end_time)]
-        return df
+    def _load_collector_samples(
+        collector_name: str,
+        collector_data: Any,
+        base_dir: Optional[Path],
+    ) -> Optional[pd.DataFrame]:
+        """Load samples from a metrics reference or a legacy inline list."""
+        if isinstance(collector_data, list):
+            return pd.DataFrame(collector_data) if collector_data else None
+        if not isinstance(collector_data, dict):
+            return None
+        samples_file = collector_data.get("samples_file")
+        if not samples_file or not collector_data.get("sample_count", 1):
+            return None
+        path = Path(samples_file)
+        if base_dir is not None and not path.is_absolute():
+            path = base_dir / path
+        if not path.exists():
+            logger.warning(
+                "Samples file for collector %s not found: %s", collector_name, path
+            )
+            return None
+        try:
+            return pd.read_csv(path)
+        except Exception as exc:
+            logger.warning(
+                "Failed to read samples for collector %s from %s: %s",
+                collector_name,
+                path,
+                exc,
+            )
+            return None
+
+    @staticmethod
+    def _parse_timestamps(values: pd.Series) -> pd.Series:
+        try:
+            return pd.to_datetime(values)
+        except (TypeError, ValueError):
+            # Legacy inline samples may mix timestamp layouts across repetitions.
+            return pd.to_datetime(values, format="mixed")
 
     def _normalize_collector_df(
         self,
         collector_name: str,
-        collector_data: List[Dict[str, Any]],
-        start_time: Optional[pd.Timestamp],
-        end_time: Optional[pd.Timestamp],
+        frames: Dict[int, pd.DataFrame],
+        bounds: Dict[int, Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]],
     ) -> Optional[pd.DataFrame]:
-        if not collector_data:
-            return None
+        """
+        Concatenate every repetition's samples into one frame.
 
-        df = pd.DataFrame(collector_data)
+        Timestamps are parsed once for the whole collector and each sample is
+        checked against its own repetition's time window in a single pass.
+        """
+        df = pd.concat(
+            [frame.assign(**{REPETITION_COLUMN: rep}) for rep, frame in frames.items()],
+            ignore_index=True,
+        )
+        df[REPETITION_COLUMN] = pd.Categorical(
+            df[REPETITION_COLUMN], categories=list(frames)
+        )
         if "timestamp" not in df.columns:
             return df
 
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df = self._filter_by_time(df, start_time, end_time)
+        df["timestamp"] = self._parse_timestamps(df["timestamp"])
+        windows = {rep: window for rep, window in bounds.items() if all(window)}
+        if windows:
+            reps = df[REPETITION_COLUMN].astype(object)
+            start = pd.to_datetime(reps.map({r: w[0] for r, w in windows.items()}))
+            end = pd.to_datetime(reps.map({r: w[1] for r, w in windows.items()}))
+            unbounded = start.isna() | end.isna()
+            in_window = (df["timestamp"] >= start) & (df["timestamp"] <= end)
+            df = df[unbounded | in_window]
+
+        for rep in frames:
+            if rep in windows and not (df[REPETITION_COLUMN] == rep).any():
+                logger.warning(
+                    "Collector %s has no data after filtering by test duration "
+                    "(repetition %s)",
+                    collector_name,
+                    rep,
+                )
         if df.empty:
-            logger.warning(
-                "Collector %s has no data after filtering by test duration",
-                collector_name,
-            )
             return None
 
-        df.set_index("timestamp", inplace=True)
-        return df
+        return df.set_index("timestamp")
 
     def _aggregate_collector(
         self, collector_name: str, df: pd.DataFrame
-    ) -> Dict[str, Any]:
+    ) -> Dict[int, Dict[str, Any]]:
+        """Aggregate all repetitions of a collector, keyed by repetition."""
         aggregator = self.collector_aggregators.get(collector_name)
         if not callable(aggregator):
             logger.warning(
@@ -108,6 +180,42 @@ class DataHandler:
                 collector_name,
             )
             return {}
+        batch = BATCH_AGGREGATORS.get(aggregator)
+        if batch is not None:
+            try:
+                frame = batch(df)
+            except Exception as exc:
+                logger.error(
+                    "Aggregation failed for collector '%s': %s",
+                    collector_name,
+                    exc,
+                )
+                return {}
+            return self._batch_summaries(frame)
+
+        # Third-party aggregators take one repetition's frame at a time.
+        summaries: Dict[int, Dict[str, Any]] = {}
+        for rep, group in df.groupby(REPETITION_COLUMN, observed=True, sort=True):
+            summary = self._aggregate_repetition(
+                collector_name, aggregator, group.drop(columns=REPETITION_COLUMN)
+            )
+            if summary:
+                summaries[int(cast(SupportsInt, rep))] = summary
+        return summaries
+
+    @staticmethod
+    def _batch_summaries(frame: pd.DataFrame) -> Dict[int, Dict[str, Any]]:
+        """Split a batch aggregator's frame into per-repetition summaries."""
+        summaries: Dict[int, Dict[str, Any]] = {}
+        for rep, row in frame.to_dict(orient="index").items():
+            repetition = int(cast(SupportsInt, rep))
+            summaries[repetition] = {str(key): value for key, value in row.items()}
+        return summaries
+
+    @staticmethod
+    def _aggregate_repetition(
+        collector_name: str, aggregator: Any, df: pd.DataFrame
+    ) -> Dict[str, Any]:
         try:
             result = aggregator(df)
             if not isinstance(result, dict):
@@ -126,29 +234,27 @@ class DataHandler:
             )
             return {}
 
-    def _build_repetition_summary(
-        self, result: TestResult
-    ) -> Dict[str, Dict[str, Any]]:
-        rep_num = result["repetition"]
-        metrics = result["metrics"]
-        start_time = self._parse_time(result.get("start_time"))
-        end_time = self._parse_time(result.get("end_time"))
-
-        rep_summary: Dict[str, Any] = {}
-        for collector_name, collector_data in metrics.items():
-            df = self._normalize_collector_df(
-                collector_name, collector_data, start_time, end_time
-            )
-            if df is None:
-                continue
-            rep_summary.update(self._aggregate_collector(collector_name, df))
-
-        return {f"Repetition_{rep_num}": rep_summary}
+    def _collect_frames(
+        self, results: List[TestResult], base_dir: Optional[Path]
+    ) -> Dict[str, Dict[int, pd.DataFrame]]:
+        """Load every collector's samples, grouped by collector then repetition."""
+        frames: Dict[str, Dict[int, pd.DataFrame]] = {}
+        for result in results:
+            rep_num = result["repetition"]
+            for collector_name, collector_data in result["metrics"].items():
+                df = self._load_collector_samples(
+                    collector_name, collector_data, base_dir
+                )
+                if df is None or df.empty:
+                    continue
+                frames.setdefault(collector_name, {})[rep_num] = df
+        return frames
 
     def process_test_results(
         self,
         test_name: str,
         results: List[TestResult],
+        base_dir: Optional[Path] = None,
     ) -> Optional[pd.DataFrame]:
         """
         Process test results and create aggregated DataFrame.
@@ -156,6 +262,8 @@ class DataHandler:
         Args:
             test_name: Name of the test
             results: List of test result dictionaries
+            base_dir: Workload directory that relative ``samples_file``
+                references are resolved against
 
         Returns:
             DataFrame with metrics as index and repetitions as columns
@@ -164,19 +272,25 @@ class DataHandler:
             logger.warning(f"No results to process for test {test_name}")
             return None
 
-        repetition_summaries = [
-            self._build_repetition_summary(result) for result in results
-        ]
-
-        # Create final DataFrame with metrics as index and repetitions as columns
-        if not repetition_summaries:
-            return None
-
-        # Combine all repetition data
-        combined_data: Dict[str, Dict[str, Any]] = {}
-        for rep_dict in repetition_summaries:
-            for rep_name, metrics in rep_dict.items():
-                combined_data[rep_name] = metrics
+        # A repetition recorded twice keeps its latest result.
+        latest = {result["repetition"]: result for result in results}
+        bounds = {
+            rep: (
+                self._parse_time(result.get("start_time")),
+                self._parse_time(result.get("end_time")),
+            )
+            for rep, result in latest.items()
+        }
+        combined_data: Dict[str, Dict[str, Any]] = {
+            f"Repetition_{rep}": {} for rep in latest
+        }
+        frames = self._collect_frames(list(latest.values()), base_dir)
+        for collector_name, collector_frames in frames.items():
+            df = self._normalize_collector_df(collector_name, collector_frames, bounds)
+            if df is None:
+                continue
+            for rep, summary in self._aggregate_collector(collector_name, df).items():
+                combined_data[f"Repetition_{rep}"].update(summary)
 
         # Create DataFrame and transpose so metrics are index
         df = pd.DataFrame(combined_data).T
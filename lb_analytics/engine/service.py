@@ -8,9 +8,21 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Literal, Optional, Sequence, TYPE_CHECKING, cast
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    cast,
+)
 
 from lb_common.api import RunInfo
 
@@ -19,84 +31,118 @@ logger = logging.getLogger(__name__)
 AnalyticsKind = Literal["aggregate"]
 
 if TYPE_CHECKING:
-    from lb_analytics.engine.aggregators.data_handler import DataHandler, TestResult
+    from lb_analytics.engine.aggregators.data_handler import TestResult
 
 
 @dataclass(frozen=True)
 class AnalyticsRequest:
-    """Parameters to run analytics on a stored run."""
+    """Parameters to run analytics on a stored run.
+
+    ``workers`` above 1 fans the (host, workload) units out to a process pool
+    of that size; 1 keeps everything in the calling process.
+    """
 
     run: RunInfo
     kind: AnalyticsKind = "aggregate"
     hosts: Optional[Sequence[str]] = None
     workloads: Optional[Sequence[str]] = None
+    workers: int = 1
+
+
+@dataclass(frozen=True)
+class _AggregateUnit:
+    """One (host, workload) results file and the CSV it aggregates into."""
+
+    workload: str
+    results_file: Path
+    out_path: Path
+
+
+def _load_results(results_file: Path) -> Optional[List["TestResult"]]:
+    try:
+        results = json.loads(results_file.read_text())
+    except Exception as exc:
+        logger.warning("Failed to parse results %s: %s", results_file, exc)
+        return None
+    if not isinstance(results, list):
+        return None
+    if not all(isinstance(item, dict) for item in results):
+        return None
+    return cast(List["TestResult"], results)
+
+
+def _aggregate_unit(unit: _AggregateUnit) -> Optional[Path]:
+    """Aggregate one results file; runs in a worker process in pool mode."""
+    from lb_analytics.engine.aggregators.data_handler import DataHandler
+
+    results = _load_results(unit.results_file)
+    if results is None:
+        return None
+    df = DataHandler().process_test_results(
+        unit.workload, results, base_dir=unit.results_file.parent
+    )
+    if df is None:
+        return None
+    unit.out_path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(unit.out_path)
+    return unit.out_path
 
 
 class AnalyticsService:
     """Execute analytics against existing artifacts."""
 
+    def __init__(self) -> None:
+        # Results files being aggregated by any pooled request, so concurrent
+        # requests for the same file share one computation.
+        self._inflight: Dict[Path, "Future[Optional[Path]]"] = {}
+        self._inflight_lock = threading.Lock()
+
     def run(self, request: AnalyticsRequest) -> List[Path]:
+        """Run analytics and return the produced artifact paths."""
+        return list(self.iter_run(request))
+
+    def iter_run(self, request: AnalyticsRequest) -> Iterator[Path]:
+        """
+        Run analytics, yielding each artifact as soon as it is written.
+
+        With ``request.workers > 1`` artifacts arrive in completion order;
+        otherwise they follow host then workload order.
+        """
         if request.kind == "aggregate":
             return self._run_aggregate(request)
         raise ValueError(f"Unsupported analytics kind: {request.kind}")
 
-    def _load_results(self, results_file: Path) -> Optional[List["TestResult"]]:
-        try:
-            results = json.loads(results_file.read_text())
-        except Exception as exc:
-            logger.warning("Failed to parse results %s: %s", results_file, exc)
-            return None
-        if not isinstance(results, list):
-            return None
-        return self._coerce_test_results(results)
-
     @staticmethod
-    def _coerce_test_results(results: list[Any]) -> Optional[List["TestResult"]]:
-        if not all(isinstance(item, dict) for item in results):
-            return None
-        return cast(List["TestResult"], results)
-
-    def _process_workload(
-        self,
-        handler: DataHandler,
-        host_root: Path,
-        export_root: Path,
-        workload: str,
-    ) -> Optional[Path]:
-        results_file = host_root / workload / f"{workload}_results.json"
-        if not results_file.exists():
-            return None
-        results = self._load_results(results_file)
-        if results is None:
-            return None
-        df = handler.process_test_results(workload, results)
-        if df is None:
-            return None
-        out_path = export_root / f"{workload}_aggregated.csv"
-        df.to_csv(out_path)
-        return out_path
-
-    def _run_aggregate_for_host(
-        self, handler: DataHandler, run: RunInfo, host: str, workloads: List[str]
-    ) -> List[Path]:
-        host_root = run.output_root / host
-        if not host_root.exists():
-            logger.warning("Host output missing for %s in run %s", host, run.run_id)
-            return []
-
-        export_root = host_root / "exports"
-        export_root.mkdir(parents=True, exist_ok=True)
-
-        produced: List[Path] = []
-        for workload in workloads:
-            out_path = self._process_workload(handler, host_root, export_root, workload)
-            if out_path:
-                produced.append(out_path)
-        return produced
-
-    def _run_aggregate(self, request: AnalyticsRequest) -> List[Path]:
+    def _plan_units(request: AnalyticsRequest) -> List[_AggregateUnit]:
+        run = request.run
+        hosts = list(request.hosts or run.hosts)
+        workloads = list(request.workloads or run.workloads)
+
+        units: Dict[Path, _AggregateUnit] = {}
+        for host in hosts:
+            host_root = run.output_root / host
+            if not host_root.exists():
+                logger.warning("Host output missing for %s in run %s", host, run.run_id)
+                continue
+            export_root = host_root / "exports"
+            for workload in workloads:
+                results_file = host_root / workload / f"{workload}_results.json"
+                if not results_file.exists():
+                    continue
+                # The same file requested twice is aggregated once.
+                units.setdefault(
+                    results_file.resolve(),
+                    _AggregateUnit(
+                        workload=workload,
+                        results_file=results_file,
+                        out_path=export_root / f"{workload}_aggregated.csv",
+                    ),
+                )
+        return list(units.values())
+
+    def _run_aggregate(self, request: AnalyticsRequest) -> Iterator[Path]:
         try:
-            from lb_analytics.engine.aggregators.data_handler import (
+            from lb_analytics.engine.aggregators.data_handler import (  # noqa: F401
                 DataHandler,
             )
         except Exception as exc:
@@ -105,13 +151,37 @@ class AnalyticsService:
                 "Install with the controller extra."
             ) from exc
 
-        run = request.run
-        hosts = list(request.hosts or run.hosts)
-        workloads = list(request.workloads or run.workloads)
-        handler = DataHandler()
-
-        produced: List[Path] = []
-        for host in hosts:
-            produced.extend(self._run_aggregate_for_host(handler, run, host, workloads))
-
-        return produced
+        units = self._plan_units(request)
+        workers = min(request.workers, len(units))
+        if workers <= 1:
+            return (path for path in map(_aggregate_unit, units) if path)
+        return self._run_pooled(units, workers)
+
+    def _run_pooled(self, units: List[_AggregateUnit], workers: int) -> Iterator[Path]:
+        # Spawn rather than fork: the GUI calls this from a QThread, and a
+        # forked child would inherit that thread's locks in whatever state
+        # they happen to be in.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [self._submit(pool, unit) for unit in units]
+            for future in as_completed(futures):
+                path = future.result()
+                if path:
+                    yield path
+
+    def _submit(
+        self, pool: ProcessPoolExecutor, unit: _AggregateUnit
+    ) -> "Future[Optional[Path]]":
+        key = unit.results_file.resolve()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = pool.submit(_aggregate_unit, unit)
+            self._inflight[key] = future
+        future.add_done_callback(lambda _done: self._forget(key))
+        return future
+
+    def _forget(self, key: Path) -> None:
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
@@ -215,7 +215,7 @@ class ApplicationClient:
             journal = RunJournal.load(journal_path)
         except Exception:
             return None
-        names = sorted({task.host for task in journal.tasks.values() if task.host})
+        names = [name for name in journal.hosts() if name]
         return names or None
 
     @staticmethod
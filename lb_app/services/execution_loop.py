@@ -291,8 +291,8 @@ class RunExecutionLoop:
         """Mark any RUNNING tasks as FAILED with the given reason."""
         # Note: RunJournal type imported but here treating as Any to avoid strict
         # circular import if not careful, but we can import RunJournal if needed.
-        for task in journal.tasks.values():
-            if task.status == RunStatus.RUNNING:
-                task.status = RunStatus.FAILED
+        with journal.lock:
+            for task in journal.get_tasks_by_status(RunStatus.RUNNING):
+                journal.set_status(task, RunStatus.FAILED)
                 task.current_action = reason
                 task.error = reason
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import json
 import os
+import select
+import struct
+import sys
 import threading
 import time
 from pathlib import Path
 from typing import cast
-from typing import Any, Callable
+from typing import IO, Any, Callable
 
 
 def _debug_enabled() -> bool:
@@ -18,21 +23,146 @@ def _debug_enabled() -> bool:
 
 _DEBUG = _debug_enabled()
 
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_BUFFER = 64 * 1024
+# Safety net for filesystems that do not deliver inotify events.
+_RESYNC_SECONDS = 5.0
+
+
+class _InotifyWatch:
+    """Wait for changes to one file by watching its parent directory.
+
+    Watching the directory rather than the file keeps working when the file
+    does not exist yet or is replaced by rotation.
+    """
+
+    def __init__(self, fd: int, name: bytes) -> None:
+        self._fd = fd
+        self._name = name
+        self._wake_r, self._wake_w = os.pipe()
+        self._closed = False
+
+    @classmethod
+    def open(cls, path: Path) -> "_InotifyWatch | None":
+        """Return a watch on ``path``, or None when inotify is unavailable."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            init = libc.inotify_init1
+            add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError):
+            return None
+        add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = init(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if add_watch(fd, os.fsencode(path.parent), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd, os.fsencode(path.name))
+
+    def wait(self, timeout: float) -> None:
+        """Block until the file changes, ``wake`` is called or ``timeout``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            ready, _, _ = select.select([self._fd, self._wake_r], [], [], remaining)
+            if self._wake_r in ready:
+                os.read(self._wake_r, _READ_BUFFER)
+                return
+            if self._fd in ready and self._drain():
+                return
+
+    def wake(self) -> None:
+        if self._closed:
+            return
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self._closed = True
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _drain(self) -> bool:
+        """Consume queued events; return True if any concern the file."""
+        try:
+            data = os.read(self._fd, _READ_BUFFER)
+        except BlockingIOError:
+            return False
+        relevant = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & _IN_Q_OVERFLOW or name == self._name:
+                relevant = True
+        return relevant
+
 
 class JsonEventTailer:
-    """Tail a JSONL event file and emit parsed events to a callback."""
+    """Tail a JSONL event file and emit parsed events to a callback.
+
+    On Linux the file is read only when inotify reports a change; elsewhere,
+    or when inotify is unavailable, it is polled every ``poll_interval``.
+    One handle stays open across reads and is reopened when the file is
+    replaced; a truncated file is read again from the start.
+    """
 
     def __init__(
         self,
         path: Path,
         on_event: Callable[[dict[str, Any]], None],
         poll_interval: float = 0.1,
+        on_batch: Callable[[list[dict[str, Any]]], None] | None = None,
+        use_inotify: bool = True,
     ):
+        """
+        Args:
+            path: JSONL file to follow.
+            on_event: Called once per parsed event.
+            poll_interval: Sleep between reads when polling.
+            on_batch: When set, called once per wakeup with every event read,
+                instead of ``on_event``.
+            use_inotify: Wait for inotify change notifications when possible.
+        """
         self.path = path
         self.on_event = on_event
+        self.on_batch = on_batch
         self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
+        self._watch: _InotifyWatch | None = None
+        self._fp: IO[bytes] | None = None
+        self._partial = b""
         self._pos = 0
 
     def start(self) -> None:
@@ -49,6 +179,7 @@ class JsonEventTailer:
                     f"[{time.time()}] Tailer started, path={self.path}, "
                     f"initial_pos={self._pos}\n"
                 )
+        self._watch = _InotifyWatch.open(self.path) if self.use_inotify else None
         self._thread = threading.Thread(
             target=self._run, name="lb-event-tailer", daemon=True
         )
@@ -56,6 +187,8 @@ class JsonEventTailer:
 
     def stop(self) -> None:
         self._stop.set()
+        if self._watch:
+            self._watch.wake()
         if self._thread:
             self._thread.join(timeout=2)
 
@@ -72,17 +205,6 @@ class JsonEventTailer:
         with debug_path.open("a") as f:
             f.write(f"[{time.time()}] {message}\n")
 
-    def _refresh_file_size(self, debug_path: Path | None) -> bool:
-        try:
-            size = self.path.stat().st_size
-        except FileNotFoundError:
-            time.sleep(self.poll_interval)
-            return False
-
-        if self._pos > size:
-            self._pos = 0
-        return True
-
     def _parse_json(self, line: str, debug_path: Path | None) -> dict[str, Any] | None:
         try:
             return cast(dict[str, Any], json.loads(line))
@@ -90,38 +212,102 @@ class JsonEventTailer:
             self._write_debug(debug_path, f"JSON parse error: {line[:100]!r}")
             return None
 
-    def _handle_line(self, line: str, debug_path: Path | None) -> None:
-        line = line.strip()
+    def _parse_line(self, raw: bytes, debug_path: Path | None) -> dict[str, Any] | None:
+        line = raw.decode("utf-8", errors="replace").strip()
         if not line:
-            return
+            return None
         data = self._parse_json(line, debug_path)
-        if data is None:
-            return
-        self._write_debug(debug_path, f"Read event: {data}")
-        self.on_event(data)
+        if data is not None:
+            self._write_debug(debug_path, f"Read event: {data}")
+        return data
 
-    def _consume_lines(self, fp: Any, debug_path: Path | None) -> None:
-        while True:
-            line = fp.readline()
-            if not line:
-                return
-            self._pos = fp.tell()
-            self._handle_line(line, debug_path)
+    def _open_current(self) -> IO[bytes] | None:
+        """Return the handle to read from, following truncation and rotation."""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return self._fp
+        if self._fp is not None:
+            opened = os.fstat(self._fp.fileno())
+            if (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino):
+                if current.st_size < self._fp.tell():
+                    self._fp.seek(0)
+                    self._partial = b""
+                return self._fp
+            return None
+        self._fp = self.path.open("rb")
+        if current.st_size >= self._pos:
+            self._fp.seek(self._pos)
+        return self._fp
+
+    def _read_lines(self) -> list[bytes]:
+        handle = self._open_current()
+        if handle is None:
+            # The file was replaced: finish the old one, then follow the new.
+            lines = self._read_complete_lines(self._fp)
+            if self._partial:
+                lines.append(self._partial)
+            self._close_handle()
+            self._pos = 0
+            handle = self._open_current()
+            if handle is None:
+                return lines
+            return lines + self._read_complete_lines(handle)
+        return self._read_complete_lines(handle)
+
+    def _read_complete_lines(self, handle: IO[bytes] | None) -> list[bytes]:
+        if handle is None:
+            return []
+        chunk = handle.read()
+        self._pos = handle.tell()
+        if not chunk:
+            return []
+        lines = (self._partial + chunk).split(b"\n")
+        # Keep a half-written trailing line until the writer finishes it.
+        self._partial = lines.pop()
+        return lines
+
+    def _close_handle(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+        self._fp = None
+        self._partial = b""
+
+    def _poll(self, debug_path: Path | None) -> None:
+        try:
+            lines = self._read_lines()
+        except Exception as exc:
+            self._write_debug(debug_path, f"Error reading file: {exc}")
+            return
+        events = [
+            event
+            for event in (self._parse_line(line, debug_path) for line in lines)
+            if event is not None
+        ]
+        if not events:
+            return
+        if self.on_batch is not None:
+            self.on_batch(events)
+            return
+        for event in events:
+            self.on_event(event)
 
     def _run(self) -> None:
         debug_path = self._debug_path(self.path)
-        while not self._stop.is_set():
-            if not self._refresh_file_size(debug_path):
-                continue
-
-            try:
-                with self.path.open("r", encoding="utf-8") as fp:
-                    fp.seek(self._pos)
-                    # Use readline() instead of iteration to allow fp.tell()
-                    # Python 3.13+ raises OSError when calling tell() after
-                    # using the file iterator (for line in fp)
-                    self._consume_lines(fp, debug_path)
-            except Exception as exc:
-                self._write_debug(debug_path, f"Error reading file: {exc}")
-
-            time.sleep(self.poll_interval)
+        watch = self._watch
+        if watch is None:
+            self._write_debug(debug_path, "inotify unavailable; polling")
+        try:
+            while not self._stop.is_set():
+                self._poll(debug_path)
+                if watch is None:
+                    self._stop.wait(self.poll_interval)
+                else:
+                    watch.wait(_RESYNC_SECONDS)
+            # Pick up whatever was written right before the stop request.
+            self._poll(debug_path)
+        finally:
+            self._close_handle()
+            if watch is not None:
+                watch.close()
+            self._watch = None
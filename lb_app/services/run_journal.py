@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-import json
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
-from lb_controller.api import BenchmarkConfig, workload_output_dir
+from lb_controller.api import (
+    BenchmarkConfig,
+    merge_results,
+    results_log_path,
+    workload_output_dir,
+)
 
 from lb_controller.api import RunJournal, RunStatus, TaskState
 from lb_app.services.run_config import hash_config
@@ -169,7 +173,7 @@ def build_journal_from_results(
     context: RunContext,
     host_names: list[str] | None = None,
 ) -> RunJournal:
-    """Construct a RunJournal from existing *_results.json artifacts."""
+    """Construct a RunJournal from existing results files and results logs."""
     journal = RunJournal.initialize(run_id, context.config, context.target_tests)
     output_root = context.config.output_dir / run_id
     hosts = host_names or _resolve_host_names(context)
@@ -206,21 +210,28 @@ def _apply_test_results(
 
 
 def find_results_file(output_root: Path, test_name: str) -> Path | None:
-    """Locate results JSON for a given workload."""
+    """Locate results JSON for a given workload.
+
+    A workload that was interrupted before being finalized only has its
+    JSONL results log, so the JSON path is returned when either exists.
+    """
     workload_dir = workload_output_dir(output_root, test_name)
     candidates = [
         workload_dir / f"{test_name}_results.json",
         output_root / f"{test_name}_results.json",
     ]
-    return next((path for path in candidates if path.exists()), None)
+    return next((path for path in candidates if _has_results(path)), None)
+
+
+def _has_results(results_file: Path) -> bool:
+    return results_file.exists() or results_log_path(results_file).exists()
 
 
 def load_results_entries(path: Path) -> list[dict[str, Any]]:
-    """Load result entries from disk, tolerating errors."""
+    """Load result entries and pending log entries, tolerating errors."""
     try:
-        loaded = json.loads(path.read_text())
-        return loaded or []
-    except Exception:
+        return merge_results(path, [])
+    except OSError:
         return []
 
 
@@ -352,12 +363,13 @@ def _latest_results_candidate(path: Path) -> tuple[float, Path] | None:
 
 
 def results_exist_for_run(run_root: Path) -> bool:
-    """Return True when any *_results.json exists under the run root."""
-    try:
-        next(run_root.rglob("*_results.json"))
-        return True
-    except StopIteration:
-        return False
+    """Return True when any results file or results log exists under the run."""
+    return next(_iter_results_paths(run_root), None) is not None
+
+
+def _iter_results_paths(run_root: Path) -> Iterator[Path]:
+    yield from run_root.rglob("*_results.json")
+    yield from run_root.rglob("*_results.jsonl")
 
 
 def _resolve_host_names(context: RunContext) -> list[str]:
@@ -371,7 +383,7 @@ def _resolve_host_names(context: RunContext) -> list[str]:
 
 def _latest_results_mtime(run_root: Path) -> float | None:
     latest: float | None = None
-    for path in run_root.rglob("*_results.json"):
+    for path in _iter_results_paths(run_root):
         try:
             mtime = path.stat().st_mtime
         except OSError:
@@ -62,7 +62,7 @@ class DashboardViewModel:
 
     def snapshot(self) -> DashboardSnapshot:
         rows = _build_journal_rows(self._journal, self._intensity_map)
-        status_summary = _summarize_statuses(self._journal.tasks.values())
+        status_summary = _summarize_statuses(self._journal.status_counts())
         return DashboardSnapshot(
             run_id=self._journal.run_id,
             rows=rows,
@@ -109,13 +109,8 @@ def _build_journal_rows(
         return []
     target_reps = run_viewmodels.target_repetitions(journal)
     rows: list[DashboardRow] = []
-    pairs = sorted({(task.host, task.workload) for task in journal.tasks.values()})
-    for host, workload in pairs:
-        tasks = {
-            task.repetition: task
-            for task in journal.tasks.values()
-            if task.host == host and task.workload == workload
-        }
+    for host, workload in journal.host_workload_pairs():
+        tasks = journal.get_repetitions(host, workload)
         status, _ = run_viewmodels.summarize_progress(tasks, target_reps)
         started = sum(1 for task in tasks.values() if task.status != RunStatus.PENDING)
         total = target_reps if target_reps > 0 else (len(tasks) or 1)
@@ -155,25 +150,17 @@ def _latest_duration(tasks: Iterable[TaskState]) -> str:
     return f"{latest.duration_seconds:.1f}s"
 
 
-def _summarize_statuses(tasks: Iterable[TaskState]) -> DashboardStatusSummary:
-    counts = {
-        "total": 0,
-        "completed": 0,
-        "running": 0,
-        "failed": 0,
-        "skipped": 0,
-        "pending": 0,
-    }
-    for task in tasks:
-        counts["total"] += 1
-        if task.status == RunStatus.COMPLETED:
-            counts["completed"] += 1
-        elif task.status == RunStatus.RUNNING:
-            counts["running"] += 1
-        elif task.status == RunStatus.FAILED:
-            counts["failed"] += 1
-        elif task.status == RunStatus.SKIPPED:
-            counts["skipped"] += 1
-        else:
-            counts["pending"] += 1
-    return DashboardStatusSummary(**counts)
+def _summarize_statuses(status_counts: dict[str, int]) -> DashboardStatusSummary:
+    completed = status_counts.get(RunStatus.COMPLETED, 0)
+    running = status_counts.get(RunStatus.RUNNING, 0)
+    failed = status_counts.get(RunStatus.FAILED, 0)
+    skipped = status_counts.get(RunStatus.SKIPPED, 0)
+    total = sum(status_counts.values())
+    return DashboardStatusSummary(
+        total=total,
+        completed=completed,
+        running=running,
+        failed=failed,
+        skipped=skipped,
+        pending=total - completed - running - failed - skipped,
+    )
@@ -38,14 +38,9 @@ def journal_rows(journal: RunJournal) -> tuple[list[str], list[list[str]]]:
     target = target_repetitions(journal)
     columns = ["Host", "Workload", "Run", "Last Action"]
 
-    pairs = sorted({(task.host, task.workload) for task in journal.tasks.values()})
     rows: list[list[str]] = []
-    for host, workload in pairs:
-        tasks = {
-            task.repetition: task
-            for task in journal.tasks.values()
-            if task.host == host and task.workload == workload
-        }
+    for host, workload in journal.host_workload_pairs():
+        tasks = journal.get_repetitions(host, workload)
         last_action = ""
         if tasks:
             latest = max(tasks.values(), key=lambda t: t.timestamp)
@@ -31,6 +31,9 @@ class AnsibleRunnerExecutor(RemoteExecutor):
         stream_output: bool = False,
         output_callback: Optional[Callable[[str, str], None]] = None,
         stop_token: StopToken | None = None,
+        *,
+        event_log_path: Optional[Path] = None,
+        limit_hosts: Optional[List[str]] = None,
     ):
         """
         Initialize the executor.
@@ -43,10 +46,17 @@ class AnsibleRunnerExecutor(RemoteExecutor):
                 process (useful for visibility in long-running tasks).
             output_callback: Optional callback to handle stdout stream.
                              Signature: (text: str, end: str) -> None
+            event_log_path: LB_EVENT log to append to (defaults to one inside
+                private_data_dir).
+            limit_hosts: Host limit applied when a call does not pass one.
         """
         self.private_data_dir = private_data_dir or Path(".ansible_runner")
         self.private_data_dir.mkdir(parents=True, exist_ok=True)
-        self.event_log_path = self.private_data_dir / "lb_events.jsonl"
+        self.event_log_path = event_log_path or (
+            self.private_data_dir / "lb_events.jsonl"
+        )
+        self._limit_hosts = limit_hosts
+        self._lanes: Dict[str, AnsibleRunnerExecutor] = {}
         self._runner_fn = runner_fn
         self.stream_output = stream_output
         self.stop_token = stop_token
@@ -94,6 +104,7 @@ class AnsibleRunnerExecutor(RemoteExecutor):
     ) -> ExecutionResult:
         """Execute a playbook using ansible-runner."""
         self._process_runner.clear_interrupt()
+        limit_hosts = limit_hosts or self._limit_hosts
         stop_result = self._maybe_stop(cancellable)
         if stop_result is not None:
             return stop_result
@@ -175,16 +186,43 @@ class AnsibleRunnerExecutor(RemoteExecutor):
         logger.debug("Executing Ansible command: %s", " ".join(cmd))
         logger.debug("Ansible Env: %s", envvars)
 
+    def lane(self, name: str, hosts: List[str]) -> "AnsibleRunnerExecutor":
+        """
+        Return an executor that can run playbooks next to this one.
+
+        Each lane has its own workspace (inventory, extravars, active process)
+        under ``private_data_dir/lanes/<name>``, is limited to ``hosts`` and
+        appends to the same LB_EVENT log. Interrupting this executor
+        interrupts its lanes too.
+        """
+        lane = self._lanes.get(name)
+        if lane is None:
+            lane = AnsibleRunnerExecutor(
+                private_data_dir=self.private_data_dir / "lanes" / name,
+                runner_fn=self._runner_fn,
+                stream_output=self.stream_output,
+                output_callback=self.output_callback,
+                stop_token=self.stop_token,
+                event_log_path=self.event_log_path,
+                limit_hosts=list(hosts),
+            )
+            self._lanes[name] = lane
+        return lane
+
     def interrupt(self) -> None:
         """Request interruption of the current playbook execution."""
         self._process_runner.interrupt()
         self._active_label = None
+        for lane in list(self._lanes.values()):
+            lane.interrupt()
 
     @property
     def is_running(self) -> bool:
         """Return True when a playbook is in-flight."""
         if self._process_runner.is_running():
             return True
+        if any(lane.is_running for lane in list(self._lanes.values())):
+            return True
         return self._active_label is not None
 
     @property
@@ -7,6 +7,11 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 from lb_controller.models.state import ControllerState
+from lb_controller.services.event_stream import (
+    EVENT_TRANSPORT_STREAM,
+    RemoteEventStream,
+    streamable_hosts,
+)
 from lb_controller.services.journal import RunStatus
 from lb_controller.services.journal_sync import (
     backfill_timings_from_results,
@@ -204,8 +209,15 @@ def run_workload_execution(
     phases: Dict[str, ExecutionResult],
     flags: RunFlags,
     ui_log: Callable[[str], None],
+    *,
+    run_stop_protocol: bool = True,
 ) -> None:
-    """Execute run/collect/teardown for a workload."""
+    """
+    Execute run/collect/teardown for a workload.
+
+    With ``run_stop_protocol=False`` a stop skips teardown without running the
+    stop protocol, leaving it to the caller (per-host lanes run it once).
+    """
     if not pending_reps:
         return
     try:
@@ -235,9 +247,10 @@ def run_workload_execution(
         except Exception as exc:
             ui_log(f"Collect failed for {test_name}: {exc}")
     if services.stop_token and services.stop_token.should_stop():
-        handle_stop_during_workloads(
-            services, session, state.inventory, state.extravars, flags, ui_log
-        )
+        if run_stop_protocol:
+            handle_stop_during_workloads(
+                services, session, state.inventory, state.extravars, flags, ui_log
+            )
         return
     run_teardown_playbook(
         services,
@@ -274,11 +287,20 @@ def execute_run_playbook(
         services.config.remote_execution.run_playbook,
         "run",
     )
-    res_run = services.executor.run_playbook(
-        run_playbook,
-        inventory=state.inventory,
-        extravars=loop_extravars,
-    )
+    event_stream = _open_event_stream(services, state, pending_hosts)
+    if event_stream is not None:
+        loop_extravars["lb_event_stream_hosts"] = [
+            host.name for host in event_stream.hosts
+        ]
+    try:
+        res_run = services.executor.run_playbook(
+            run_playbook,
+            inventory=state.inventory,
+            extravars=loop_extravars,
+        )
+    finally:
+        if event_stream is not None:
+            event_stream.stop()
     phases[f"run_{test_name}"] = res_run
     status = RunStatus.COMPLETED if res_run.success else RunStatus.FAILED
 
@@ -337,6 +359,28 @@ def _announce_run_phase(
         services.output_formatter.set_phase(f"Run: {test_name}")
 
 
+def _open_event_stream(
+    services: ControllerServices,
+    state: RunState,
+    pending_hosts: List[RemoteHostConfig],
+) -> RemoteEventStream | None:
+    """Start SSH event streaming for the run when the config asks for it."""
+    remote_exec = services.config.remote_execution
+    if remote_exec.event_transport != EVENT_TRANSPORT_STREAM:
+        return None
+    event_log_path = getattr(services.executor, "event_log_path", None)
+    remote_output_root = state.extravars.get("remote_output_root")
+    hosts = streamable_hosts(pending_hosts)
+    if not event_log_path or not remote_output_root or not hosts:
+        return None
+    skipped = len(pending_hosts) - len(hosts)
+    if skipped:
+        logger.info("Polling LB_EVENT stream on %d non-SSH host(s)", skipped)
+    stream = RemoteEventStream(hosts, str(remote_output_root), Path(event_log_path))
+    stream.start()
+    return stream
+
+
 def _update_reps_for_run(
     services: ControllerServices,
     state: RunState,
@@ -43,7 +43,13 @@ from lb_controller.ansible.callback_plugins.lb_events import (
     _extract_lb_event,
 )
 from lb_common.api import RunInfo
-from lb_runner.api import RunEvent, StopToken, workload_output_dir
+from lb_runner.api import (
+    RunEvent,
+    StopToken,
+    merge_results,
+    results_log_path,
+    workload_output_dir,
+)
 
 __all__ = [
     "BenchmarkConfig",
@@ -90,4 +96,6 @@ __all__ = [
     "prepare_run_dirs",
     "backfill_timings_from_results",
     "workload_output_dir",
+    "merge_results",
+    "results_log_path",
 ]
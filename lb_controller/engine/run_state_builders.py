@@ -13,7 +13,10 @@ from lb_controller.services.paths import (
     prepare_per_host_dirs,
     prepare_run_dirs,
 )
-from lb_runner.api import BenchmarkConfig
+from lb_runner.api import BenchmarkConfig, setup_hash
+
+# Root the global setup playbook archives the library sources from.
+_SOURCE_ROOT = Path(__file__).resolve().parents[2]
 
 
 def resolve_run_id(run_id: str | None, journal: RunJournal | None) -> str:
@@ -78,6 +81,12 @@ class ExtravarsBuilder:
                 continue
             uv_extras_set.update(plugin_assets.required_uv_extras)
         uv_extras = sorted(uv_extras_set)
+        apt_packages = sorted(collector_packages)
+        lb_setup_hash = ""
+        if remote_exec.setup_cache and remote_exec.run_setup:
+            lb_setup_hash = setup_hash(
+                _SOURCE_ROOT, uv_extras=uv_extras, apt_packages=apt_packages
+            )
         return {
             "run_id": run_id,
             "output_root": str(output_root),
@@ -89,8 +98,14 @@ class ExtravarsBuilder:
             "benchmark_config": self.config.model_dump(mode="json"),
             "use_container_fallback": remote_exec.use_container_fallback,
             "lb_upgrade_pip": remote_exec.upgrade_pip,
+            "lb_resident_agent": remote_exec.resident_agent,
+            "lb_batch_repetitions": remote_exec.batch_repetitions,
+            "lb_collect_mode": remote_exec.collect_mode,
+            "lb_source_upload": remote_exec.source_upload,
             "lb_uv_extras": uv_extras,
-            "collector_apt_packages": sorted(collector_packages),
+            "lb_setup_hash": lb_setup_hash,
+            "lb_keep_install": remote_exec.setup_cache,
+            "collector_apt_packages": apt_packages,
             "workload_runner_install_deps": False,
             "repetitions_total": target_reps,
             "repetition_index": 0,
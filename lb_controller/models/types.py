@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 
 from lb_controller.models.state import ControllerState
 
@@ -63,3 +63,12 @@ class RemoteExecutor(Protocol):
     ) -> ExecutionResult:
         """Execute a playbook and return the result."""
         raise NotImplementedError
+
+
+@runtime_checkable
+class LaneExecutor(RemoteExecutor, Protocol):
+    """Remote executor that can run playbooks for host subsets side by side."""
+
+    def lane(self, name: str, hosts: List[str]) -> RemoteExecutor:
+        """Return an executor limited to ``hosts`` that runs next to this one."""
+        raise NotImplementedError
@@ -135,6 +135,15 @@ class ConnectivityService:
 
 
 def _build_ssh_command(host: RemoteHostConfig, timeout: int, address: str) -> list[str]:
+    ssh_cmd = ssh_base_command(host, timeout, address)
+    ssh_cmd.append("echo ok")
+    return ssh_cmd
+
+
+def ssh_base_command(
+    host: RemoteHostConfig, timeout: int, address: str | None = None
+) -> list[str]:
+    """Return a non-interactive ssh invocation for ``host`` without a command."""
     ssh_cmd = [
         "ssh",
         "-o",
@@ -155,8 +164,7 @@ def _build_ssh_command(host: RemoteHostConfig, timeout: int, address: str) -> li
     if ssh_key:
         ssh_cmd.extend(["-i", str(ssh_key)])
     user = getattr(host, "user", None) or "root"
-    ssh_cmd.append(f"{user}@{address}")
-    ssh_cmd.append("echo ok")
+    ssh_cmd.append(f"{user}@{address or host.address}")
     return ssh_cmd
 
 
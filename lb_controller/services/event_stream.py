@@ -0,0 +1,213 @@
+"""
+Stream LB_EVENT lines from remote hosts over one long-lived SSH channel each.
+
+The runner on every host appends LB_EVENT lines to ``lb_events.stream.log``.
+Instead of polling that file from Ansible, the controller keeps a single
+``tail -F`` open per host and appends each event to the local event log that
+``JsonEventTailer`` follows, so events arrive within milliseconds and the SSH
+load does not grow with the length of the run.
+
+The remote side records how far it has forwarded in
+``lb_events.stream.offset``; a new channel (after a dropped connection or a
+controller restart) resumes from there. The file is separate from the
+``lb_events.offset`` that the Ansible polling path rewinds at the start of
+every repetition, so a reconnect still delivers the tail of earlier ones.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shlex
+import signal
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+from lb_controller.ansible.callback_plugins.lb_events import _extract_lb_event
+from lb_controller.services.connectivity_service import ssh_base_command
+from lb_runner.api import RemoteHostConfig
+
+logger = logging.getLogger(__name__)
+
+STREAM_LOG_NAME = "lb_events.stream.log"
+OFFSET_NAME = "lb_events.stream.offset"
+EVENT_TRANSPORT_STREAM = "stream"
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10
+DEFAULT_RECONNECT_DELAY_SECONDS = 2.0
+_STOP_TIMEOUT_SECONDS = 2.0
+# Connection types that ssh can reach directly.
+_SSH_CONNECTIONS = {"ssh", "paramiko", "smart"}
+
+# Follow the stream log from the recorded offset and advance the offset only
+# after a line has been handed to ssh. Without a recorded offset, start at the
+# current end so events of earlier runs are not replayed.
+_REMOTE_SCRIPT = """\
+export LC_ALL=C
+log={log}
+offset_file={offset}
+off=$(cat "$offset_file" 2>/dev/null)
+case "$off" in
+  ''|*[!0-9]*) off=$(wc -c 2>/dev/null < "$log" | tr -d ' '); off=${{off:-0}} ;;
+esac
+tail -c +$((off + 1)) -F "$log" 2>/dev/null | while IFS= read -r line; do
+  printf '%s\\n' "$line" || exit 0
+  off=$((off + ${{#line}} + 1))
+  printf '%s' "$off" 2>/dev/null > "$offset_file"
+done
+"""
+
+
+def streamable_hosts(hosts: Iterable[RemoteHostConfig]) -> List[RemoteHostConfig]:
+    """Return the hosts whose Ansible connection is plain SSH."""
+    selected: List[RemoteHostConfig] = []
+    for host in hosts:
+        connection = str(host.vars.get("ansible_connection", "ssh")).lower()
+        if connection in _SSH_CONNECTIONS:
+            selected.append(host)
+    return selected
+
+
+def build_stream_command(
+    host: RemoteHostConfig,
+    remote_dir: str,
+    timeout: int = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+) -> List[str]:
+    """Return the ssh command that follows ``remote_dir``'s stream log."""
+    script = _REMOTE_SCRIPT.format(
+        log=shlex.quote(f"{remote_dir}/{STREAM_LOG_NAME}"),
+        offset=shlex.quote(f"{remote_dir}/{OFFSET_NAME}"),
+    )
+    remote = f"sh -c {shlex.quote(script)}"
+    if host.become and host.user != "root":
+        remote = f"sudo -n {remote}"
+    command = ssh_base_command(host, timeout)
+    # Keepalives make a silently dropped link fail instead of hanging forever.
+    command[1:1] = ["-o", "ServerAliveInterval=15", "-o", "ServerAliveCountMax=3"]
+    command.append(remote)
+    return command
+
+
+class RemoteEventStream:
+    """Follow the LB_EVENT stream of several hosts, one SSH channel per host."""
+
+    def __init__(
+        self,
+        hosts: Iterable[RemoteHostConfig],
+        remote_output_root: str,
+        event_log_path: Path,
+        *,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY_SECONDS,
+        command_builder: Callable[[RemoteHostConfig, str], List[str]] | None = None,
+    ) -> None:
+        """
+        Args:
+            hosts: Hosts to follow.
+            remote_output_root: Remote results root; each host streams from
+                ``<root>/<host name>/lb_events.stream.log``.
+            event_log_path: Local JSONL event log that receives the events.
+            reconnect_delay: Pause before reopening a channel that closed.
+            command_builder: Builds the command for a host and remote dir
+                (overridable for tests).
+        """
+        self.hosts = list(hosts)
+        self.remote_output_root = remote_output_root.rstrip("/")
+        self.event_log_path = event_log_path
+        self.reconnect_delay = reconnect_delay
+        self._command_builder = command_builder or build_stream_command
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._processes: Dict[str, subprocess.Popen[bytes]] = {}
+        self._process_lock = threading.Lock()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self.event_log_path.parent.mkdir(parents=True, exist_ok=True)
+        for host in self.hosts:
+            thread = threading.Thread(
+                target=self._follow,
+                args=(host,),
+                name=f"lb-event-stream-{host.name}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._process_lock:
+            processes = list(self._processes.values())
+        for process in processes:
+            _terminate(process)
+        for thread in self._threads:
+            thread.join(timeout=_STOP_TIMEOUT_SECONDS)
+        self._threads = []
+
+    def __enter__(self) -> "RemoteEventStream":
+        self.start()
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.stop()
+
+    def _follow(self, host: RemoteHostConfig) -> None:
+        command = self._command_builder(
+            host, f"{self.remote_output_root}/{host.name}"
+        )
+        while not self._stop.is_set():
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            except OSError as exc:
+                logger.warning("Cannot stream events from %s: %s", host.name, exc)
+                return
+            with self._process_lock:
+                self._processes[host.name] = process
+            try:
+                self._forward(host, process)
+            finally:
+                _terminate(process)
+                with self._process_lock:
+                    self._processes.pop(host.name, None)
+            if not self._stop.wait(self.reconnect_delay):
+                logger.info("Event stream from %s closed; reconnecting", host.name)
+
+    def _forward(
+        self, host: RemoteHostConfig, process: subprocess.Popen[bytes]
+    ) -> None:
+        if process.stdout is None:
+            return
+        for raw in process.stdout:
+            event = _extract_lb_event(raw.decode("utf-8", errors="replace"))
+            if event is None:
+                continue
+            event.setdefault("host", host.name)
+            self._write(event)
+
+    def _write(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event) + "\n"
+        with self._write_lock:
+            with self.event_log_path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+
+
+def _terminate(process: subprocess.Popen[bytes]) -> None:
+    """Stop the channel and anything it spawned in its process group."""
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+        try:
+            process.wait(timeout=_STOP_TIMEOUT_SECONDS)
+            return
+        except subprocess.TimeoutExpired:
+            continue
@@ -1,13 +1,27 @@
 import json
 import hashlib
+import logging
+import os
+import threading
+import time
 from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any, Iterable
+from typing import IO, List, Optional, Dict, Any, Iterable, Self, Tuple
 from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 
 from lb_runner.api import BenchmarkConfig, RunEvent
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPACT_EVERY = 1000
+DEFAULT_COMPACT_INTERVAL_SECONDS = 30.0
+
+
+def journal_wal_path(journal_path: Path) -> Path:
+    """Return the write-ahead log that sits next to ``run_journal.json``."""
+    return journal_path.with_suffix(".wal")
+
 
 class RunStatus:
     PENDING = "PENDING"
@@ -41,6 +55,96 @@ class TaskState:
         return f"{self.host}::{self.workload}::{self.repetition}"
 
 
+class _TaskTable(Dict[str, TaskState]):
+    """Task dict that keeps host, workload and status indexes up to date.
+
+    Every mutation goes through ``__setitem__``/``__delitem__``, and status
+    changes go through ``RunJournal.set_status``, so lookups by host,
+    workload or status and the per-status totals never scan the whole plan.
+    Host, workload and repetition identify a task and must not change once
+    it is in the table.
+    """
+
+    def __init__(self, tasks: Any = ()) -> None:
+        super().__init__()
+        self._by_host: Dict[str, Dict[str, TaskState]] = {}
+        self._by_workload: Dict[str, Dict[str, TaskState]] = {}
+        self._by_pair: Dict[Tuple[str, str], Dict[int, TaskState]] = {}
+        self._by_status: Dict[str, Dict[str, TaskState]] = {}
+        self.update(tasks)
+
+    def __setitem__(self, key: str, task: TaskState) -> None:
+        previous = self.get(key)
+        if previous is not None:
+            self._unlink(key, previous)
+        super().__setitem__(key, task)
+        self._link(key, task)
+
+    def __delitem__(self, key: str) -> None:
+        task = self[key]
+        super().__delitem__(key)
+        self._unlink(key, task)
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        task = self[key]
+        del self[key]
+        return task
+
+    def popitem(self) -> Tuple[str, TaskState]:
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, task in dict(*args, **kwargs).items():
+            self[key] = task
+
+    def clear(self) -> None:
+        for key in list(self):
+            del self[key]
+
+    def _link(self, key: str, task: TaskState) -> None:
+        self._by_host.setdefault(task.host, {})[key] = task
+        self._by_workload.setdefault(task.workload, {})[key] = task
+        pair = (task.host, task.workload)
+        self._by_pair.setdefault(pair, {})[task.repetition] = task
+        self._by_status.setdefault(task.status, {})[key] = task
+
+    def _unlink(self, key: str, task: TaskState) -> None:
+        _discard(self._by_host, task.host, key)
+        _discard(self._by_workload, task.workload, key)
+        _discard(self._by_pair, (task.host, task.workload), task.repetition)
+        _discard(self._by_status, task.status, key)
+
+    def _move_status(self, task: TaskState, old: str, new: str) -> None:
+        key = task.key
+        if old == new or self.get(key) is not task:
+            return
+        _discard(self._by_status, old, key)
+        self._by_status.setdefault(new, {})[key] = task
+
+
+def _discard(index: Dict[Any, Dict[Any, TaskState]], bucket: Any, key: Any) -> None:
+    entries = index.get(bucket)
+    if entries is None:
+        return
+    entries.pop(key, None)
+    if not entries:
+        del index[bucket]
+
+
 @dataclass
 class RunJournal:
     """
@@ -48,9 +152,14 @@ class RunJournal:
     """
 
     run_id: str
-    tasks: Dict[str, TaskState] = field(default_factory=dict)
+    tasks: _TaskTable = field(default_factory=_TaskTable)
     metadata: Dict = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Per-host workload lanes update and save the shared journal from
+        # several threads; every task mutation and index read holds this lock.
+        self.lock = threading.RLock()
+
     @classmethod
     def initialize(
         cls, run_id: str, config: Any, test_types: List[str]
@@ -61,14 +170,52 @@ class RunJournal:
         _populate_tasks(journal, config, test_types)
         return journal
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "tasks" and not isinstance(value, _TaskTable):
+            value = _TaskTable(value)
+        super().__setattr__(name, value)
+
     def add_task(self, task: TaskState) -> None:
-        self.tasks[task.key] = task
+        with self.lock:
+            self.tasks[task.key] = task
 
     def get_tasks_by_host(self, host: str) -> List[TaskState]:
-        return sorted(
-            [t for t in self.tasks.values() if t.host == host],
-            key=lambda x: x.repetition,
-        )
+        with self.lock:
+            tasks = list(self.tasks._by_host.get(host, {}).values())
+        return sorted(tasks, key=lambda x: x.repetition)
+
+    def get_tasks_by_workload(self, workload: str) -> List[TaskState]:
+        """Return the tasks of ``workload`` across all hosts."""
+        with self.lock:
+            return list(self.tasks._by_workload.get(workload, {}).values())
+
+    def get_tasks_by_status(self, status: str) -> List[TaskState]:
+        """Return the tasks currently in ``status``."""
+        with self.lock:
+            return list(self.tasks._by_status.get(status, {}).values())
+
+    def get_repetitions(self, host: str, workload: str) -> Dict[int, TaskState]:
+        """Return ``{repetition: task}`` for one host and workload."""
+        with self.lock:
+            return dict(self.tasks._by_pair.get((host, workload), {}))
+
+    def hosts(self) -> List[str]:
+        """Return the sorted names of hosts that have tasks."""
+        with self.lock:
+            return sorted(self.tasks._by_host)
+
+    def host_workload_pairs(self) -> List[Tuple[str, str]]:
+        """Return the sorted ``(host, workload)`` pairs that have tasks."""
+        with self.lock:
+            return sorted(self.tasks._by_pair)
+
+    def status_counts(self) -> Dict[str, int]:
+        """Return the number of tasks per status without scanning them."""
+        with self.lock:
+            return {
+                status: len(tasks)
+                for status, tasks in self.tasks._by_status.items()
+            }
 
     def get_task(self, host: str, workload: str, rep: int) -> Optional[TaskState]:
         """Return a specific task or None when absent."""
@@ -86,21 +233,33 @@ class RunJournal:
         error_type: Optional[str] = None,
         error_context: Optional[Dict[str, Any]] = None,
     ) -> None:
-        task = self.get_task(host, workload, rep)
-        if not task:
-            return
-        now_ts = datetime.now().timestamp()
-        self._update_task_timings(task, status, now_ts)
-        task.status = status
-        task.timestamp = now_ts
-        if action:
-            task.current_action = action
-        if error:
-            task.error = error
-        if error_type:
-            task.error_type = error_type
-        if error_context:
-            task.error_context = error_context
+        with self.lock:
+            task = self.get_task(host, workload, rep)
+            if not task:
+                return
+            now_ts = datetime.now().timestamp()
+            self._update_task_timings(task, status, now_ts)
+            self.set_status(task, status)
+            task.timestamp = now_ts
+            if action:
+                task.current_action = action
+            if error:
+                task.error = error
+            if error_type:
+                task.error_type = error_type
+            if error_context:
+                task.error_context = error_context
+
+    def set_status(self, task: TaskState, status: str) -> None:
+        """Set ``task.status`` and keep the status index in step.
+
+        Assigning ``task.status`` directly leaves ``get_tasks_by_status`` and
+        ``status_counts`` stale for tasks that belong to this journal.
+        """
+        with self.lock:
+            old = task.status
+            task.status = status
+            self.tasks._move_status(task, old, status)
 
     def should_run(
         self,
@@ -134,19 +293,37 @@ class RunJournal:
                 task.duration_seconds = max(0.0, task.finished_at - task.started_at)
 
     def save(self, path: Path) -> None:
-        """Persist journal to disk."""
-        data = asdict(self)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        serialized = data.copy()
-        serialized["tasks"] = [asdict(task) for task in self.tasks.values()]
+        """Persist a full snapshot to disk and compact the write-ahead log.
 
-        with open(path, "w") as f:
-            json.dump(serialized, f, indent=2, default=str)
+        The snapshot replaces the previous one atomically; the WAL is then
+        truncated because every record in it is already reflected.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            serialized = {
+                "run_id": self.run_id,
+                "tasks": [asdict(task) for task in self.tasks.values()],
+                "metadata": self.metadata,
+            }
+
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(serialized, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+            # Still under the lock that LogSink holds while appending, so every
+            # truncated record is already in the snapshot.
+            wal_path = journal_wal_path(path)
+            if wal_path.exists():
+                # Truncate rather than unlink so open append handles stay valid.
+                with open(wal_path, "w"):
+                    pass
 
     @classmethod
     def load(cls, path: Path, config: Any | None = None) -> "RunJournal":
-        """Load journal from disk, optionally validating against a config."""
+        """Load the snapshot, replay the write-ahead log and validate config."""
         with open(path, "r") as f:
             data = json.load(f)
 
@@ -157,8 +334,34 @@ class RunJournal:
         journal.tasks = _load_tasks(tasks_data)
         if not getattr(journal, "metadata", None):
             journal.metadata = metadata
+        journal.replay_wal(journal_wal_path(path))
         return journal
 
+    def replay_wal(self, wal_path: Path) -> int:
+        """Apply task records from ``wal_path``; return how many were applied.
+
+        Records carry the full task state, so replay is idempotent. A record
+        older than the task it targets (left behind by a crash between a
+        snapshot and the WAL truncation) is ignored, as is a torn last line.
+        """
+        if not wal_path.exists():
+            return 0
+        applied = 0
+        with open(wal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    task = TaskState(**record)
+                except (TypeError, ValueError):
+                    logger.warning("Skipping unreadable journal WAL record")
+                    continue
+                current = self.tasks.get(task.key)
+                if current is not None and current.timestamp > task.timestamp:
+                    continue
+                self.add_task(task)
+                applied += 1
+        return applied
+
     def rehydrate_config(self) -> BenchmarkConfig | None:
         """
         Return a BenchmarkConfig reconstructed from the stored config_dump.
@@ -172,15 +375,67 @@ class RunJournal:
             return None
 
 
+class JournalWAL:
+    """Append-only log of task transitions for a run journal.
+
+    Each transition costs one compact JSON line instead of a full journal
+    rewrite. ``RunJournal.save`` writes a snapshot and truncates the log;
+    ``RunJournal.load`` replays it on top of the snapshot.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._handle: IO[str] | None = None
+        self.records = 0
+
+    def append(self, task: TaskState) -> None:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.path.open("a", encoding="utf-8")
+        line = json.dumps(asdict(task), separators=(",", ":"), default=str)
+        self._handle.write(line + "\n")
+        self._handle.flush()
+        self.records += 1
+
+    def reset(self) -> None:
+        """Note that a snapshot has absorbed every record written so far."""
+        self.records = 0
+
+    def close(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except Exception:
+                pass
+            self._handle = None
+
+
 class LogSink:
-    """Persist events and mirror them to the run journal and optional log file."""
+    """Persist events and mirror them to the run journal and optional log file.
+
+    Task transitions go to the journal's write-ahead log; a full snapshot is
+    written every ``compact_every`` records or ``compact_interval_seconds``,
+    whichever comes first, and when the sink is closed.
+    """
 
     def __init__(
-        self, journal: RunJournal, journal_path: Path, log_file: Path | None = None
+        self,
+        journal: RunJournal,
+        journal_path: Path,
+        log_file: Path | None = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        compact_interval_seconds: float = DEFAULT_COMPACT_INTERVAL_SECONDS,
     ):
         self.journal = journal
         self.journal_path = journal_path
         self.log_file = log_file
+        self.compact_every = compact_every
+        self.compact_interval_seconds = compact_interval_seconds
+        self._wal = JournalWAL(journal_wal_path(journal_path))
+        # Share the journal's lock: RunJournal.save snapshots and truncates the
+        # WAL under it, so no record can land between the two.
+        self._lock = journal.lock
+        self._last_compaction = time.monotonic()
         self._log_handle = None
         if log_file:
             log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -195,7 +450,17 @@ class LogSink:
         for ev in events:
             self.emit(ev)
 
+    def compact(self) -> None:
+        """Write a journal snapshot and start a fresh write-ahead log."""
+        with self._lock:
+            self._compact_locked()
+
     def close(self) -> None:
+        try:
+            self.compact()
+        except Exception as exc:
+            logger.warning("Failed to compact run journal: %s", exc)
+        self._wal.close()
         if self._log_handle:
             try:
                 self._log_handle.close()
@@ -215,17 +480,40 @@ class LogSink:
             "unreachable": RunStatus.FAILED,
         }
         mapped = status_map.get(event.status.lower(), RunStatus.RUNNING)
-        self.journal.update_task(
-            event.host,
-            event.workload,
-            event.repetition,
-            mapped,
-            action="run_progress",
-            error=event.message if mapped == RunStatus.FAILED else None,
-            error_type=event.error_type if mapped == RunStatus.FAILED else None,
-            error_context=event.error_context if mapped == RunStatus.FAILED else None,
-        )
+        with self._lock:
+            self.journal.update_task(
+                event.host,
+                event.workload,
+                event.repetition,
+                mapped,
+                action="run_progress",
+                error=event.message if mapped == RunStatus.FAILED else None,
+                error_type=event.error_type if mapped == RunStatus.FAILED else None,
+                error_context=(
+                    event.error_context if mapped == RunStatus.FAILED else None
+                ),
+            )
+            task = self.journal.get_task(event.host, event.workload, event.repetition)
+            if task is None:
+                return
+            if not self.journal_path.exists():
+                # The WAL needs a snapshot to replay onto.
+                self._compact_locked()
+                return
+            self._wal.append(task)
+            if self._compaction_due():
+                self._compact_locked()
+
+    def _compaction_due(self) -> bool:
+        if self._wal.records >= self.compact_every:
+            return True
+        elapsed = time.monotonic() - self._last_compaction
+        return elapsed >= self.compact_interval_seconds
+
+    def _compact_locked(self) -> None:
         self.journal.save(self.journal_path)
+        self._wal.reset()
+        self._last_compaction = time.monotonic()
 
     def _write_log(self, event: RunEvent) -> None:
         """Append a single-line representation to the optional log file."""
@@ -331,8 +619,8 @@ def _validate_config(metadata: Dict[str, Any], config: Any | None) -> None:
             )
 
 
-def _load_tasks(tasks_data: Iterable[Dict[str, Any]]) -> Dict[str, TaskState]:
-    tasks: Dict[str, TaskState] = {}
+def _load_tasks(tasks_data: Iterable[Dict[str, Any]]) -> _TaskTable:
+    tasks = _TaskTable()
     for task_data in tasks_data:
         task = TaskState(**task_data)
         tasks[task.key] = task
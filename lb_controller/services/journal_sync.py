@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from lb_runner.api import RemoteHostConfig
+from lb_runner.api import RemoteHostConfig, merge_results, results_log_path
 
 from lb_controller.services.journal import RunJournal, RunStatus, TaskState
 
@@ -104,23 +103,33 @@ def _collect_results(host_dir: Path | None, workload: str) -> list[dict[str, Any
     """Return parsed results entries for a host/workload."""
     if not host_dir:
         return []
-    candidates = sorted(
-        host_dir.rglob(f"{workload}_results.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    # Repetitions land in the JSONL results log first; the JSON array only
+    # exists once the workload is finalized, so look for either.
+    results_files = {
+        path.with_suffix(".json")
+        for pattern in (f"{workload}_results.json", f"{workload}_results.jsonl")
+        for path in host_dir.rglob(pattern)
+    }
+    candidates = sorted(results_files, key=_results_mtime, reverse=True)
     entries: list[dict[str, Any]] = []
     for results_file in candidates:
         try:
-            loaded = json.loads(results_file.read_text()) or []
-        except Exception as exc:
-            logger.debug("Failed to parse results at %s: %s", results_file, exc)
-            continue
-        if isinstance(loaded, list):
-            entries.extend(item for item in loaded if isinstance(item, dict))
+            entries.extend(merge_results(results_file, []))
+        except OSError as exc:
+            logger.debug("Failed to read results at %s: %s", results_file, exc)
     return entries
 
 
+def _results_mtime(results_file: Path) -> float:
+    """Return the newest mtime of a results file and its pending log."""
+    mtimes = [
+        path.stat().st_mtime
+        for path in (results_file, results_log_path(results_file))
+        if path.exists()
+    ]
+    return max(mtimes, default=0.0)
+
+
 def _apply_result_entry(
     journal: RunJournal, host: str, workload: str, entry: dict[str, Any]
 ) -> bool:
@@ -128,12 +137,13 @@ def _apply_result_entry(
     rep = entry.get("repetition")
     if rep is None:
         return False
-    task = journal.get_task(host, workload, rep)
-    if not task:
-        return False
+    with journal.lock:
+        task = journal.get_task(host, workload, rep)
+        if not task:
+            return False
 
-    _update_task_timings(task, entry)
-    _update_task_status(task, entry)
+        _update_task_timings(task, entry)
+        _update_task_status(journal, task, entry)
     return True
 
 
@@ -151,27 +161,29 @@ def _update_task_timings(task: TaskState, entry: dict[str, Any]) -> None:
         task.duration_seconds = max(0.0, task.finished_at - task.started_at)
 
 
-def _update_task_status(task: TaskState, entry: dict[str, Any]) -> None:
+def _update_task_status(
+    journal: RunJournal, task: TaskState, entry: dict[str, Any]
+) -> None:
     gen_result = entry.get("generator_result") or {}
     gen_error = gen_result.get("error")
     gen_rc = gen_result.get("returncode")
     entry_error_type = entry.get("error_type")
     entry_error_context = entry.get("error_context")
     if gen_error or (gen_rc not in (None, 0)):
-        task.status = RunStatus.FAILED
+        journal.set_status(task, RunStatus.FAILED)
         error_message = _format_error_message(gen_error, gen_rc, gen_result)
         task.current_action = task.error = error_message
         task.error_type = entry_error_type
         task.error_context = entry_error_context
         return
     if entry_error_type:
-        task.status = RunStatus.FAILED
+        journal.set_status(task, RunStatus.FAILED)
         task.current_action = task.error = entry.get("error") or "error recorded"
         task.error_type = entry_error_type
         task.error_context = entry_error_context
         return
     if task.status not in (RunStatus.FAILED, RunStatus.SKIPPED):
-        task.status = RunStatus.COMPLETED
+        journal.set_status(task, RunStatus.COMPLETED)
 
 
 def _format_error_message(
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from itertools import groupby
+from typing import Callable, Dict, List, Sequence, Tuple, cast
 
 from lb_controller.adapters.playbooks import (
     run_workload_execution,
@@ -11,14 +15,18 @@ from lb_controller.adapters.playbooks import (
 from lb_controller.engine.lifecycle import RunPhase
 from lb_controller.engine.run_state import RunFlags, RunState
 from lb_controller.models.pending import pending_hosts_for, pending_repetitions
-from lb_controller.models.types import ExecutionResult
+from lb_controller.models.types import ExecutionResult, InventorySpec, LaneExecutor
 from lb_plugins.api import PluginAssetConfig
-from lb_runner.api import BenchmarkConfig
+from lb_runner.api import BenchmarkConfig, RemoteHostConfig
 from lb_controller.services.services import ControllerServices
 from lb_controller.engine.session import RunSession
 from lb_controller.engine.stop_logic import handle_stop_during_workloads
 from lb_controller.services.ui_notifier import UINotifier
 
+logger = logging.getLogger(__name__)
+
+HOST_STRATEGY_PER_HOST = "per_host"
+
 
 class WorkloadRunner:
     """Run workload setup and execution across configured hosts."""
@@ -42,6 +50,10 @@ class WorkloadRunner:
         ui_log: Callable[[str], None],
     ) -> RunFlags:
         services.lifecycle.start_phase(RunPhase.WORKLOADS)
+        if self._per_host_enabled(services):
+            return self._run_per_host(
+                services, session, state, phases, flags, resume_requested, ui_log
+            )
         for test_name in state.test_types:
             if self._stop_requested(services, session):
                 flags = handle_stop_during_workloads(
@@ -61,6 +73,173 @@ class WorkloadRunner:
                 break
         return flags
 
+    def _per_host_enabled(self, services: ControllerServices) -> bool:
+        remote_exec = self._config.remote_execution
+        if remote_exec.host_strategy != HOST_STRATEGY_PER_HOST:
+            return False
+        if len(self._config.remote_hosts) < 2:
+            return False
+        if not isinstance(services.executor, LaneExecutor):
+            logger.info("Executor cannot run host lanes; running hosts in lockstep")
+            return False
+        return True
+
+    def _run_per_host(
+        self,
+        services: ControllerServices,
+        session: RunSession,
+        state: RunState,
+        phases: Dict[str, ExecutionResult],
+        flags: RunFlags,
+        resume_requested: bool,
+        ui_log: Callable[[str], None],
+    ) -> RunFlags:
+        """
+        Let every host work through its own workload queue.
+
+        Consecutive workloads without a host barrier run in one lane per host,
+        at most ``max_parallel_hosts`` lanes at a time, so a slow host no
+        longer holds the others back between workloads. Workloads whose
+        plugin needs every host at once run in lockstep once all lanes have
+        caught up.
+        """
+        for barrier, test_names in self._segments(state.test_types):
+            if self._stop_requested(services, session):
+                flags = handle_stop_during_workloads(
+                    services, session, state.inventory, state.extravars, flags, ui_log
+                )
+                break
+            if barrier:
+                completed = all(
+                    self._process_single_workload(
+                        services,
+                        session,
+                        test_name,
+                        state,
+                        phases,
+                        flags,
+                        resume_requested,
+                        ui_log,
+                    )
+                    for test_name in test_names
+                )
+            else:
+                completed = self._run_host_lanes(
+                    services,
+                    session,
+                    test_names,
+                    state,
+                    phases,
+                    flags,
+                    resume_requested,
+                    ui_log,
+                )
+            if not completed:
+                break
+        return flags
+
+    def _segments(self, test_names: Sequence[str]) -> List[Tuple[bool, List[str]]]:
+        """Group consecutive workloads by whether they need a host barrier."""
+        return [
+            (barrier, list(names))
+            for barrier, names in groupby(test_names, key=self._requires_barrier)
+        ]
+
+    def _requires_barrier(self, test_name: str) -> bool:
+        workload_cfg = self._config.workloads.get(test_name)
+        if not workload_cfg:
+            return False
+        assets = self._config.plugin_assets.get(workload_cfg.plugin)
+        return bool(assets and assets.host_barrier)
+
+    def _run_host_lanes(
+        self,
+        services: ControllerServices,
+        session: RunSession,
+        test_names: List[str],
+        state: RunState,
+        phases: Dict[str, ExecutionResult],
+        flags: RunFlags,
+        resume_requested: bool,
+        ui_log: Callable[[str], None],
+    ) -> bool:
+        hosts = list(self._config.remote_hosts)
+        workers = min(self._config.remote_execution.max_parallel_hosts, len(hosts))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="lb-host-lane"
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self._run_host_lane,
+                    services,
+                    session,
+                    host,
+                    test_names,
+                    state,
+                    flags,
+                    resume_requested,
+                    ui_log,
+                )
+                for host in hosts
+            ]
+            for host, future in zip(hosts, futures):
+                for key, result in future.result().items():
+                    phases[f"{key}[{host.name}]"] = result
+        if self._stop_requested(services, session):
+            handle_stop_during_workloads(
+                services, session, state.inventory, state.extravars, flags, ui_log
+            )
+            return False
+        return True
+
+    def _run_host_lane(
+        self,
+        services: ControllerServices,
+        session: RunSession,
+        host: RemoteHostConfig,
+        test_names: List[str],
+        state: RunState,
+        flags: RunFlags,
+        resume_requested: bool,
+        ui_log: Callable[[str], None],
+    ) -> Dict[str, ExecutionResult]:
+        """Run ``test_names`` on one host; return the phases of this lane."""
+        # _per_host_enabled only lets lane-capable executors get here.
+        executor = cast(LaneExecutor, services.executor)
+        lane_services = ControllerServices(
+            services.config,
+            executor.lane(host.name, [host.name]),
+            output_formatter=services.output_formatter,
+            stop_token=services.stop_token,
+            lifecycle=services.lifecycle,
+            journal_refresh=services.journal_refresh,
+            use_progress_stream=services.use_progress_stream,
+        )
+        lane_state = replace(
+            state,
+            inventory=InventorySpec(
+                hosts=[host], inventory_path=state.inventory.inventory_path
+            ),
+        )
+        lane_phases: Dict[str, ExecutionResult] = {}
+        for test_name in test_names:
+            if self._stop_requested(services, session):
+                break
+            if not self._process_single_workload(
+                lane_services,
+                session,
+                test_name,
+                lane_state,
+                lane_phases,
+                flags,
+                resume_requested,
+                ui_log,
+                hosts=[host],
+                defer_stop=True,
+            ):
+                break
+        return lane_phases
+
     def _process_single_workload(
         self,
         services: ControllerServices,
@@ -71,7 +250,17 @@ class WorkloadRunner:
         flags: RunFlags,
         resume_requested: bool,
         ui_log: Callable[[str], None],
+        *,
+        hosts: Sequence[RemoteHostConfig] | None = None,
+        defer_stop: bool = False,
     ) -> bool:
+        """
+        Set up, run, collect and tear down one workload.
+
+        ``hosts`` narrows the workload to a subset of the configured hosts.
+        With ``defer_stop`` a stop request only ends the workload; the caller
+        runs the stop protocol.
+        """
         workload_cfg = self._config.workloads.get(test_name)
         if not workload_cfg:
             ui_log(f"Skipping unknown workload: {test_name}")
@@ -81,7 +270,7 @@ class WorkloadRunner:
             state.active_journal,
             state.target_reps,
             test_name,
-            self._config.remote_hosts,
+            self._config.remote_hosts if hosts is None else hosts,
             allow_skipped=resume_requested,
         )
         if not pending_hosts:
@@ -91,9 +280,7 @@ class WorkloadRunner:
         plugin_assets = self._get_plugin_assets(workload_cfg.plugin, test_name, ui_log)
 
         if services.stop_token and services.stop_token.should_stop():
-            handle_stop_during_workloads(
-                services, session, state.inventory, state.extravars, flags, ui_log
-            )
+            self._handle_stop(services, session, state, flags, ui_log, defer_stop)
             return False
 
         pending_reps = pending_repetitions(
@@ -120,9 +307,7 @@ class WorkloadRunner:
         if not pending_reps:
             return True
         if self._stop_requested(services, session):
-            handle_stop_during_workloads(
-                services, session, state.inventory, state.extravars, flags, ui_log
-            )
+            self._handle_stop(services, session, state, flags, ui_log, defer_stop)
             return False
 
         run_workload_execution(
@@ -137,12 +322,11 @@ class WorkloadRunner:
             phases,
             flags,
             ui_log,
+            run_stop_protocol=not defer_stop,
         )
 
         if self._stop_requested(services, session):
-            handle_stop_during_workloads(
-                services, session, state.inventory, state.extravars, flags, ui_log
-            )
+            self._handle_stop(services, session, state, flags, ui_log, defer_stop)
             return False
         return True
 
@@ -160,6 +344,22 @@ class WorkloadRunner:
             )
         return assets
 
+    @staticmethod
+    def _handle_stop(
+        services: ControllerServices,
+        session: RunSession,
+        state: RunState,
+        flags: RunFlags,
+        ui_log: Callable[[str], None],
+        defer_stop: bool,
+    ) -> None:
+        if defer_stop:
+            flags.all_tests_success = False
+            return
+        handle_stop_during_workloads(
+            services, session, state.inventory, state.extravars, flags, ui_log
+        )
+
     def _stop_requested(
         self, services: ControllerServices, session: RunSession
     ) -> bool:
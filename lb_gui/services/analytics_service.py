@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Sequence, cast, get_args
+from typing import TYPE_CHECKING, Iterator, Sequence, cast, get_args
 
 from lb_app.api import AnalyticsService, AnalyticsRequest, AnalyticsKind, RunInfo
 
@@ -28,6 +28,7 @@ class AnalyticsServiceWrapper:
         kind: AnalyticsKind = "aggregate",
         workloads: Sequence[str] | None = None,
         hosts: Sequence[str] | None = None,
+        workers: int = 1,
     ) -> list[Path]:
         """Run analytics and return generated artifact paths.
 
@@ -36,6 +37,7 @@ class AnalyticsServiceWrapper:
             kind: Type of analytics to run (default: "aggregate")
             workloads: Optional filter for specific workloads
             hosts: Optional filter for specific hosts
+            workers: Worker processes to fan (host, workload) units out to
 
         Returns:
             List of paths to generated artifacts
@@ -45,9 +47,39 @@ class AnalyticsServiceWrapper:
             kind=kind,
             workloads=workloads,
             hosts=hosts,
+            workers=workers,
         )
         return self._service.run(request)
 
+    def iter_analytics(
+        self,
+        run_info: RunInfo,
+        kind: AnalyticsKind = "aggregate",
+        workloads: Sequence[str] | None = None,
+        hosts: Sequence[str] | None = None,
+        workers: int = 1,
+    ) -> Iterator[Path]:
+        """Run analytics, yielding each artifact path as soon as it is written.
+
+        Args:
+            run_info: RunInfo object for the run to analyze
+            kind: Type of analytics to run (default: "aggregate")
+            workloads: Optional filter for specific workloads
+            hosts: Optional filter for specific hosts
+            workers: Worker processes to fan (host, workload) units out to
+
+        Returns:
+            Iterator over generated artifact paths in completion order
+        """
+        request = AnalyticsRequest(
+            run=run_info,
+            kind=kind,
+            workloads=workloads,
+            hosts=hosts,
+            workers=workers,
+        )
+        return self._service.iter_run(request)
+
     def get_available_kinds(self) -> list[AnalyticsKind]:
         """Get list of available analytics kinds."""
         return [cast(AnalyticsKind, kind) for kind in get_args(AnalyticsKind)]
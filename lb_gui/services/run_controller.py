@@ -28,7 +28,7 @@ class RunControllerService:
 
     def build_journal(self, run_id: str | None) -> RunJournal:
         """Create a minimal run journal for dashboard initialization."""
-        return RunJournal(run_id=run_id or "gui-run", tasks={})
+        return RunJournal(run_id=run_id or "gui-run")
 
     def create_worker(self, request: RunRequest) -> RunWorker:
         """Create a RunWorker for executing the run."""
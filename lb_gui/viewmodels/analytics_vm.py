@@ -33,6 +33,7 @@ class AnalyticsViewModel(QObject):
     runs_changed = Signal(list)  # list of RunInfo
     run_selected = Signal(object)  # RunInfo or None
     analytics_started = Signal()
+    analytics_progress = Signal(object)  # each artifact path as it is written
     analytics_completed = Signal(list)  # list of generated artifact paths
     analytics_failed = Signal(str)  # error message
     error_occurred = Signal(str)
@@ -231,7 +232,9 @@ class AnalyticsViewModel(QObject):
             self._selected_kind,
             workloads=self._selected_workloads or None,
             hosts=self._selected_hosts or None,
+            workers=os.cpu_count() or 1,
         )
+        self._worker.signals.progress.connect(self.analytics_progress.emit)
         self._worker.signals.finished.connect(self._on_worker_finished)
         self._worker.signals.failed.connect(self._on_worker_failed)
         self._worker.start()
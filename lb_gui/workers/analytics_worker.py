@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 class AnalyticsWorkerSignals(QObject):
     """Signals emitted by AnalyticsWorker."""
 
+    progress = Signal(object)  # Path of each artifact as it is written
     finished = Signal(list)  # list[Path]
     failed = Signal(str)
 
@@ -29,6 +30,7 @@ class AnalyticsWorker(QObject):
         kind: "AnalyticsKind",
         workloads: Sequence[str] | None = None,
         hosts: Sequence[str] | None = None,
+        workers: int = 1,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
@@ -37,6 +39,7 @@ class AnalyticsWorker(QObject):
         self._kind = kind
         self._workloads = workloads
         self._hosts = hosts
+        self._workers = workers
         self._thread: QThread | None = None
 
         self.signals = AnalyticsWorkerSignals()
@@ -58,13 +61,17 @@ class AnalyticsWorker(QObject):
     def _run(self) -> None:
         """Execute analytics in the worker thread."""
         try:
-            artifacts = self._analytics.run_analytics(
+            artifacts = []
+            for artifact in self._analytics.iter_analytics(
                 run_info=self._run_info,
                 kind=self._kind,
                 workloads=self._workloads,
                 hosts=self._hosts,
-            )
-            self.signals.finished.emit(list(artifacts))
+                workers=self._workers,
+            ):
+                artifacts.append(artifact)
+                self.signals.progress.emit(artifact)
+            self.signals.finished.emit(artifacts)
         except Exception as exc:
             self.signals.failed.emit(str(exc))
         finally:
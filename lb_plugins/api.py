@@ -189,6 +189,7 @@ def merge_plugin_assets(
         merged = user_asset.model_copy(deep=True)
         if not merged.required_uv_extras and default_asset.required_uv_extras:
             merged.required_uv_extras = list(default_asset.required_uv_extras)
+        merged.host_barrier = merged.host_barrier or default_asset.host_barrier
         merged_assets[name] = merged
 
     config.plugin_assets = merged_assets
@@ -274,6 +275,9 @@ def _build_plugin_assets(plugin: Any) -> PluginAssetConfig:
             plugin, "get_required_uv_extras", default=[]
         )
         or [],
+        host_barrier=bool(
+            _call_plugin_method(plugin, "requires_host_barrier", default=False)
+        ),
     )
 
 
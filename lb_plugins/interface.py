@@ -194,6 +194,14 @@ class WorkloadPlugin(ABC):
         """Return Grafana datasources/dashboards provided by this plugin."""
         return None
 
+    def requires_host_barrier(self) -> bool:
+        """
+        Return True when every host must run this workload together.
+        Needed when hosts share state during the run (e.g. one k6 generator
+        driving all targets); the per-host strategy then waits for all hosts.
+        """
+        return False
+
     # Optional: allow plugins to normalize their own results into CSV before collection
     def export_results_to_csv(
         self,
@@ -258,6 +266,7 @@ class SimpleWorkloadPlugin(WorkloadPlugin):
     COLLECT_PRE_PLAYBOOK: Optional[Path] = None
     COLLECT_POST_PLAYBOOK: Optional[Path] = None
     GRAFANA_ASSETS: GrafanaAssets | None = None
+    HOST_BARRIER: bool = False
 
     @property
     def name(self) -> str:
@@ -315,6 +324,9 @@ class SimpleWorkloadPlugin(WorkloadPlugin):
             return self.COLLECT_POST_PLAYBOOK
         return None
 
+    def requires_host_barrier(self) -> bool:
+        return self.HOST_BARRIER
+
 
 def _build_result_row(
     entry: Dict[str, Any],
@@ -38,3 +38,7 @@ class PluginAssetConfig(BaseModel):
     required_uv_extras: list[str] = Field(
         default_factory=list, description="UV extras required by plugin runtime"
     )
+    host_barrier: bool = Field(
+        default=False,
+        description="All hosts run this workload together under per-host execution",
+    )
@@ -1,6 +1,8 @@
 """Shared helpers for FaaS-style plugin implementations."""
 
 from .config_enumerator import (
+    ConfigurationSpace,
+    DominanceIndex,
     config_id,
     config_key,
     count_configurations,
@@ -11,6 +13,8 @@ from .config_enumerator import (
 from .plan_builder import FaasPlanBuilder, generate_rates_list, parse_duration_seconds
 
 __all__ = [
+    "ConfigurationSpace",
+    "DominanceIndex",
     "FaasPlanBuilder",
     "config_id",
     "config_key",
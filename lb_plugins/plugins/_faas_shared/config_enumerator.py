@@ -6,6 +6,8 @@ import hashlib
 from itertools import combinations, product
 from typing import Iterable, Iterator, Sequence
 
+import numpy as np
+
 
 def generate_function_combinations(
     functions: Sequence[str],
@@ -56,6 +58,50 @@ def generate_configurations(
     )
 
 
+class ConfigurationSpace:
+    """Re-iterable configuration plan that is enumerated lazily.
+
+    Iterating yields the same configurations, in the same order, as
+    ``generate_configurations`` without holding them in memory; ``len``
+    counts them without enumerating.
+    """
+
+    def __init__(
+        self,
+        functions: Sequence[str],
+        rates: Sequence[int],
+        min_functions: int,
+        max_functions: int,
+        rates_by_function: dict[str, list[int]] | None = None,
+    ) -> None:
+        self._functions = list(functions)
+        self._rates = list(rates)
+        self._min_functions = min_functions
+        self._max_functions = max_functions
+        self._rates_by_function = rates_by_function
+        self._count: int | None = None
+
+    def __iter__(self) -> Iterator[list[tuple[str, int]]]:
+        return iter_configurations(
+            self._functions,
+            self._rates,
+            self._min_functions,
+            self._max_functions,
+            rates_by_function=self._rates_by_function,
+        )
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = count_configurations(
+                self._functions,
+                self._rates,
+                self._min_functions,
+                self._max_functions,
+                rates_by_function=self._rates_by_function,
+            )
+        return self._count
+
+
 def count_configurations(
     functions: Sequence[str],
     rates: Sequence[int],
@@ -132,3 +178,57 @@ def dominates(
         if candidate_rate > base_rate:
             better = True
     return better
+
+
+class DominanceIndex:
+    """Overloaded configs grouped by function names for fast dominance checks.
+
+    Each function combination keeps only its minimal overloaded rate vectors
+    (the Pareto frontier) as one NumPy array, so checking a candidate is a
+    single vectorized comparison instead of a scan over every overloaded
+    config. ``dominates(key)`` agrees with
+    ``any(dominates(over, candidate) for over in overloaded)``.
+    """
+
+    def __init__(self) -> None:
+        self._frontiers: dict[tuple[str, ...], np.ndarray] = {}
+        self._source: list[list[tuple[str, int]]] | None = None
+        self._synced = 0
+
+    def add(self, config: Iterable[tuple[str, int]]) -> None:
+        """Record an overloaded config."""
+        names, rates = config_key(config)
+        vector = np.asarray(rates, dtype=np.int64)
+        frontier = self._frontiers.get(names)
+        if frontier is None:
+            self._frontiers[names] = vector[np.newaxis, :]
+            return
+        if (frontier <= vector).all(axis=1).any():
+            return
+        keep = ~(frontier >= vector).all(axis=1)
+        self._frontiers[names] = np.vstack([frontier[keep], vector])
+
+    def dominates(self, key: tuple[tuple[str, ...], tuple[int, ...]]) -> bool:
+        """Return whether a config key strictly dominates any overloaded one."""
+        names, rates = key
+        frontier = self._frontiers.get(names)
+        if frontier is None:
+            return False
+        candidate = np.asarray(rates, dtype=np.int64)
+        at_least = (candidate >= frontier).all(axis=1)
+        above = (candidate > frontier).any(axis=1)
+        return bool((at_least & above).any())
+
+    def sync(self, overloaded: list[list[tuple[str, int]]]) -> None:
+        """Ingest configs appended to ``overloaded`` since the last sync.
+
+        The list is append-only during a run; a different or shorter list
+        rebuilds the index from scratch.
+        """
+        if overloaded is not self._source or len(overloaded) < self._synced:
+            self._frontiers.clear()
+            self._source = overloaded
+            self._synced = 0
+        for config in overloaded[self._synced :]:
+            self.add(config)
+        self._synced = len(overloaded)
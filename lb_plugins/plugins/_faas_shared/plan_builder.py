@@ -7,6 +7,8 @@ import re
 from typing import Protocol, Sequence
 
 from .config_enumerator import (
+    ConfigurationSpace,
+    DominanceIndex,
     config_id,
     config_key,
     count_configurations,
@@ -124,6 +126,21 @@ class FaasPlanBuilder:
             rates_by_function=rates_by_function,
         )
 
+    def build_configuration_space(
+        self,
+        function_names: list[str],
+        rates: list[int],
+        rates_by_function: dict[str, list[int]] | None = None,
+    ) -> ConfigurationSpace:
+        """Return the configuration plan without materializing it."""
+        return ConfigurationSpace(
+            function_names,
+            rates,
+            self.config.combinations.min_functions,
+            self.config.combinations.max_functions,
+            rates_by_function=rates_by_function,
+        )
+
     def estimate_runtime_seconds(self) -> int:
         duration = parse_duration_seconds(self.config.duration)
         rates = self.build_rates()
@@ -142,6 +159,8 @@ class FaasPlanBuilder:
 
 
 __all__ = [
+    "ConfigurationSpace",
+    "DominanceIndex",
     "FaasPlanBuilder",
     "config_id",
     "config_key",
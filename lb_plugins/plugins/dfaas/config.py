@@ -320,6 +320,22 @@ class DfaasConfig(BasePluginConfig):
     prometheus_url: str = Field(
         default="http://127.0.0.1:30411", description="Prometheus base URL"
     )
+    prometheus_query_workers: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            "Prometheus queries issued concurrently when collecting metrics "
+            "(1 runs them one after another)"
+        ),
+    )
+    prometheus_query_deadline_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description=(
+            "Seconds after the start of a concurrent metrics collection after "
+            "which a query still without data fails"
+        ),
+    )
     functions: list[DfaasFunctionConfig] = Field(
         default_factory=lambda: [
             DfaasFunctionConfig(
@@ -25,6 +25,8 @@ class DfaasPlugin(SimpleWorkloadPlugin):
     COLLECT_PRE_PLAYBOOK = Path(__file__).parent / "ansible" / "collect" / "pre.yml"
     COLLECT_POST_PLAYBOOK = Path(__file__).parent / "ansible" / "collect" / "post.yml"
     GRAFANA_ASSETS = GRAFANA_ASSETS
+    # One k6 generator drives the functions of every host.
+    HOST_BARRIER = True
 
     def create_generator(self, config: BasePluginConfig) -> Any:
         generator_cls = import_module(
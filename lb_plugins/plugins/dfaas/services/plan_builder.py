@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from lb_plugins.plugins._faas_shared.plan_builder import (
+    DominanceIndex,
     FaasPlanBuilder,
     _PlanConfigLike,
     config_id,
@@ -28,6 +29,7 @@ class DfaasPlanBuilder(FaasPlanBuilder):
 
 __all__ = [
     "DfaasPlanBuilder",
+    "DominanceIndex",
     "config_id",
     "config_key",
     "dominates",
@@ -16,7 +16,12 @@ from .annotation_service import DfaasAnnotationService
 from .cooldown import CooldownManager, CooldownTimeoutError, MetricsSnapshot
 from .log_manager import DfaasLogManager
 from .metrics_collector import MetricsCollector
-from .plan_builder import DfaasPlanBuilder, config_id, config_key, dominates
+from .plan_builder import (
+    DfaasPlanBuilder,
+    DominanceIndex,
+    config_id,
+    config_key,
+)
 from .result_builder import DfaasResultBuilder
 from .k6_runner import K6Runner
 
@@ -43,6 +48,7 @@ class DfaasRunContext:
     metrics_entries: list[dict[str, Any]] = field(default_factory=list)
     script_entries: list[dict[str, Any]] = field(default_factory=list)
     overloaded_configs: list[list[tuple[str, int]]] = field(default_factory=list)
+    dominance_index: DominanceIndex = field(default_factory=DominanceIndex)
     failed_configs: int = 0
 
 
@@ -288,7 +294,8 @@ class DfaasConfigExecutor:
         config_pairs: list[tuple[str, int]],
         key: tuple[tuple[str, ...], tuple[int, ...]],
     ) -> str | None:
-        if any(dominates(over, config_pairs) for over in ctx.overloaded_configs):
+        ctx.dominance_index.sync(ctx.overloaded_configs)
+        if ctx.dominance_index.dominates(key):
             return "dominated_by_overload"
         if key in ctx.existing_index:
             return "already_indexed"
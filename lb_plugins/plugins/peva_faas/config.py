@@ -360,6 +360,22 @@ class DfaasConfig(BasePluginConfig):
     prometheus_url: str = Field(
         default="http://127.0.0.1:30411", description="Prometheus base URL"
     )
+    prometheus_query_workers: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            "Prometheus queries issued concurrently when collecting metrics "
+            "(1 runs them one after another)"
+        ),
+    )
+    prometheus_query_deadline_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description=(
+            "Seconds after the start of a concurrent metrics collection after "
+            "which a query still without data fails"
+        ),
+    )
     functions: list[DfaasFunctionConfig] = Field(
         default_factory=lambda: [
             DfaasFunctionConfig(
@@ -388,6 +404,21 @@ class DfaasConfig(BasePluginConfig):
     )
     duration: str = Field(default="30s", description="k6 duration string")
     iterations: int = Field(default=3, ge=1, description="Iterations per configuration")
+    pipeline_iterations: bool = Field(
+        default=True,
+        description=(
+            "Process the results of each k6 iteration (summary, metrics, "
+            "memory ingest, annotations) while the next cooldown runs"
+        ),
+    )
+    scheduler_batch_size: int = Field(
+        default=16,
+        ge=1,
+        description=(
+            "Number of candidate configurations pulled from the plan and "
+            "offered to the policy at a time"
+        ),
+    )
     selection_mode: Literal["online", "micro_batch"] = Field(
         default="online",
         description="Configuration selection mode for policy updates",
@@ -67,6 +67,8 @@ class DfaasGenerator(BaseGenerator):
             duration=config.duration,
             scaphandre_enabled=config.scaphandre_enabled,
             function_pid_regexes=config.function_pid_regexes,
+            query_workers=config.prometheus_query_workers,
+            query_deadline_seconds=config.prometheus_query_deadline_seconds,
         )
         self._result_builder = DfaasResultBuilder(config.overload)
         self._duration_seconds = parse_duration_seconds(config.duration)
@@ -121,6 +123,7 @@ class DfaasGenerator(BaseGenerator):
             replicas_provider=self._get_function_replicas,
             scheduler=self._scheduler,
             memory_engine=self._memory_engine,
+            policy=self._policy_algorithm,
         )
         self._result_writer = DfaasResultWriter(self.config)
 
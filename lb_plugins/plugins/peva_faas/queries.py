@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 import logging
 import json
+import re
 import time
 from pathlib import Path
-from typing import Any, Iterable, cast
+from typing import Any, Callable, Iterable, cast
 from urllib.parse import urlencode, urlparse
 from urllib.request import Request, urlopen
 
@@ -25,6 +26,11 @@ class QueryDefinition:
     range: bool = True
     step: str = "10s"
     enabled_if: str | None = None
+    # Optional form covering many functions at once: ``batch_query`` selects
+    # them with ``{function_regex}`` and ``batch_label`` names the label that
+    # carries the function name in each returned series.
+    batch_query: str | None = None
+    batch_label: str | None = None
 
 
 def load_queries(path: Path) -> list[QueryDefinition]:
@@ -47,12 +53,20 @@ def _parse_query_entry(entry: Any) -> QueryDefinition:
     query = entry.get("query")
     if not name or not query:
         raise ValueError("Query entries require 'name' and 'query'.")
+    batch_query = entry.get("batch_query")
+    batch_label = entry.get("batch_label")
+    if bool(batch_query) != bool(batch_label):
+        raise ValueError(
+            f"Query '{name}' requires both 'batch_query' and 'batch_label'."
+        )
     return QueryDefinition(
         name=name,
         query=query,
         range=bool(entry.get("range", True)),
         step=str(entry.get("step", "10s")),
         enabled_if=entry.get("enabled_if"),
+        batch_query=batch_query or None,
+        batch_label=batch_label or None,
     )
 
 
@@ -73,15 +87,49 @@ def render_query(
     time_span: str,
     function_name: str | None = None,
     pid_regex: str | None = None,
+    function_regex: str | None = None,
 ) -> str:
     rendered = template.replace("{time_span}", time_span)
     if function_name is not None:
         rendered = rendered.replace("{function_name}", function_name)
     if pid_regex is not None:
         rendered = rendered.replace("{pid_regex}", pid_regex)
+    if function_regex is not None:
+        rendered = rendered.replace("{function_regex}", function_regex)
     return rendered
 
 
+def function_regex(function_names: Iterable[str]) -> str:
+    """Return a PromQL string-literal regex matching exactly ``function_names``."""
+    alternation = "|".join(re.escape(name) for name in sorted(set(function_names)))
+    return alternation.replace("\\", "\\\\")
+
+
+def split_by_label(
+    payload: dict[str, Any],
+    label: str,
+    parse: Callable[[dict[str, Any]], float],
+) -> dict[str, float]:
+    """Parse a multi-function result into one value per ``label`` value.
+
+    The series of each label value are parsed with ``parse`` as if they were
+    the result of the single-function query. Label values whose series are
+    malformed are left out.
+    """
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for series in payload.get("data", {}).get("result", []):
+        key = series.get("metric", {}).get(label)
+        if key is not None:
+            groups.setdefault(key, []).append(series)
+    values: dict[str, float] = {}
+    for key, series_list in groups.items():
+        try:
+            values[key] = parse({"data": {"result": series_list}})
+        except (PrometheusQueryError, TypeError, ValueError):
+            logger.warning("Malformed Prometheus series for %s=%s", label, key)
+    return values
+
+
 def parse_instant_value(payload: dict[str, Any]) -> float:
     result = payload.get("data", {}).get("result", [])
     if not result:
@@ -126,7 +174,15 @@ class PrometheusQueryRunner:
         end_time: float | None = None,
         function_name: str | None = None,
         pid_regex: str | None = None,
+        deadline: float | None = None,
+        eval_time: float | None = None,
     ) -> float:
+        """Run a query, retrying until it has data or its deadline passes.
+
+        ``deadline`` is an absolute ``time.time()`` value that bounds the
+        retry window in addition to ``retry_seconds``. ``eval_time`` pins
+        instant queries to that timestamp instead of the current time.
+        """
         rendered = render_query(
             query.query,
             time_span=time_span,
@@ -135,13 +191,77 @@ class PrometheusQueryRunner:
         )
         if query.range and start_time is not None and end_time is not None:
             return self._execute_range(
-                rendered, start_time=start_time, end_time=end_time, step=query.step
+                rendered,
+                start_time=start_time,
+                end_time=end_time,
+                step=query.step,
+                deadline=deadline,
             )
-        return self._execute_instant(rendered)
+        return self._execute_instant(rendered, deadline=deadline, eval_time=eval_time)
+
+    def execute_grouped(
+        self,
+        query: QueryDefinition,
+        *,
+        time_span: str,
+        function_names: Iterable[str],
+        start_time: float | None = None,
+        end_time: float | None = None,
+        deadline: float | None = None,
+        eval_time: float | None = None,
+    ) -> dict[str, float]:
+        """Run the batched form of a per-function query for many functions.
+
+        Returns one value per function that has series in the result.
+        """
+        if not query.batch_query or not query.batch_label:
+            raise ValueError(f"Query '{query.name}' has no batched form.")
+        rendered = render_query(
+            query.batch_query,
+            time_span=time_span,
+            function_regex=function_regex(function_names),
+        )
+        if query.range and start_time is not None and end_time is not None:
+            payload = self._range_payload(
+                rendered,
+                start_time=start_time,
+                end_time=end_time,
+                step=query.step,
+                deadline=deadline,
+            )
+            return split_by_label(payload, query.batch_label, parse_range_average)
+        payload = self._instant_payload(
+            rendered, deadline=deadline, eval_time=eval_time
+        )
+        return split_by_label(payload, query.batch_label, parse_instant_value)
 
     def _execute_range(
-        self, query: str, *, start_time: float, end_time: float, step: str
+        self,
+        query: str,
+        *,
+        start_time: float,
+        end_time: float,
+        step: str,
+        deadline: float | None = None,
     ) -> float:
+        payload = self._range_payload(
+            query,
+            start_time=start_time,
+            end_time=end_time,
+            step=step,
+            deadline=deadline,
+        )
+        return parse_range_average(payload)
+
+    def _range_payload(
+        self,
+        query: str,
+        *,
+        start_time: float,
+        end_time: float,
+        step: str,
+        deadline: float | None = None,
+    ) -> dict[str, Any]:
         url = f"{self._base_url}/api/v1/query_range"
         params = {
             "query": query,
@@ -149,16 +269,34 @@ class PrometheusQueryRunner:
             "end": str(end_time),
             "step": step,
         }
-        payload = self._retry_until_result(url, params)
-        return parse_range_average(payload)
+        return self._retry_until_result(url, params, deadline)
 
-    def _execute_instant(self, query: str) -> float:
+    def _execute_instant(
+        self,
+        query: str,
+        *,
+        deadline: float | None = None,
+        eval_time: float | None = None,
+    ) -> float:
+        payload = self._instant_payload(query, deadline=deadline, eval_time=eval_time)
+        return parse_instant_value(payload)
+
+    def _instant_payload(
+        self,
+        query: str,
+        *,
+        deadline: float | None = None,
+        eval_time: float | None = None,
+    ) -> dict[str, Any]:
         url = f"{self._base_url}/api/v1/query"
         params = {"query": query}
-        payload = self._retry_until_result(url, params)
-        return parse_instant_value(payload)
+        if eval_time is not None:
+            params["time"] = str(eval_time)
+        return self._retry_until_result(url, params, deadline)
 
-    def _retry_until_result(self, url: str, params: dict[str, str]) -> dict[str, Any]:
+    def _retry_until_result(
+        self, url: str, params: dict[str, str], deadline: float | None = None
+    ) -> dict[str, Any]:
         start = time.time()
         logged = False
         while True:
@@ -171,7 +309,10 @@ class PrometheusQueryRunner:
                     self._retry_seconds,
                 )
                 logged = True
-            if time.time() - start > self._retry_seconds:
+            now = time.time()
+            if now - start > self._retry_seconds or (
+                deadline is not None and now >= deadline
+            ):
                 raise PrometheusQueryError("Prometheus query timed out.")
             time.sleep(self._sleep_seconds)
 
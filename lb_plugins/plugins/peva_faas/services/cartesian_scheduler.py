@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Container, Iterable
+
 from .contracts import ConfigKey, ConfigPairs
 from .plan_builder import config_key
 
@@ -12,17 +14,17 @@ class CartesianScheduler:
     def propose_batch(
         self,
         *,
-        candidates: list[ConfigPairs],
-        seen_keys: set[ConfigKey],
+        candidates: Iterable[ConfigPairs],
+        seen_keys: Container[ConfigKey],
         desired_size: int,
     ) -> list[ConfigPairs]:
         if desired_size <= 0:
             return []
         selected: list[ConfigPairs] = []
         for config_pairs in candidates:
-            if len(selected) >= desired_size:
-                break
             if config_key(config_pairs) in seen_keys:
                 continue
             selected.append(config_pairs)
+            if len(selected) >= desired_size:
+                break
         return selected
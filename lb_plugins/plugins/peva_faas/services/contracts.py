@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Container, Iterable, Protocol, runtime_checkable
 
 
 ConfigPairs = list[tuple[str, int]]
@@ -31,16 +31,20 @@ class ExecutionEvent:
 
 @runtime_checkable
 class ConfigScheduler(Protocol):
-    """Select next configuration batch from available candidates."""
+    """Select next configuration batch from a stream of candidates."""
 
     def propose_batch(
         self,
         *,
-        candidates: list[ConfigPairs],
-        seen_keys: set[ConfigKey],
+        candidates: Iterable[ConfigPairs],
+        seen_keys: Container[ConfigKey],
         desired_size: int,
     ) -> list[ConfigPairs]:
-        """Return up to ``desired_size`` configs to execute next."""
+        """Return up to ``desired_size`` configs to execute next.
+
+        ``candidates`` may be a lazy iterator over the whole plan; only pull
+        as many candidates as the batch needs.
+        """
 
 
 @runtime_checkable
@@ -50,7 +54,12 @@ class PolicyAlgorithm(Protocol):
     def choose_batch(
         self, *, candidates: list[ConfigPairs], desired_size: int
     ) -> list[ConfigPairs]:
-        """Choose configuration batch from candidate set."""
+        """Choose configuration batch from candidate set.
+
+        Candidates left out are offered again with the next batch. Returning
+        an empty list drops the whole batch: the executor logs a warning and
+        moves on to the next one.
+        """
 
     def update_online(self, event: ExecutionEvent) -> None:
         """Update policy state after one new event."""
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from ..queries import (
     PrometheusQueryError,
@@ -18,6 +20,13 @@ from .cooldown import MetricsSnapshot
 
 logger = logging.getLogger(__name__)
 
+# (result key, query, keyword arguments for the runner). Jobs whose arguments
+# carry ``function_names`` run the batched form of a per-function query.
+_QueryJob = tuple[str, QueryDefinition, dict[str, Any]]
+# Scalar or per-function value of a query, or the error it raised.
+_QueryResult = float | dict[str, float] | Exception
+_BATCHED_FUNCTION_METRICS = {"cpu": "cpu_usage_function", "ram": "ram_usage_function"}
+
 
 @dataclass
 class FunctionMetrics:
@@ -47,6 +56,14 @@ class MetricsCollector:
     - Node-level metrics collection
     - Per-function metrics collection
     - Error handling for failed queries
+
+    With ``query_workers`` above 1, ``collect_all_metrics`` and
+    ``get_node_snapshot`` issue all their queries at once from a thread pool
+    instead of one after another; results and error handling are unchanged.
+
+    When the function CPU and RAM queries define a batched form,
+    ``collect_all_metrics`` queries each of them once for all functions
+    instead of once per function.
     """
 
     def __init__(
@@ -56,6 +73,8 @@ class MetricsCollector:
         duration: str,
         scaphandre_enabled: bool = False,
         function_pid_regexes: dict[str, str] | None = None,
+        query_workers: int = 1,
+        query_deadline_seconds: float | None = None,
     ) -> None:
         """Initialize MetricsCollector.
 
@@ -65,11 +84,17 @@ class MetricsCollector:
             duration: Default time span for queries (e.g., "30s")
             scaphandre_enabled: Enable power metrics collection
             function_pid_regexes: Map of function name to PID regex for power queries
+            query_workers: Maximum queries in flight at once (1 runs them serially)
+            query_deadline_seconds: Concurrent mode only: time after which a
+                query that still has no data gives up, counted from the start
+                of the collection
         """
         self.prometheus_url = prometheus_url
         self.duration = duration
         self.scaphandre_enabled = scaphandre_enabled
         self.function_pid_regexes = function_pid_regexes or {}
+        self.query_workers = max(1, query_workers)
+        self.query_deadline_seconds = query_deadline_seconds
 
         self._runner = PrometheusQueryRunner(prometheus_url)
         self._queries = self._load_queries(Path(queries_path))
@@ -116,33 +141,31 @@ class MetricsCollector:
         Returns:
             MetricsSnapshot with CPU, RAM, and power metrics
         """
-        cpu = self._runner.execute(
-            self._queries["cpu_usage_node"],
-            time_span=self.duration,
-            start_time=start_time,
-            end_time=end_time,
-        )
-        ram = self._runner.execute(
-            self._queries["ram_usage_node"],
-            time_span=self.duration,
-            start_time=start_time,
-            end_time=end_time,
-        )
-        ram_pct = self._runner.execute(
-            self._queries["ram_usage_node_pct"],
-            time_span=self.duration,
-            start_time=start_time,
-            end_time=end_time,
-        )
-        power = float("nan")
+        jobs = self._node_jobs(_window(start_time, end_time))
+        if self.query_workers > 1:
+            return self._node_from_results(self._execute_concurrently(jobs))
+        values = {key: self._execute(query, kwargs) for key, query, kwargs in jobs}
+        return self._node_from_results(values)
+
+    def _node_jobs(self, window: dict[str, float | None]) -> list[_QueryJob]:
+        names = ["cpu_usage_node", "ram_usage_node", "ram_usage_node_pct"]
         if self.scaphandre_enabled and "power_usage_node" in self._queries:
-            power = self._runner.execute(
-                self._queries["power_usage_node"],
-                time_span=self.duration,
-                start_time=start_time,
-                end_time=end_time,
-            )
-        return MetricsSnapshot(cpu=cpu, ram=ram, ram_pct=ram_pct, power=power)
+            names.append("power_usage_node")
+        return [(name, self._queries[name], dict(window)) for name in names]
+
+    @staticmethod
+    def _node_from_results(
+        results: Mapping[str, _QueryResult],
+    ) -> MetricsSnapshot:
+        for value in results.values():
+            if isinstance(value, Exception):
+                raise value
+        return MetricsSnapshot(
+            cpu=_float_result(results["cpu_usage_node"]),
+            ram=_float_result(results["ram_usage_node"]),
+            ram_pct=_float_result(results["ram_usage_node_pct"]),
+            power=_float_result(results.get("power_usage_node", float("nan"))),
+        )
 
     def get_function_metrics(
         self,
@@ -160,38 +183,139 @@ class MetricsCollector:
         Returns:
             FunctionMetrics with CPU, RAM, and power values
         """
+        return self._function_metrics(function_name, _window(start_time, end_time))
+
+    def _function_metrics(
+        self, function_name: str, window: dict[str, float | None]
+    ) -> FunctionMetrics:
+        values: dict[str, _QueryResult]
         try:
-            cpu = self._runner.execute(
+            values = {
+                key: self._execute(query, kwargs)
+                for key, query, kwargs in self._function_jobs(function_name, window)
+            }
+        except PrometheusQueryError as exc:
+            values = {"error": exc}
+        return self._function_from_results(function_name, values)
+
+    def _function_jobs(
+        self, function_name: str, window: dict[str, float | None]
+    ) -> list[_QueryJob]:
+        jobs: list[_QueryJob] = [
+            (
+                "cpu",
                 self._queries["cpu_usage_function"],
-                time_span=self.duration,
-                start_time=start_time,
-                end_time=end_time,
-                function_name=function_name,
-            )
-            ram = self._runner.execute(
+                {**window, "function_name": function_name},
+            ),
+            (
+                "ram",
                 self._queries["ram_usage_function"],
-                time_span=self.duration,
-                start_time=start_time,
-                end_time=end_time,
-                function_name=function_name,
-            )
-            power = float("nan")
-            if self.scaphandre_enabled and "power_usage_function" in self._queries:
-                pid_regex = self.function_pid_regexes.get(function_name)
-                if pid_regex:
-                    power = self._runner.execute(
+                {**window, "function_name": function_name},
+            ),
+        ]
+        if self.scaphandre_enabled and "power_usage_function" in self._queries:
+            pid_regex = self.function_pid_regexes.get(function_name)
+            if pid_regex:
+                jobs.append(
+                    (
+                        "power",
                         self._queries["power_usage_function"],
-                        time_span=self.duration,
-                        start_time=start_time,
-                        end_time=end_time,
-                        pid_regex=pid_regex,
+                        {**window, "pid_regex": pid_regex},
                     )
-            return FunctionMetrics(cpu=cpu, ram=ram, power=power)
-        except PrometheusQueryError as exc:
-            logger.warning("Prometheus query failed for %s: %s", function_name, exc)
-            return FunctionMetrics(
-                cpu=float("nan"), ram=float("nan"), power=float("nan")
+                )
+        return jobs
+
+    @staticmethod
+    def _function_from_results(
+        function_name: str, results: Mapping[str, _QueryResult]
+    ) -> FunctionMetrics:
+        for value in results.values():
+            if isinstance(value, PrometheusQueryError):
+                logger.warning(
+                    "Prometheus query failed for %s: %s", function_name, value
+                )
+                return FunctionMetrics(
+                    cpu=float("nan"), ram=float("nan"), power=float("nan")
+                )
+            if isinstance(value, Exception):
+                raise value
+        return FunctionMetrics(
+            cpu=_float_result(results["cpu"]),
+            ram=_float_result(results["ram"]),
+            power=_float_result(results.get("power", float("nan"))),
+        )
+
+    def _batched_function_jobs(
+        self, function_names: list[str], window: dict[str, float | None]
+    ) -> list[_QueryJob] | None:
+        """Return jobs covering all functions, or None without batched queries."""
+        queries = {
+            key: self._queries[name] for key, name in _BATCHED_FUNCTION_METRICS.items()
+        }
+        if not function_names or not all(q.batch_query for q in queries.values()):
+            return None
+        jobs: list[_QueryJob] = [
+            (
+                f"batch/{key}",
+                query,
+                {**window, "function_names": list(function_names)},
+            )
+            for key, query in queries.items()
+        ]
+        for name in function_names:
+            jobs.extend(
+                (f"function/{name}/{key}", query, kwargs)
+                for key, query, kwargs in self._function_jobs(name, window)
+                if key not in queries
             )
+        return jobs
+
+    def _functions_from_results(
+        self, function_names: list[str], results: Mapping[str, _QueryResult]
+    ) -> dict[str, FunctionMetrics]:
+        functions: dict[str, FunctionMetrics] = {}
+        for name in function_names:
+            own = _with_prefix(results, f"function/{name}/")
+            for key in _BATCHED_FUNCTION_METRICS:
+                batch = results.get(f"batch/{key}")
+                if isinstance(batch, dict):
+                    own[key] = batch.get(
+                        name, PrometheusQueryError(f"No {key} series for {name}.")
+                    )
+                elif batch is not None:
+                    own[key] = batch
+            functions[name] = self._function_from_results(name, own)
+        return functions
+
+    def _execute(
+        self, query: QueryDefinition, kwargs: dict[str, Any]
+    ) -> float | dict[str, float]:
+        if "function_names" in kwargs:
+            return self._runner.execute_grouped(
+                query, time_span=self.duration, **kwargs
+            )
+        return self._runner.execute(query, time_span=self.duration, **kwargs)
+
+    def _execute_concurrently(
+        self, jobs: list[_QueryJob]
+    ) -> dict[str, _QueryResult]:
+        """Run all jobs at once; failed jobs map to their exception."""
+        extra: dict[str, Any] = {}
+        if self.query_deadline_seconds is not None:
+            extra["deadline"] = time.time() + self.query_deadline_seconds
+        workers = min(self.query_workers, len(jobs))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="prometheus-query"
+        ) as pool:
+            futures = {
+                key: pool.submit(self._execute, query, {**kwargs, **extra})
+                for key, query, kwargs in jobs
+            }
+        results: dict[str, _QueryResult] = {}
+        for key, future in futures.items():
+            exc = future.exception()
+            results[key] = exc if isinstance(exc, Exception) else future.result()
+        return results
 
     def collect_all_metrics(
         self,
@@ -214,10 +338,23 @@ class MetricsCollector:
         # Determine if we need range query based on actual vs expected duration
         actual_duration = end_time - start_time
         use_range = actual_duration > duration_seconds
-        query_start = start_time if use_range else None
-        query_end = end_time if use_range else None
+        if use_range:
+            window = _window(start_time, end_time)
+        else:
+            # Instant queries are evaluated at the end of the run, so the
+            # result does not depend on how long after the run they are sent.
+            window = _window(None, None, eval_time=end_time)
 
-        node = self.get_node_snapshot(query_start, query_end)
+        if self.query_workers > 1:
+            node, functions = self._collect_concurrently(function_names, window)
+        else:
+            node = self._node_from_results(
+                {
+                    key: self._execute(query, kwargs)
+                    for key, query, kwargs in self._node_jobs(window)
+                }
+            )
+            functions = self._collect_functions_serially(function_names, window)
         metrics: dict[str, Any] = {
             "cpu_usage_node": node.cpu,
             "ram_usage_node": node.ram,
@@ -226,8 +363,7 @@ class MetricsCollector:
             "functions": {},
         }
 
-        for name in function_names:
-            fn_metrics = self.get_function_metrics(name, query_start, query_end)
+        for name, fn_metrics in functions.items():
             metrics["functions"][name] = {
                 "cpu": fn_metrics.cpu,
                 "ram": fn_metrics.ram,
@@ -235,3 +371,71 @@ class MetricsCollector:
             }
 
         return metrics
+
+    def _collect_concurrently(
+        self, function_names: list[str], window: dict[str, float | None]
+    ) -> tuple[MetricsSnapshot, dict[str, FunctionMetrics]]:
+        """Issue the node and per-function queries of a run in one batch."""
+        jobs = [
+            (f"node/{key}", query, kwargs)
+            for key, query, kwargs in self._node_jobs(window)
+        ]
+        batched = self._batched_function_jobs(function_names, window)
+        if batched is not None:
+            jobs.extend(batched)
+        else:
+            for name in function_names:
+                jobs.extend(
+                    (f"function/{name}/{key}", query, kwargs)
+                    for key, query, kwargs in self._function_jobs(name, window)
+                )
+        results = self._execute_concurrently(jobs)
+        node = self._node_from_results(_with_prefix(results, "node/"))
+        return node, self._functions_from_results(function_names, results)
+
+    def _collect_functions_serially(
+        self, function_names: list[str], window: dict[str, float | None]
+    ) -> dict[str, FunctionMetrics]:
+        jobs = self._batched_function_jobs(function_names, window)
+        if jobs is None:
+            return {
+                name: self._function_metrics(name, window) for name in function_names
+            }
+        results: dict[str, _QueryResult] = {}
+        for key, query, kwargs in jobs:
+            try:
+                results[key] = self._execute(query, kwargs)
+            except PrometheusQueryError as exc:
+                results[key] = exc
+        return self._functions_from_results(function_names, results)
+
+
+def _window(
+    start_time: float | None,
+    end_time: float | None,
+    *,
+    eval_time: float | None = None,
+) -> dict[str, float | None]:
+    window = {"start_time": start_time, "end_time": end_time}
+    if eval_time is not None:
+        window["eval_time"] = eval_time
+    return window
+
+
+def _with_prefix(
+    results: Mapping[str, _QueryResult], prefix: str
+) -> dict[str, _QueryResult]:
+    return {
+        key[len(prefix) :]: value
+        for key, value in results.items()
+        if key.startswith(prefix)
+    }
+
+
+def _float_result(value: _QueryResult) -> float:
+    """Return a scalar query result, re-raising the error of a failed query."""
+    if isinstance(value, Exception):
+        raise value
+    if isinstance(value, dict):
+        raise TypeError("Expected a scalar query result, got per-function values")
+    return value
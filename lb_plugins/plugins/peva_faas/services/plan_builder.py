@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from lb_plugins.plugins._faas_shared.plan_builder import (
+    ConfigurationSpace,
+    DominanceIndex,
     FaasPlanBuilder,
     _PlanConfigLike,
     config_id,
@@ -27,7 +29,9 @@ class DfaasPlanBuilder(FaasPlanBuilder):
 
 
 __all__ = [
+    "ConfigurationSpace",
     "DfaasPlanBuilder",
+    "DominanceIndex",
     "config_id",
     "config_key",
     "dominates",
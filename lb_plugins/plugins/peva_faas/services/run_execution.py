@@ -5,20 +5,36 @@ import csv
 import json
 import logging
 import time
+from collections.abc import Sized
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 
 from ..config import DfaasConfig
 from ..context import ExecutionContext
 from ..exceptions import K6ExecutionError
+from .algorithm_loader import NoOpPolicy
 from .annotation_service import DfaasAnnotationService
 from .cartesian_scheduler import CartesianScheduler
 from .cooldown import CooldownManager, CooldownTimeoutError, MetricsSnapshot
-from .contracts import ConfigScheduler, ExecutionEvent, MemoryEngine
+from .contracts import (
+    ConfigKey,
+    ConfigPairs,
+    ConfigScheduler,
+    ExecutionEvent,
+    MemoryEngine,
+    PolicyAlgorithm,
+)
 from .log_manager import DfaasLogManager
 from .metrics_collector import MetricsCollector
-from .plan_builder import DfaasPlanBuilder, config_id, config_key, dominates
+from .plan_builder import (
+    DfaasPlanBuilder,
+    DominanceIndex,
+    config_id,
+    config_key,
+)
 from .result_builder import DfaasResultBuilder
 from .k6_runner import K6Runner
 
@@ -30,7 +46,8 @@ class DfaasRunContext:
     """Context object holding state for a benchmark run."""
 
     function_names: list[str]
-    configs: list[list[tuple[str, int]]]
+    # Enumerated lazily by the planner; ``len`` gives the size of the plan.
+    configs: Iterable[list[tuple[str, int]]]
     existing_index: set[tuple[tuple[str, ...], tuple[int, ...]]]
     cooldown_manager: CooldownManager
     base_idle: MetricsSnapshot
@@ -47,6 +64,43 @@ class DfaasRunContext:
     metrics_entries: list[dict[str, Any]] = field(default_factory=list)
     script_entries: list[dict[str, Any]] = field(default_factory=list)
     overloaded_configs: list[list[tuple[str, int]]] = field(default_factory=list)
+    dominance_index: DominanceIndex = field(default_factory=DominanceIndex)
+
+
+@dataclass
+class _IterationRun:
+    """One finished k6 iteration whose results still have to be processed."""
+
+    config_pairs: list[tuple[str, int]]
+    cfg_id: str
+    pairs_label: str
+    iteration: int
+    metric_ids: dict[str, str]
+    idle_snapshot: MetricsSnapshot
+    rest_seconds: int
+    k6_result: Any
+    start_time: float
+    end_time: float
+    replicas: dict[str, int]
+
+
+@dataclass
+class _PendingConfig:
+    """A configuration whose last iterations are still being post-processed."""
+
+    config_pairs: list[tuple[str, int]]
+    key: tuple[tuple[str, ...], tuple[int, ...]]
+    cfg_id: str
+    iterations: list[Future[bool]]
+
+
+_ITERATION_ERRORS = (
+    CooldownTimeoutError,
+    K6ExecutionError,
+    OSError,
+    json.JSONDecodeError,
+    RuntimeError,
+)
 
 
 class DfaasRunPlanner:
@@ -76,7 +130,7 @@ class DfaasRunPlanner:
         function_names = self._planner.build_function_names()
         rates = self._planner.build_rates()
         rates_by_function = self._planner.build_rates_by_function(rates)
-        configs = self._planner.build_configurations(
+        configs = self._planner.build_configuration_space(
             function_names,
             rates,
             rates_by_function=rates_by_function,
@@ -193,6 +247,7 @@ class DfaasConfigExecutor:
         replicas_provider: Callable[[list[str]], dict[str, int]],
         scheduler: ConfigScheduler | None = None,
         memory_engine: MemoryEngine | None = None,
+        policy: PolicyAlgorithm | None = None,
     ) -> None:
         self._config = config
         self._k6_runner = k6_runner
@@ -206,28 +261,92 @@ class DfaasConfigExecutor:
         self._replicas_provider = replicas_provider
         self._scheduler = scheduler or CartesianScheduler()
         self._memory_engine = memory_engine
+        self._policy = policy or NoOpPolicy()
+        self._post_worker: ThreadPoolExecutor | None = None
+        self._pending: _PendingConfig | None = None
 
     def execute(self, ctx: DfaasRunContext) -> None:
-        seen_keys = set(ctx.existing_index)
         if self._memory_engine is not None:
             self._memory_engine.startup()
-            for cfg in ctx.configs:
-                key = config_key(cfg)
-                if self._memory_engine.is_seen(key):
-                    seen_keys.add(key)
-
-        selected_configs = self._scheduler.propose_batch(
-            candidates=ctx.configs,
-            seen_keys=seen_keys,
-            desired_size=max(1, len(ctx.configs)),
-        )
-        total_configs = max(1, len(selected_configs))
+        selected_configs = self._iter_selected_configs(ctx)
         total_iterations = max(1, self._config.iterations)
 
-        for idx, config_pairs in enumerate(selected_configs, start=1):
-            self._execute_single_config(
-                ctx, config_pairs, idx, total_configs, total_iterations
+        if not self._config.pipeline_iterations:
+            for idx, (config_pairs, total_configs) in enumerate(
+                selected_configs, start=1
+            ):
+                self._execute_single_config(
+                    ctx, config_pairs, idx, total_configs, total_iterations
+                )
+            return
+
+        # Results of an iteration are processed on a single worker, in
+        # submission order, while the main thread waits for the next cooldown.
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="peva-faas-results"
+        ) as worker:
+            self._post_worker = worker
+            try:
+                for idx, (config_pairs, total_configs) in enumerate(
+                    selected_configs, start=1
+                ):
+                    self._execute_single_config(
+                        ctx, config_pairs, idx, total_configs, total_iterations
+                    )
+                self._finish_pending_config(ctx)
+            finally:
+                self._post_worker = None
+                self._pending = None
+
+    def _iter_selected_configs(
+        self, ctx: DfaasRunContext
+    ) -> Iterator[tuple[ConfigPairs, int]]:
+        """Yield configs to run, pulling candidates from the plan in batches.
+
+        The scheduler drops seen configs while it pulls a batch; the policy
+        then picks from it. Candidates the policy leaves out are offered
+        again with the next batch. A batch the policy declines entirely is
+        dropped with a warning so the rest of the plan still runs.
+
+        Each config comes with the progress total: the plan size minus the
+        configs dropped so far, so a resumed run still reaches 100%.
+        """
+        seen_keys = _SeenKeys(set(ctx.existing_index), self._memory_engine)
+        plan_size = len(ctx.configs) if isinstance(ctx.configs, Sized) else 0
+        candidates = iter(ctx.configs)
+        batch_size = self._config.scheduler_batch_size
+        leftover: list[ConfigPairs] = []
+        dropped = 0
+        selected = 0
+        while True:
+            batch = list(
+                self._scheduler.propose_batch(
+                    candidates=chain(leftover, candidates),
+                    seen_keys=seen_keys,
+                    desired_size=batch_size,
+                )
+            )
+            if not batch:
+                return
+            chosen = self._policy.choose_batch(
+                candidates=batch, desired_size=batch_size
             )
+            if not chosen:
+                logger.warning(
+                    "Policy chose no config from a batch of %d candidates; "
+                    "skipping them",
+                    len(batch),
+                )
+                dropped += len(batch)
+                leftover = []
+                continue
+            for config_pairs in chosen:
+                selected += 1
+                remaining = plan_size - len(seen_keys.hits) - dropped
+                yield config_pairs, max(selected, remaining)
+            leftover = [
+                config_pairs for config_pairs in batch if config_pairs not in chosen
+            ]
 
     def _execute_single_config(
         self,
@@ -241,6 +360,12 @@ class DfaasConfigExecutor:
         cfg_id = config_id(config_pairs)
         pairs_label = self._format_pairs_label(config_pairs)
 
+        first_cooldown: tuple[MetricsSnapshot, int] | CooldownTimeoutError | None
+        first_cooldown = None
+        if self._post_worker is not None:
+            first_cooldown = self._cooldown_while_pending(ctx, config_pairs, key)
+            self._finish_pending_config(ctx)
+
         skip_reason = self._check_skip_reason(ctx, config_pairs, key)
         if skip_reason:
             self._log_skipped_config(
@@ -262,6 +387,25 @@ class DfaasConfigExecutor:
         )
         ctx.script_entries.append({"config_id": cfg_id, "script": script})
 
+        if self._post_worker is not None:
+            if isinstance(first_cooldown, CooldownTimeoutError):
+                self._handle_cooldown_timeout(ctx, config_pairs, cfg_id, first_cooldown)
+                return
+            self._start_config_iterations(
+                ctx,
+                config_pairs,
+                key,
+                script,
+                metric_ids,
+                cfg_id,
+                pairs_label,
+                idx,
+                total_configs,
+                total_iterations,
+                first_cooldown,
+            )
+            return
+
         overload_counter = self._run_config_iterations(
             ctx,
             config_pairs,
@@ -275,7 +419,15 @@ class DfaasConfigExecutor:
         )
         if overload_counter is None:
             return
+        self._finish_config(ctx, config_pairs, key, overload_counter)
 
+    def _finish_config(
+        self,
+        ctx: DfaasRunContext,
+        config_pairs: list[tuple[str, int]],
+        key: tuple[tuple[str, ...], tuple[int, ...]],
+        overload_counter: int,
+    ) -> None:
         if overload_counter > self._config.iterations / 2:
             ctx.overloaded_configs.append(list(config_pairs))
 
@@ -287,7 +439,8 @@ class DfaasConfigExecutor:
         config_pairs: list[tuple[str, int]],
         key: tuple[tuple[str, ...], tuple[int, ...]],
     ) -> str | None:
-        if any(dominates(over, config_pairs) for over in ctx.overloaded_configs):
+        ctx.dominance_index.sync(ctx.overloaded_configs)
+        if ctx.dominance_index.dominates(key):
             return "dominated_by_overload"
         if key in ctx.existing_index:
             return "already_indexed"
@@ -338,38 +491,65 @@ class DfaasConfigExecutor:
         k6_result, start_time, end_time = self._run_k6_iteration(
             ctx, cfg_id, script, metric_ids
         )
-
-        summary_data = k6_result.summary
-        summary_metrics = self._parse_summary_or_raise(summary_data, metric_ids, cfg_id)
+        summary_metrics = self._parse_summary_or_raise(
+            k6_result.summary, metric_ids, cfg_id
+        )
         replicas = self._replicas_provider(getattr(ctx, "function_names", []))
-        config_fn_names = [name for name, _ in config_pairs]
-        metrics = self._collect_metrics(config_fn_names, start_time, end_time)
+        run = _IterationRun(
+            config_pairs=config_pairs,
+            cfg_id=cfg_id,
+            pairs_label=pairs_label,
+            iteration=iteration,
+            metric_ids=metric_ids,
+            idle_snapshot=idle_snapshot,
+            rest_seconds=rest_seconds,
+            k6_result=k6_result,
+            start_time=start_time,
+            end_time=end_time,
+            replicas=replicas,
+        )
+        return self._process_iteration(ctx, run, summary_metrics)
+
+    def _process_iteration(
+        self,
+        ctx: DfaasRunContext,
+        run: _IterationRun,
+        summary_metrics: dict[str, dict[str, float]] | None = None,
+    ) -> bool:
+        """Turn a finished k6 iteration into result rows; return overload."""
+        summary_data = run.k6_result.summary
+        if summary_metrics is None:
+            summary_metrics = self._parse_summary_or_raise(
+                summary_data, run.metric_ids, run.cfg_id
+            )
+        config_fn_names = [name for name, _ in run.config_pairs]
+        metrics = self._collect_metrics(config_fn_names, run.start_time, run.end_time)
 
         row, overloaded = self._result_builder.build_result_row(
             getattr(ctx, "function_names", []),
-            config_pairs,
+            run.config_pairs,
             summary_metrics,
-            replicas,
+            run.replicas,
             metrics,
-            idle_snapshot,
-            rest_seconds,
+            run.idle_snapshot,
+            run.rest_seconds,
         )
 
         if overloaded:
             self._annotations.annotate_overload(
-                ctx.run_id, cfg_id, pairs_label, iteration
+                ctx.run_id, run.cfg_id, run.pairs_label, run.iteration
             )
 
         self._append_iteration_entries(
-            ctx, cfg_id, iteration, summary_data, metrics, row
+            ctx, run.cfg_id, run.iteration, summary_data, metrics, row
         )
         self._ingest_memory_event(
             ctx=ctx,
-            config_pairs=config_pairs,
-            cfg_id=cfg_id,
-            iteration=iteration,
-            start_time=start_time,
-            end_time=end_time,
+            config_pairs=run.config_pairs,
+            cfg_id=run.cfg_id,
+            iteration=run.iteration,
+            start_time=run.start_time,
+            end_time=run.end_time,
             row=row,
             metrics=metrics,
             summary_data=summary_data,
@@ -577,6 +757,119 @@ class DfaasConfigExecutor:
             return None
         return overload_counter
 
+    def _start_config_iterations(
+        self,
+        ctx: DfaasRunContext,
+        config_pairs: list[tuple[str, int]],
+        key: tuple[tuple[str, ...], tuple[int, ...]],
+        script: str,
+        metric_ids: dict[str, str],
+        cfg_id: str,
+        pairs_label: str,
+        idx: int,
+        total_configs: int,
+        total_iterations: int,
+        cooldown: tuple[MetricsSnapshot, int] | None,
+    ) -> None:
+        """Run the k6 iterations of a config, post-processing on the worker.
+
+        Each cooldown overlaps with the processing of the previous iteration,
+        which has to finish before the next k6 run starts so that its queries
+        do not load the node under test. The config is completed by
+        ``_finish_pending_config`` once its last iteration is processed.
+        """
+        assert self._post_worker is not None
+        pending: list[Future[bool]] = []
+        try:
+            for iteration in range(1, total_iterations + 1):
+                message = self._build_iteration_message(
+                    cfg_id, pairs_label, idx, total_configs, iteration, total_iterations
+                )
+                self._emit_iteration_message(message)
+                if cooldown is None:
+                    cooldown = self._perform_cooldown(ctx, cfg_id)
+                idle_snapshot, rest_seconds = cooldown
+                cooldown = None
+                if pending:
+                    pending[-1].result()
+                k6_result, start_time, end_time = self._run_k6_iteration(
+                    ctx, cfg_id, script, metric_ids
+                )
+                run = _IterationRun(
+                    config_pairs=config_pairs,
+                    cfg_id=cfg_id,
+                    pairs_label=pairs_label,
+                    iteration=iteration,
+                    metric_ids=metric_ids,
+                    idle_snapshot=idle_snapshot,
+                    rest_seconds=rest_seconds,
+                    k6_result=k6_result,
+                    start_time=start_time,
+                    end_time=end_time,
+                    replicas=self._replicas_provider(
+                        getattr(ctx, "function_names", [])
+                    ),
+                )
+                pending.append(
+                    self._post_worker.submit(self._process_iteration, ctx, run)
+                )
+        except _ITERATION_ERRORS as exc:
+            _wait_quietly(pending)
+            self._handle_iteration_error(ctx, config_pairs, cfg_id, exc)
+            return
+        self._pending = _PendingConfig(config_pairs, key, cfg_id, pending)
+
+    def _cooldown_while_pending(
+        self,
+        ctx: DfaasRunContext,
+        config_pairs: list[tuple[str, int]],
+        key: tuple[tuple[str, ...], tuple[int, ...]],
+    ) -> tuple[MetricsSnapshot, int] | CooldownTimeoutError | None:
+        """Run the first cooldown of a config while the previous one finishes.
+
+        The skip decision can depend on whether the previous config turned
+        out overloaded, so this cooldown is speculative: it is skipped for
+        configs that are already known to be skipped and wasted if the
+        config is skipped afterwards.
+        """
+        if self._pending is None:
+            return None
+        if self._check_skip_reason(ctx, config_pairs, key):
+            return None
+        try:
+            return self._perform_cooldown(ctx, config_id(config_pairs))
+        except CooldownTimeoutError as exc:
+            return exc
+
+    def _finish_pending_config(self, ctx: DfaasRunContext) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        overload_counter = 0
+        try:
+            for future in pending.iterations:
+                if future.result():
+                    overload_counter += 1
+        except _ITERATION_ERRORS as exc:
+            _wait_quietly(pending.iterations)
+            self._handle_iteration_error(ctx, pending.config_pairs, pending.cfg_id, exc)
+            return
+        self._finish_config(ctx, pending.config_pairs, pending.key, overload_counter)
+
+    def _handle_iteration_error(
+        self,
+        ctx: DfaasRunContext,
+        config_pairs: list[tuple[str, int]],
+        cfg_id: str,
+        exc: Exception,
+    ) -> None:
+        if isinstance(exc, CooldownTimeoutError):
+            self._handle_cooldown_timeout(ctx, config_pairs, cfg_id, exc)
+        elif isinstance(exc, K6ExecutionError):
+            self._handle_k6_error(ctx, config_pairs, cfg_id, exc)
+        else:
+            self._handle_execution_error(ctx, config_pairs, cfg_id, exc)
+
     @staticmethod
     def _format_pairs_label(config_pairs: list[tuple[str, int]]) -> str:
         return ", ".join(
@@ -656,6 +949,37 @@ class DfaasConfigExecutor:
         self._append_skipped_row(ctx, config_pairs)
 
 
+class _SeenKeys:
+    """Seen-key lookup over the run index and the memory engine.
+
+    ``hits`` collects the keys reported as seen, so the executor can tell
+    how much of the plan was dropped.
+    """
+
+    def __init__(
+        self, keys: set[ConfigKey], memory_engine: MemoryEngine | None
+    ) -> None:
+        self._keys = keys
+        self._memory_engine = memory_engine
+        self.hits: set[ConfigKey] = set()
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple):
+            return False
+        seen = key in self._keys or (
+            self._memory_engine is not None and self._memory_engine.is_seen(key)
+        )
+        if seen:
+            self.hits.add(key)
+        return seen
+
+
+def _wait_quietly(futures: list[Future[bool]]) -> None:
+    """Wait for post-processing jobs whose outcome no longer matters."""
+    for future in futures:
+        future.exception()
+
+
 class DfaasResultWriter:
     """Build final DFaaS result payloads."""
 
@@ -20,9 +20,11 @@ from lb_runner.metric_collectors._base_collector import BaseCollector
 from lb_runner.metric_collectors.aggregators import aggregate_cli
 from lb_runner.registry import RunnerRegistry
 from lb_runner.services.log_handler import LBEventLogHandler
-from lb_runner.services.results import collect_metrics
+from lb_runner.services.results import collect_metrics, merge_results
+from lb_runner.services.results_log import results_log_path
 from lb_runner.services import storage as storage_module
 from lb_runner.services import system_info as system_info_module
+from lb_runner.services.setup_cache import setup_hash
 from lb_runner.services.storage import ensure_run_dirs, workload_output_dir
 from lb_runner.services.system_info_io import write_outputs
 
@@ -43,9 +45,12 @@ __all__ = [
     "LocalRunner",
     "LBEventLogHandler",
     "collect_metrics",
+    "merge_results",
+    "results_log_path",
     "aggregate_cli",
     "ensure_run_dirs",
     "write_outputs",
+    "setup_hash",
     "config_module",
     "storage_module",
     "system_info_module",
@@ -80,6 +80,7 @@ class RepetitionExecutor:
             total_repetitions=total_repetitions,
             current_run_id=self.context.run_id,
             collectors_enabled=collectors_enabled,
+            rep_dir=rep_dir,
         )
         duration = resolve_duration(self.context.config, generator, logger)
 
@@ -97,9 +97,14 @@ class MetricManager:
         total_repetitions: int,
         current_run_id: str | None,
         collectors_enabled: bool = True,
+        rep_dir: Path | None = None,
     ) -> "MetricSession":
         """Create a MetricSession for a repetition lifecycle."""
         collectors = [] if not collectors_enabled else self.create_collectors(config)
+        if collectors and rep_dir is not None:
+            self._coordinator.enable_spill(
+                collectors, config, rep_dir, test_name, repetition, logger
+            )
         log_handler = self.attach_event_logger(
             test_name=test_name,
             repetition=repetition,
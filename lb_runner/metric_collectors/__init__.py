@@ -10,11 +10,20 @@ from __future__ import annotations
 import importlib
 from typing import Any, Dict
 
-__all__ = ["PSUtilCollector", "CLICollector"]
+__all__ = [
+    "PSUtilCollector",
+    "ProcfsCollector",
+    "CLICollector",
+    "PerfStatCollector",
+    "EBPFCollector",
+]
 
 _LAZY_MODULES: Dict[str, str] = {
     "PSUtilCollector": "psutil_collector",
+    "ProcfsCollector": "procfs_collector",
     "CLICollector": "cli_collector",
+    "PerfStatCollector": "perf_collector",
+    "EBPFCollector": "ebpf_collector",
 }
 
 
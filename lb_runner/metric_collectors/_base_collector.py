@@ -5,8 +5,9 @@ This module defines the common interface that all metric collectors must impleme
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from datetime import datetime
+import math
 import threading
 import time
 import logging
@@ -15,6 +16,12 @@ from types import TracebackType
 import pandas as pd
 
 from lb_common.api import MetricCollectionError
+from lb_runner.metric_collectors._sample_spill import (
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    DEFAULT_FLUSH_SAMPLES,
+    CsvSampleSpill,
+)
+from lb_runner.metric_collectors._sample_store import ColumnarSampleStore
 
 
 logger = logging.getLogger(__name__)
@@ -23,20 +30,34 @@ logger = logging.getLogger(__name__)
 class BaseCollector(ABC):
     """Abstract base class for all metric collectors."""
 
-    def __init__(self, name: str, interval_seconds: float = 1.0):
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float = 1.0,
+        max_samples: Optional[int] = None,
+    ):
         """
         Initialize the base collector.
 
         Args:
             name: Name of the collector
             interval_seconds: Sampling interval in seconds
+            max_samples: Keep only the most recent N samples (ring-buffer mode);
+                None keeps every sample
         """
         self.name = name
         self.interval_seconds = interval_seconds
         self._is_running = False
         self._thread: Optional[threading.Thread] = None
-        self._data: List[Dict[str, Any]] = []
+        self._samples = ColumnarSampleStore(max_samples=max_samples)
+        self._spare_samples: Optional[ColumnarSampleStore] = None
+        self._spill: Optional[CsvSampleSpill] = None
+        # Samples taken out of memory whose spill write failed; retried first.
+        self._unspilled: Optional[pd.DataFrame] = None
         self._lock = threading.Lock()
+        # Serializes spill writes and spill reads. Always taken before _lock,
+        # and never held by the sampler while it only appends.
+        self._spill_lock = threading.Lock()
         self._start_time: Optional[datetime] = None
         self._stop_time: Optional[datetime] = None
         self._errors: list[MetricCollectionError] = []
@@ -62,6 +83,37 @@ class BaseCollector(ABC):
         """
         pass
 
+    @property
+    def spill_path(self) -> Optional[Path]:
+        """Destination of the on-disk spill, if spilling is enabled."""
+        return self._spill.path if self._spill else None
+
+    def enable_spill(
+        self,
+        path: Path,
+        flush_samples: int = DEFAULT_FLUSH_SAMPLES,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Flush samples incrementally to an append-only CSV while collecting.
+
+        Only the unflushed tail is kept in memory. ``get_data()`` and
+        ``get_dataframe()`` transparently merge the spilled samples back in;
+        ``get_sample_summary()`` reads the spill in chunks instead.
+
+        Args:
+            path: Per-repetition CSV file to append to (truncated here)
+            flush_samples: Flush once this many samples are buffered
+            flush_interval_seconds: Flush at least this often
+        """
+        with self._spill_lock, self._lock:
+            self._spill = CsvSampleSpill(
+                path,
+                flush_samples=flush_samples,
+                flush_interval_seconds=flush_interval_seconds,
+            )
+            self._unspilled = None
+
     def start(self) -> None:
         """Start the metric collection in a background thread."""
         if self._is_running:
@@ -76,7 +128,9 @@ class BaseCollector(ABC):
 
         self._is_running = True
         self._start_time = datetime.now()
-        self._data.clear()
+        with self._lock:
+            self._samples.clear()
+            self._unspilled = None
         self._errors.clear()
 
         self._thread = threading.Thread(target=self._collection_loop, daemon=True)
@@ -96,6 +150,8 @@ class BaseCollector(ABC):
         if self._thread:
             self._thread.join(timeout=self.interval_seconds * 2)
 
+        self._flush_spill()
+
         logger.info(f"{self.name} collector stopped")
 
     def _collection_loop(self) -> None:
@@ -104,16 +160,8 @@ class BaseCollector(ABC):
             start = time.time()
             failed = False
             try:
-                # Collect metrics
                 metrics = self._collect_metrics()
-
-                # Add timestamp and collector info
-                metrics["timestamp"] = datetime.now().isoformat()
-                metrics["collector"] = self.name
-
-                # Store data thread-safely
-                with self._lock:
-                    self._data.append(metrics)
+                self._store_sample(time.time(), metrics)
 
             except Exception as e:
                 failed = True
@@ -126,6 +174,63 @@ class BaseCollector(ABC):
                 logger.error("Error in %s collector: %s", self.name, e, exc_info=True)
             self._sleep_remaining(start, failed=failed)
 
+    def _store_sample(self, timestamp: float, metrics: Dict[str, Any]) -> None:
+        """Append one sample thread-safely, spilling to disk when due."""
+        with self._lock:
+            self._samples.append(timestamp, metrics)
+            due = self._spill is not None and self._spill.due(len(self._samples))
+        if due:
+            self._flush_spill()
+
+    def _flush_spill(self) -> None:
+        """Move buffered samples to the spill file.
+
+        The buffer is swapped for an empty one under the lock; the CSV write
+        happens after releasing it, so sampling never waits on disk I/O.
+        """
+        with self._spill_lock:
+            with self._lock:
+                spill = self._spill
+                if spill is None or not (len(self._samples) or self._has_unspilled()):
+                    return
+                store = self._samples
+                self._samples = self._spare_samples or ColumnarSampleStore(
+                    max_samples=store.max_samples, chunk_size=store.chunk_size
+                )
+                self._spare_samples = None
+                pending = self._unspilled
+                self._unspilled = None
+            frame = _concat_frames(
+                [pending, store.to_dataframe({"collector": self.name})]
+            )
+            store.clear()
+            with self._lock:
+                self._spare_samples = store
+            try:
+                spill.write(frame)
+            except Exception as exc:
+                # Keep the samples in memory; the next flush or save retries.
+                with self._lock:
+                    self._unspilled = frame
+                self._record_error(
+                    MetricCollectionError(
+                        f"{self.name} collector failed to spill samples",
+                        context={"collector": self.name, "path": str(spill.path)},
+                        cause=exc,
+                    )
+                )
+                logger.error("Error spilling %s samples: %s", self.name, exc)
+
+    def _has_unspilled(self) -> bool:
+        return self._unspilled is not None and not self._unspilled.empty
+
+    def _memory_frame(self) -> pd.DataFrame:
+        """Return the samples not yet on disk. Caller must hold the lock."""
+        tail = self._samples.to_dataframe({"collector": self.name})
+        if not self._has_unspilled():
+            return tail
+        return _concat_frames([self._unspilled, tail])
+
     def _record_error(self, error: MetricCollectionError) -> None:
         """Store only the most recent collector errors."""
         self._errors.append(error)
@@ -149,11 +254,37 @@ class BaseCollector(ABC):
         """
         Get the collected data.
 
+        Samples are stored column-wise; this rebuilds the per-sample dicts and
+        is meant for small payloads. Prefer ``get_dataframe()`` for bulk access.
+
         Returns:
             List of dictionaries containing metric data
         """
         with self._lock:
-            return self._data.copy()
+            if self._spill is None:
+                return self._samples.to_records({"collector": self.name})
+        return _frame_to_records(self.get_dataframe())
+
+    def get_sample_summary(self) -> Tuple[int, Dict[str, Dict[str, float]]]:
+        """
+        Return the number of samples and summary statistics per metric.
+
+        With spilling enabled the pending tail is flushed and the spill file
+        is summarized one column at a time, read in chunks, so the whole run
+        is never loaded as a DataFrame.
+
+        Returns:
+            Tuple of the sample count and the per-metric statistics
+        """
+        self._flush_spill()
+        with self._spill_lock:
+            with self._lock:
+                spill = self._spill
+                flushed = not len(self._samples) and not self._has_unspilled()
+            if spill is not None and flushed:
+                return spill.rows, summarize_columns(spill.iter_numeric_columns())
+        df = self.get_dataframe()
+        return len(df), summarize_samples(df)
 
     def get_errors(self) -> list[MetricCollectionError]:
         """Return collected metric errors, if any."""
@@ -166,25 +297,40 @@ class BaseCollector(ABC):
         Returns:
             DataFrame with metrics data
         """
-        data = self.get_data()
-        if not data:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(data)
-        if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
-            df.set_index("timestamp", inplace=True)
-
-        return df
+        with self._spill_lock:
+            with self._lock:
+                tail = self._memory_frame()
+                spill = self._spill
+            if spill is None:
+                return tail
+            spilled = spill.read()
+        if spilled.empty:
+            return tail
+        if tail.empty:
+            return spilled
+        return pd.concat([spilled, tail])
 
     def save_data(self, filepath: Path, format: str = "csv") -> None:
         """
         Save collected data to file.
 
+        When spilling to the same CSV the pending tail is flushed and the file
+        is left in place instead of being rewritten.
+
         Args:
             filepath: Path to save the data
             format: Format to save in ('csv', 'json', 'parquet')
         """
+        with self._lock:
+            spill_path = self._spill.path if self._spill else None
+        if format == "csv" and spill_path == Path(filepath):
+            self._flush_spill()
+            with self._lock:
+                flushed = not len(self._samples) and not self._has_unspilled()
+            if flushed:
+                logger.info(f"Saved {self.name} data to {filepath}")
+                return
+
         df = self.get_dataframe()
 
         if format == "csv":
@@ -200,8 +346,10 @@ class BaseCollector(ABC):
 
     def clear_data(self) -> None:
         """Clear all collected data."""
-        with self._lock:
-            self._data.clear()
+        with self._spill_lock, self._lock:
+            self._samples.clear()
+            self._spill = None
+            self._unspilled = None
 
     def get_summary_stats(self) -> Dict[str, Dict[str, float]]:
         """
@@ -210,26 +358,7 @@ class BaseCollector(ABC):
         Returns:
             Dictionary mapping metric names to their statistics
         """
-        df = self.get_dataframe()
-        if df.empty:
-            return {}
-
-        # Select only numeric columns
-        numeric_df = df.select_dtypes(include=["number"])
-
-        stats = {}
-        for col in numeric_df.columns:
-            stats[col] = {
-                "mean": numeric_df[col].mean(),
-                "std": numeric_df[col].std(),
-                "min": numeric_df[col].min(),
-                "max": numeric_df[col].max(),
-                "median": numeric_df[col].median(),
-                "p95": numeric_df[col].quantile(0.95),
-                "p99": numeric_df[col].quantile(0.99),
-            }
-
-        return stats
+        return self.get_sample_summary()[1]
 
     def __enter__(self) -> "BaseCollector":
         """Context manager entry."""
@@ -244,3 +373,75 @@ class BaseCollector(ABC):
     ) -> None:
         """Context manager exit."""
         self.stop()
+
+
+def _frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a timestamp-indexed frame into per-sample dicts."""
+    if df.empty:
+        return []
+    records: List[Dict[str, Any]] = []
+    for timestamp, row in zip(df.index, df.to_dict(orient="records")):
+        record = {
+            str(key): value
+            for key, value in row.items()
+            if not (isinstance(value, float) and math.isnan(value))
+        }
+        record["timestamp"] = pd.Timestamp(timestamp).isoformat()
+        records.append(record)
+    return records
+
+
+def summarize_samples(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    """
+    Compute summary statistics for every numeric column of a sample frame.
+
+    Args:
+        df: Collector samples, one row per sample
+
+    Returns:
+        Dictionary mapping metric names to their statistics
+    """
+    if df.empty:
+        return {}
+
+    # Select only numeric columns
+    numeric_df = df.select_dtypes(include=["number"])
+    return summarize_columns(
+        (str(col), numeric_df[col]) for col in numeric_df.columns
+    )
+
+
+def summarize_columns(
+    columns: Iterable[Tuple[str, pd.Series]],
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compute summary statistics for ``(name, values)`` numeric columns.
+
+    Args:
+        columns: Numeric columns, consumed one at a time
+
+    Returns:
+        Dictionary mapping metric names to their statistics
+    """
+    stats = {}
+    for col, values in columns:
+        stats[col] = {
+            "mean": values.mean(),
+            "std": values.std(),
+            "min": values.min(),
+            "max": values.max(),
+            "median": values.median(),
+            "p95": values.quantile(0.95),
+            "p99": values.quantile(0.99),
+        }
+    return stats
+
+
+def _concat_frames(frames: List[Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """Concatenate the non-empty frames, oldest first."""
+    parts = [frame for frame in frames if frame is not None and not frame.empty]
+    if not parts:
+        return pd.DataFrame()
+    if len(parts) == 1:
+        return parts[0]
+    return pd.concat(parts)
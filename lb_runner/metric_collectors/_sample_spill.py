@@ -0,0 +1,153 @@
+"""
+Append-only on-disk spill for collector samples.
+
+Long repetitions flush collector samples to a per-repetition CSV in chunks so
+the in-memory buffer stays bounded and a crash only loses the unflushed tail.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_SAMPLES = 1000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 10.0
+READ_CHUNK_ROWS = 100_000
+READ_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class CsvSampleSpill:
+    """Append DataFrame chunks to a CSV file with a stable header.
+
+    The header is fixed by the first flush. When a later chunk carries new
+    metric columns the file is rewritten once with the widened header, which
+    only happens while a collector's metric set is still settling.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        flush_samples: int = DEFAULT_FLUSH_SAMPLES,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """
+        Initialize the spill file.
+
+        Args:
+            path: Destination CSV; truncated on creation
+            flush_samples: Flush once this many samples are buffered
+            flush_interval_seconds: Flush at least this often while sampling
+        """
+        if flush_samples <= 0:
+            raise ValueError("flush_samples must be positive")
+        if flush_interval_seconds <= 0:
+            raise ValueError("flush_interval_seconds must be positive")
+        self.path = Path(path)
+        self.flush_samples = flush_samples
+        self.flush_interval_seconds = flush_interval_seconds
+        self._header: Optional[List[str]] = None
+        self._rows = 0
+        self._last_flush = time.monotonic()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+
+    @property
+    def rows(self) -> int:
+        """Number of samples written to disk so far."""
+        return self._rows
+
+    def due(self, buffered: int) -> bool:
+        """Return True when ``buffered`` samples should be flushed now."""
+        if buffered <= 0:
+            return False
+        if buffered >= self.flush_samples:
+            return True
+        return time.monotonic() - self._last_flush >= self.flush_interval_seconds
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append ``df`` (indexed by timestamp) to the spill file."""
+        self._last_flush = time.monotonic()
+        if df.empty:
+            return
+        columns = list(df.columns)
+        if self._header is None:
+            self._header = columns
+            df.to_csv(self.path, mode="w", header=True)
+        else:
+            new_columns = [col for col in columns if col not in self._header]
+            if new_columns:
+                self._widen(self._header + new_columns)
+            df.reindex(columns=self._header).to_csv(
+                self.path, mode="a", header=False
+            )
+        self._rows += len(df)
+
+    def read(self) -> pd.DataFrame:
+        """Load every spilled sample back into a DataFrame."""
+        if self._header is None or not self.path.exists():
+            return pd.DataFrame()
+        return pd.read_csv(self.path, index_col="timestamp", parse_dates=True)
+
+    def iter_numeric_columns(self) -> Iterator[Tuple[str, pd.Series]]:
+        """Yield ``(name, values)`` for every numeric column.
+
+        The file is parsed in chunks of ``READ_CHUNK_ROWS`` rows, keeping as
+        many columns per pass as fit in ``READ_BUDGET_BYTES`` of float64
+        values, so a typical spill is read exactly once and memory stays
+        bounded on long, wide runs. Columns that do not parse as numbers in
+        every chunk are skipped, as ``select_dtypes(include="number")`` would
+        skip them on the full file.
+        """
+        if self._header is None or not self.path.exists():
+            return
+        per_pass = max(1, READ_BUDGET_BYTES // max(1, self._rows * 8))
+        for start in range(0, len(self._header), per_pass):
+            batch = self._header[start : start + per_pass]
+            yield from self._read_numeric_columns(batch)
+
+    def _read_numeric_columns(
+        self, columns: List[str]
+    ) -> Iterator[Tuple[str, pd.Series]]:
+        parts: Dict[str, List[np.ndarray]] = {column: [] for column in columns}
+        chunks = pd.read_csv(self.path, usecols=columns, chunksize=READ_CHUNK_ROWS)
+        with chunks as reader:
+            for chunk in reader:
+                _append_numeric(parts, chunk)
+        for column, arrays in parts.items():
+            merged = np.concatenate(arrays) if arrays else np.empty(0)
+            yield column, pd.Series(merged, dtype=np.float64)
+
+    def _widen(self, header: List[str]) -> None:
+        logger.debug("Widening spill file %s to %d columns", self.path, len(header))
+        existing = self.read().reindex(columns=header)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        existing.to_csv(tmp_path)
+        os.replace(tmp_path, self.path)
+        self._header = header
+
+
+def _append_numeric(parts: Dict[str, List[np.ndarray]], chunk: pd.DataFrame) -> None:
+    """Append each tracked column of ``chunk``, dropping non-numeric ones."""
+    for column in list(parts):
+        values = _numeric_values(chunk[column])
+        if values is None:
+            del parts[column]
+        else:
+            parts[column].append(values)
+
+
+def _numeric_values(values: pd.Series) -> Optional[np.ndarray]:
+    """Return ``values`` as float64, or None when the column is not numeric."""
+    if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(
+        values
+    ):
+        return None
+    return values.to_numpy(dtype=np.float64)
@@ -0,0 +1,317 @@
+"""
+Columnar sample storage for metric collectors.
+
+Samples are kept as preallocated NumPy chunks (one array per metric plus a
+float epoch timestamp column) instead of one dict per sample, which keeps the
+per-sample memory footprint small on long runs at short intervals.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 4096
+
+_RESERVED_KEYS = frozenset({"timestamp", "collector"})
+_LOCALTIME = Path("/etc/localtime")
+
+
+def _dtype_for(value: Any) -> np.dtype:
+    """Pick the narrowest column dtype able to hold ``value``."""
+    if isinstance(value, bool):
+        return np.dtype(object)
+    if isinstance(value, (int, np.integer)):
+        if -(2**63) <= int(value) < 2**63:
+            return np.dtype(np.int64)
+        return np.dtype(object)
+    if isinstance(value, (float, np.floating)):
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def _promote(current: np.dtype, value: Any) -> np.dtype:
+    """Return the dtype a column must use to also hold ``value``."""
+    wanted = _dtype_for(value)
+    if wanted == current or current == np.dtype(object):
+        return current
+    if {current, wanted} == {np.dtype(np.int64), np.dtype(np.float64)}:
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+@dataclass
+class _Column:
+    """Values and presence mask of one metric inside one chunk."""
+
+    values: np.ndarray
+    present: np.ndarray
+
+
+@dataclass
+class _Chunk:
+    """Fixed-capacity block of samples."""
+
+    timestamps: np.ndarray
+    columns: Dict[str, _Column] = field(default_factory=dict)
+
+    @classmethod
+    def allocate(cls, size: int) -> "_Chunk":
+        return cls(timestamps=np.empty(size, dtype=np.float64))
+
+    def reset(self) -> None:
+        self.columns.clear()
+
+    def set_value(self, name: str, row: int, value: Any) -> None:
+        column = self.columns.get(name)
+        size = len(self.timestamps)
+        if column is None:
+            column = _Column(
+                values=np.empty(size, dtype=_dtype_for(value)),
+                present=np.zeros(size, dtype=bool),
+            )
+            self.columns[name] = column
+        else:
+            dtype = _promote(column.values.dtype, value)
+            if dtype != column.values.dtype:
+                column.values = column.values.astype(dtype)
+        column.values[row] = value
+        column.present[row] = True
+
+
+class ColumnarSampleStore:
+    """Append-only columnar store with an optional ring-buffer bound.
+
+    Samples are written into fixed-size chunks that are allocated on demand.
+    When ``max_samples`` is set the oldest samples are discarded once the bound
+    is exceeded and fully consumed chunks are recycled for new samples, so the
+    memory footprint stays flat regardless of run length.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_samples: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            chunk_size: Number of samples per preallocated chunk
+            max_samples: Keep only the most recent N samples (ring-buffer mode)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if max_samples is not None and max_samples <= 0:
+            raise ValueError("max_samples must be positive")
+        self.chunk_size = chunk_size
+        self.max_samples = max_samples
+        self._chunks: List[_Chunk] = []
+        self._spare: List[_Chunk] = []
+        self._head = 0
+        self._tail = 0
+        self._columns: Dict[str, None] = {}
+
+    def __len__(self) -> int:
+        if not self._chunks:
+            return 0
+        return (len(self._chunks) - 1) * self.chunk_size + self._tail - self._head
+
+    @property
+    def columns(self) -> List[str]:
+        """Metric names in first-seen order."""
+        return list(self._columns)
+
+    def append(self, timestamp: float, metrics: Dict[str, Any]) -> None:
+        """Store one sample taken at ``timestamp`` (seconds since the epoch)."""
+        if not self._chunks or self._tail == self.chunk_size:
+            self._chunks.append(self._next_chunk())
+            self._tail = 0
+        chunk = self._chunks[-1]
+        row = self._tail
+        chunk.timestamps[row] = timestamp
+        for name, value in metrics.items():
+            if name in _RESERVED_KEYS:
+                continue
+            self._columns.setdefault(name, None)
+            if value is not None:
+                chunk.set_value(name, row, value)
+        self._tail += 1
+        self._enforce_bound()
+
+    def clear(self) -> None:
+        """Drop every stored sample."""
+        self._chunks.clear()
+        self._spare.clear()
+        self._columns.clear()
+        self._head = 0
+        self._tail = 0
+
+    def timestamps(self) -> np.ndarray:
+        """Return the epoch timestamp column."""
+        return self._concat(chunk.timestamps for chunk in self._chunks)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a metric column, using NaN/None for samples lacking it."""
+        parts, masks = self._column_parts(name)
+        if not parts:
+            return np.empty(0, dtype=np.float64)
+        present = np.concatenate(masks)
+        dtypes = {part.dtype for part in parts}
+        if present.all() and len(dtypes) == 1:
+            return self._join(parts)
+        if dtypes <= {np.dtype(np.int64), np.dtype(np.float64)}:
+            values = np.concatenate(
+                [part.astype(np.float64, copy=False) for part in parts]
+            )
+            values[~present] = np.nan
+            return values
+        values = np.concatenate([part.astype(object) for part in parts])
+        values[~present] = None
+        return values
+
+    def to_records(
+        self, extra: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Rebuild the legacy list-of-dicts representation.
+
+        Args:
+            extra: Constant fields appended to every record
+
+        Returns:
+            One dict per sample with an ISO ``timestamp`` key
+        """
+        size = len(self)
+        if not size:
+            return []
+        columns: Dict[str, List[Any]] = {}
+        presence: Dict[str, List[bool]] = {}
+        for name in self._columns:
+            parts, masks = self._column_parts(name)
+            columns[name] = [value for part in parts for value in part.tolist()]
+            presence[name] = [flag for mask in masks for flag in mask.tolist()]
+        stamps = [datetime.fromtimestamp(ts).isoformat() for ts in self.timestamps()]
+        records: List[Dict[str, Any]] = []
+        for row in range(size):
+            record = {
+                name: values[row]
+                for name, values in columns.items()
+                if presence[name][row]
+            }
+            record["timestamp"] = stamps[row]
+            if extra:
+                record.update(extra)
+            records.append(record)
+        return records
+
+    def to_dataframe(self, extra: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Wrap the columns into a DataFrame indexed by timestamp.
+
+        Args:
+            extra: Constant columns to add to the frame
+
+        Returns:
+            DataFrame with a local-time ``timestamp`` index
+        """
+        if not len(self):
+            return pd.DataFrame()
+        data: Dict[str, Any] = {name: self.column(name) for name in self._columns}
+        index = _local_datetime_index(self.timestamps())
+        df = pd.DataFrame(data, index=index, copy=False)
+        for key, value in (extra or {}).items():
+            df[key] = value
+        return df
+
+    def _column_parts(self, name: str) -> tuple[List[np.ndarray], List[np.ndarray]]:
+        parts: List[np.ndarray] = []
+        masks: List[np.ndarray] = []
+        for index, chunk in enumerate(self._chunks):
+            start, stop = self._bounds(index)
+            col = chunk.columns.get(name)
+            if col is None:
+                parts.append(np.zeros(stop - start, dtype=np.float64))
+                masks.append(np.zeros(stop - start, dtype=bool))
+                continue
+            parts.append(col.values[start:stop])
+            masks.append(col.present[start:stop])
+        return parts, masks
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        start = self._head if index == 0 else 0
+        stop = self._tail if index == len(self._chunks) - 1 else self.chunk_size
+        return start, stop
+
+    def _concat(self, arrays: Iterable[np.ndarray]) -> np.ndarray:
+        parts = [
+            array[slice(*self._bounds(index))] for index, array in enumerate(arrays)
+        ]
+        if not parts:
+            return np.empty(0, dtype=np.float64)
+        return self._join(parts)
+
+    def _join(self, parts: List[np.ndarray]) -> np.ndarray:
+        # A single unbounded chunk is returned as a view: rows already written
+        # are never rewritten, so callers can wrap it without copying. Ring
+        # mode recycles chunks, hence the defensive copy there.
+        if len(parts) == 1:
+            return parts[0] if self.max_samples is None else parts[0].copy()
+        return np.concatenate(parts)
+
+    def _next_chunk(self) -> _Chunk:
+        if self._spare:
+            chunk = self._spare.pop()
+            chunk.reset()
+            return chunk
+        return _Chunk.allocate(self.chunk_size)
+
+    def _enforce_bound(self) -> None:
+        if self.max_samples is None:
+            return
+        overflow = len(self) - self.max_samples
+        if overflow <= 0:
+            return
+        self._head += overflow
+        while len(self._chunks) > 1 and self._head >= self.chunk_size:
+            self._spare.append(self._chunks.pop(0))
+            self._head -= self.chunk_size
+
+
+def _local_datetime_index(timestamps: np.ndarray) -> pd.DatetimeIndex:
+    """Convert epoch seconds into naive local datetimes without per-row objects.
+
+    Each row gets the UTC offset in force at its own instant, so rows taken
+    after a DST change are not shifted by the offset of the first sample.
+    """
+    utc = pd.to_datetime(timestamps, unit="s").tz_localize("UTC")
+    local = utc.tz_convert(_local_zone()).tz_localize(None)
+    return pd.DatetimeIndex(local, name="timestamp")
+
+
+def _local_zone() -> tzinfo:
+    """
+    Return the host time zone as a zone pandas can convert in bulk.
+
+    ``TZ`` wins when it names an IANA zone; otherwise the rules are read from
+    ``/etc/localtime``. A POSIX-style ``TZ`` string has no zoneinfo form and
+    falls back to the current fixed offset.
+    """
+    name = os.environ.get("TZ", "").lstrip(":")
+    if name:
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            fallback = datetime.now().astimezone().tzinfo
+            return fallback if fallback is not None else timezone.utc
+    try:
+        with _LOCALTIME.open("rb") as handle:
+            return ZoneInfo.from_file(handle, key="localtime")
+    except (OSError, ValueError):
+        # Without a zone file the C library keeps local time in UTC.
+        return timezone.utc
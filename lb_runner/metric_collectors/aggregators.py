@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List, Tuple
 
 import pandas as pd
 
@@ -56,6 +56,107 @@ def aggregate_psutil(df: pd.DataFrame | None) -> Dict[str, float]:
     return summary
 
 
+def aggregate_procfs(df: pd.DataFrame | None) -> Dict[str, float]:
+    """
+    Aggregate metrics collected by ProcfsCollector.
+
+    The system-wide columns share PSUtilCollector's names, so the same
+    summary applies; on top of it the high-frequency samples expose tail
+    CPU usage and pressure-stall peaks.
+
+    Args:
+        df: DataFrame with procfs metrics (timestamp as index recommended)
+
+    Returns:
+        Dictionary of aggregated metrics.
+    """
+    summary = aggregate_psutil(df)
+    if df is None or df.empty:
+        return summary
+
+    if "cpu_percent" in df.columns:
+        summary["cpu_usage_percent_p99"] = float(df["cpu_percent"].quantile(0.99))
+    for resource in ("cpu", "memory", "io"):
+        column = f"psi_{resource}_some_avg10"
+        if column in df.columns:
+            summary[f"{column}_max"] = float(df[column].max())
+
+    return summary
+
+
+def aggregate_perf(df: pd.DataFrame | None) -> Dict[str, float]:
+    """
+    Aggregate metrics collected by PerfStatCollector.
+
+    Args:
+        df: DataFrame with one row of perf counters per interval
+
+    Returns:
+        Dictionary of aggregated metrics.
+    """
+    if df is None or df.empty:
+        return {}
+
+    summary: Dict[str, float] = {}
+    if "ipc" in df.columns:
+        summary["ipc_avg"] = df["ipc"].mean()
+        summary["ipc_min"] = df["ipc"].min()
+    for column in ("cache_miss_percent", "branch_miss_percent"):
+        if column in df.columns:
+            summary[f"{column}_avg"] = df[column].mean()
+            summary[f"{column}_max"] = df[column].max()
+    for column in ("cpu_cycles", "instructions", "task_clock", "context_switches"):
+        if column in df.columns:
+            summary[f"{column}_total"] = df[column].sum()
+
+    return summary
+
+
+def aggregate_ebpf(df: pd.DataFrame | None) -> Dict[str, float]:
+    """
+    Aggregate histograms collected by EBPFCollector.
+
+    Bucket counts are summed over the repetition before taking percentiles,
+    so the result matches one histogram covering the whole run.
+
+    Args:
+        df: DataFrame with one histogram snapshot per interval
+
+    Returns:
+        Dictionary of aggregated metrics.
+    """
+    if df is None or df.empty:
+        return {}
+    return _histogram_percentiles(df)
+
+
+def _histogram_percentiles(df: pd.DataFrame) -> Dict[str, float]:
+    """Compute p50/p99 from ``<name>_le_<upper>`` bucket count columns."""
+    buckets: Dict[str, List[Tuple[int, float]]] = {}
+    for column in df.columns:
+        name, sep, upper = str(column).rpartition("_le_")
+        if sep and upper.isdigit():
+            total = float(pd.to_numeric(df[column], errors="coerce").sum())
+            buckets.setdefault(name, []).append((int(upper), total))
+
+    summary: Dict[str, float] = {}
+    for name, counts in buckets.items():
+        counts.sort()
+        total = sum(count for _, count in counts)
+        if total <= 0:
+            continue
+        summary[f"{name}_count"] = total
+        for label, quantile in (("p50", 0.5), ("p99", 0.99)):
+            running = 0.0
+            for bound, count in counts:
+                running += count
+                if running >= quantile * total:
+                    # Report the bucket's upper bound, as log2 histograms do.
+                    summary[f"{name}_{label}"] = float(bound)
+                    break
+    return summary
+
+
 def aggregate_cli(df: pd.DataFrame | None) -> Dict[str, float]:
     """
     Aggregate metrics collected by CLICollector.
@@ -30,6 +30,13 @@ PSUTIL_AGGREGATOR, _ = _safe_import(
     "lb_runner.metric_collectors.aggregators", "aggregate_psutil"
 )
 
+ProcfsCollector, PROCFS_IMPORT_ERROR = _safe_import(
+    "lb_runner.metric_collectors.procfs_collector", "ProcfsCollector"
+)
+PROCFS_AGGREGATOR, _ = _safe_import(
+    "lb_runner.metric_collectors.aggregators", "aggregate_procfs"
+)
+
 CLICollector, CLI_IMPORT_ERROR = _safe_import(
     "lb_runner.metric_collectors.cli_collector", "CLICollector"
 )
@@ -37,6 +44,20 @@ CLI_AGGREGATOR, _ = _safe_import(
     "lb_runner.metric_collectors.aggregators", "aggregate_cli"
 )
 
+PerfStatCollector, PERF_IMPORT_ERROR = _safe_import(
+    "lb_runner.metric_collectors.perf_collector", "PerfStatCollector"
+)
+PERF_AGGREGATOR, _ = _safe_import(
+    "lb_runner.metric_collectors.aggregators", "aggregate_perf"
+)
+
+EBPFCollector, EBPF_IMPORT_ERROR = _safe_import(
+    "lb_runner.metric_collectors.ebpf_collector", "EBPFCollector"
+)
+EBPF_AGGREGATOR, _ = _safe_import(
+    "lb_runner.metric_collectors.aggregators", "aggregate_ebpf"
+)
+
 
 def _create_psutil(config: BenchmarkConfig) -> BaseCollector:
     if PSUtilCollector is None:
@@ -45,7 +66,20 @@ def _create_psutil(config: BenchmarkConfig) -> BaseCollector:
         BaseCollector,
         PSUtilCollector(
             interval_seconds=config.collectors.psutil_interval
-            or config.metrics_interval_seconds
+            or config.metrics_interval_seconds,
+            max_samples=config.collectors.max_samples,
+        ),
+    )
+
+
+def _create_procfs(config: BenchmarkConfig) -> BaseCollector:
+    if ProcfsCollector is None:
+        raise RuntimeError(f"ProcfsCollector unavailable: {PROCFS_IMPORT_ERROR}")
+    return cast(
+        BaseCollector,
+        ProcfsCollector(
+            interval_seconds=config.collectors.procfs_interval,
+            max_samples=config.collectors.max_samples,
         ),
     )
 
@@ -58,6 +92,37 @@ def _create_cli(config: BenchmarkConfig) -> BaseCollector:
         CLICollector(
             interval_seconds=config.metrics_interval_seconds,
             commands=config.collectors.cli_commands,
+            max_samples=config.collectors.max_samples,
+            streaming=config.collectors.cli_streaming,
+        ),
+    )
+
+
+def _create_perf(config: BenchmarkConfig) -> BaseCollector:
+    if PerfStatCollector is None:
+        raise RuntimeError(f"PerfStatCollector unavailable: {PERF_IMPORT_ERROR}")
+    perf_config = config.collectors.perf_config
+    return cast(
+        BaseCollector,
+        PerfStatCollector(
+            events=perf_config.events,
+            interval_ms=perf_config.interval_ms,
+            pid=perf_config.pid,
+            cpu=perf_config.cpu,
+            max_samples=config.collectors.max_samples,
+        ),
+    )
+
+
+def _create_ebpf(config: BenchmarkConfig) -> BaseCollector:
+    if EBPFCollector is None:
+        raise RuntimeError(f"EBPFCollector unavailable: {EBPF_IMPORT_ERROR}")
+    return cast(
+        BaseCollector,
+        EBPFCollector(
+            interval_seconds=config.metrics_interval_seconds,
+            histograms=config.collectors.ebpf_histograms,
+            max_samples=config.collectors.max_samples,
         ),
     )
 
@@ -70,6 +135,14 @@ PSUTIL_COLLECTOR = CollectorPlugin(
     should_run=lambda cfg: True,
 )
 
+PROCFS_COLLECTOR = CollectorPlugin(
+    name="ProcfsCollector",
+    description="High-frequency per-CPU/disk/NIC metrics from /proc",
+    factory=_create_procfs,
+    aggregator=PROCFS_AGGREGATOR,
+    should_run=lambda cfg: cfg.collectors.enable_procfs,
+)
+
 CLI_COLLECTOR = CollectorPlugin(
     name="CLICollector",
     description="Metrics via CLI commands",
@@ -78,7 +151,30 @@ CLI_COLLECTOR = CollectorPlugin(
     should_run=lambda cfg: bool(cfg.collectors.cli_commands),
 )
 
+PERF_COLLECTOR = CollectorPlugin(
+    name="PerfStatCollector",
+    description="Hardware performance counters via perf stat",
+    factory=_create_perf,
+    aggregator=PERF_AGGREGATOR,
+    should_run=lambda cfg: cfg.collectors.enable_perf
+    and bool(cfg.collectors.perf_config.events),
+)
+
+EBPF_COLLECTOR = CollectorPlugin(
+    name="EBPFCollector",
+    description="Block I/O, run-queue and syscall latency histograms via bpftrace",
+    factory=_create_ebpf,
+    aggregator=EBPF_AGGREGATOR,
+    should_run=lambda cfg: cfg.collectors.enable_ebpf,
+)
+
 
 def builtin_collectors() -> List[Any]:
     """Return built-in collector plugins."""
-    return [PSUTIL_COLLECTOR, CLI_COLLECTOR]
+    return [
+        PSUTIL_COLLECTOR,
+        PROCFS_COLLECTOR,
+        CLI_COLLECTOR,
+        PERF_COLLECTOR,
+        EBPF_COLLECTOR,
+    ]
@@ -2,20 +2,54 @@
 CLI metric collector implementation.
 
 This module collects system metrics by invoking external CLI tools and parsing
-their output.
+their output. By default every command is re-run on each interval; in
+streaming mode each tool is launched once in continuous mode and its output
+is parsed line by line as it arrives; the first row of each interval is kept
+and merged into one sample per interval, as the polling mode does.
 """
 
 import logging
+import os
+import shutil
 import subprocess
 import shlex
+import threading
+from dataclasses import dataclass
 import jc
-from typing import Dict, Any
+from typing import Dict, Any, IO, Iterator, Optional
+
+from lb_common.api import MetricCollectionError
 
 from ._base_collector import BaseCollector
 
 
 logger = logging.getLogger(__name__)
 
+# Tools whose continuous output can be parsed incrementally. jc ships
+# streaming parsers for the sysstat/procps tools; sar uses the local parser.
+_STREAMING_TOOLS = frozenset({"vmstat", "iostat", "mpstat", "pidstat", "sar"})
+# Tools whose first report averages everything since boot rather than the
+# interval; that report is dropped when streaming.
+_SINCE_BOOT_TOOLS = frozenset({"vmstat", "iostat"})
+_SHELL_METACHARACTERS = frozenset("|&;<>()$`")
+_STREAM_STOP_TIMEOUT = 2.0
+
+
+@dataclass
+class _CommandStream:
+    """A continuously running CLI tool and the thread reading its output."""
+
+    command: str
+    process: subprocess.Popen[str]
+    reader: threading.Thread
+
+
+def _starts_interval(first: Dict[str, Any], row: Dict[str, Any]) -> bool:
+    """Tell whether ``row`` opens a new interval after ``first``."""
+    if "time" in row or "time" in first:
+        return row.get("time") != first.get("time")
+    return row.get("type") == first.get("type")
+
 
 class CLICollector(BaseCollector):
     """Metric collector using CLI commands."""
@@ -25,6 +59,8 @@ class CLICollector(BaseCollector):
         name: str = "CLICollector",
         interval_seconds: float = 5.0,
         commands: list[str] | None = None,
+        max_samples: Optional[int] = None,
+        streaming: bool = False,
     ) -> None:
         """
         Initialize the CLI collector.
@@ -33,10 +69,29 @@ class CLICollector(BaseCollector):
             name: Name of the collector
             interval_seconds: Sampling interval in seconds
             commands: List of CLI commands to run
+            max_samples: Optional in-memory ring-buffer bound
+            streaming: Launch supported tools once in continuous mode instead
+                of forking every command on each interval
         """
-        super().__init__(name, interval_seconds)
+        super().__init__(name, interval_seconds, max_samples=max_samples)
         self.commands: list[str] = list(commands or [])
+        self.streaming = streaming
         self._failed_commands: set[str] = set()
+        self._polled_commands: list[str] = list(self.commands)
+        self._streams: list[_CommandStream] = []
+        # Latest interval row per streamed command, consumed by each sample.
+        self._stream_rows: Dict[str, Dict[str, Any]] = {}
+        # Guards _failed_commands and _stream_rows, which the stream reader
+        # threads update while the sampling loop reads them.
+        self._state_lock = threading.Lock()
+
+    def _mark_failed(self, command: str) -> None:
+        with self._state_lock:
+            self._failed_commands.add(command)
+
+    def _is_failed(self, command: str) -> bool:
+        with self._state_lock:
+            return command in self._failed_commands
 
     def _collect_metrics(self) -> Dict[str, Any]:
         """
@@ -45,9 +100,9 @@ class CLICollector(BaseCollector):
         Returns:
             Dictionary containing metric names and their values
         """
-        metrics = {}
-        for command in self.commands:
-            if command in self._failed_commands:
+        metrics: Dict[str, Any] = {}
+        for command in self._polled_commands:
+            if self._is_failed(command):
                 continue
             try:
                 # Run the command safely with a timeout to avoid hanging collectors
@@ -82,7 +137,7 @@ class CLICollector(BaseCollector):
                             tool_name,
                             e,
                         )
-                        self._failed_commands.add(command)
+                        self._mark_failed(command)
                         continue
 
                 if isinstance(parsed, list):
@@ -96,16 +151,176 @@ class CLICollector(BaseCollector):
                     command,
                     self.interval_seconds,
                 )
-                self._failed_commands.add(command)
+                self._mark_failed(command)
             except subprocess.CalledProcessError as e:
                 logger.error("Command '%s' failed to execute: %s", command, e)
-                self._failed_commands.add(command)
+                self._mark_failed(command)
             except Exception as e:
                 logger.error("Error parsing output for command '%s': %s", command, e)
-                self._failed_commands.add(command)
+                self._mark_failed(command)
 
+        with self._state_lock:
+            for row in self._stream_rows.values():
+                metrics.update(row)
+            self._stream_rows.clear()
         return metrics
 
+    def _store_sample(self, timestamp: float, metrics: Dict[str, Any]) -> None:
+        # Before the streams report their first interval there is nothing to
+        # record; an empty row would only add a gap to the series.
+        if self.streaming and not metrics:
+            return
+        super()._store_sample(timestamp, metrics)
+
+    def _collection_loop(self) -> None:
+        """Run the polling loop, streaming supported tools when enabled."""
+        if not self.streaming:
+            super()._collection_loop()
+            return
+
+        self._start_streams()
+        try:
+            super()._collection_loop()
+        finally:
+            self._stop_streams()
+
+    def _start_streams(self) -> None:
+        self._polled_commands = []
+        for command in self.commands:
+            args = self._continuous_args(command)
+            if args is None:
+                self._polled_commands.append(command)
+                continue
+            try:
+                process = subprocess.Popen(
+                    args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                    env={**os.environ, "LC_ALL": "C"},
+                )
+            except OSError as exc:
+                logger.error(
+                    "Failed to launch '%s' in streaming mode: %s", command, exc
+                )
+                self._mark_failed(command)
+                continue
+            reader = threading.Thread(
+                target=self._read_stream,
+                args=(command, process),
+                name=f"{self.name}-{args[0]}",
+                daemon=True,
+            )
+            self._streams.append(_CommandStream(command, process, reader))
+            reader.start()
+
+    def _stop_streams(self) -> None:
+        for stream in self._streams:
+            if stream.process.poll() is None:
+                stream.process.terminate()
+        for stream in self._streams:
+            try:
+                stream.process.wait(timeout=_STREAM_STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                stream.process.kill()
+                stream.process.wait()
+            stream.reader.join(timeout=_STREAM_STOP_TIMEOUT)
+        self._streams.clear()
+        self._polled_commands = list(self.commands)
+        with self._state_lock:
+            self._stream_rows.clear()
+
+    def _continuous_args(self, command: str) -> Optional[list[str]]:
+        """
+        Turn a one-shot command into its continuous form.
+
+        ``vmstat 1 1`` becomes ``vmstat 1``; a command without an interval
+        gets the collector interval appended. Returns None when the command
+        cannot be streamed (unknown tool or shell syntax).
+        """
+        if any(char in _SHELL_METACHARACTERS for char in command):
+            return None
+        tokens = shlex.split(command)
+        if not tokens or tokens[0] not in _STREAMING_TOOLS:
+            return None
+        if len(tokens) >= 3 and tokens[-1].isdigit() and tokens[-2].isdigit():
+            tokens = tokens[:-1]
+        elif not tokens[-1].isdigit():
+            tokens.append(str(max(1, round(self.interval_seconds))))
+        # Force line buffering so rows arrive as soon as the tool prints them.
+        if shutil.which("stdbuf"):
+            tokens = ["stdbuf", "-oL", *tokens]
+        return tokens
+
+    def _read_stream(self, command: str, process: subprocess.Popen[str]) -> None:
+        """Publish the first row of each interval a streaming tool reports."""
+        stdout = process.stdout
+        if stdout is None:
+            return
+        try:
+            for row in self._iter_interval_rows(command, stdout):
+                with self._state_lock:
+                    self._stream_rows[command] = row
+        except Exception as exc:
+            if not self._is_running:
+                return
+            self._record_error(
+                MetricCollectionError(
+                    f"{self.name} stream for '{command}' failed",
+                    context={"collector": self.name, "command": command},
+                    cause=exc,
+                )
+            )
+            logger.error("Streaming command '%s' failed: %s", command, exc)
+            return
+        if self._is_running and process.wait() not in (0, None):
+            logger.error(
+                "Streaming command '%s' exited with %s", command, process.returncode
+            )
+            self._mark_failed(command)
+
+    def _iter_interval_rows(
+        self, command: str, stdout: IO[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one row per reported interval.
+
+        Tools such as pidstat, mpstat -P and iostat -x print several rows per
+        interval; like the polling mode, only the first one is kept. A row
+        opens a new interval when its ``time`` changes or, for tools without
+        timestamps, when it repeats the ``type`` of the interval's first row.
+        """
+        skip = 1 if shlex.split(command)[0] in _SINCE_BOOT_TOOLS else 0
+        first: Optional[Dict[str, Any]] = None
+        for row in self._iter_stream_rows(command, stdout):
+            if not row:
+                continue
+            if first is not None and not _starts_interval(first, row):
+                continue
+            first = row
+            if skip:
+                skip -= 1
+                continue
+            yield row
+
+    def _iter_stream_rows(
+        self, command: str, stdout: IO[str]
+    ) -> Iterator[Dict[str, Any]]:
+        tool = shlex.split(command)[0]
+        if tool == "sar":
+            for line in stdout:
+                yield self._parse_sar(line)
+            return
+        for row in jc.parse(f"{tool}_s", stdout, ignore_exceptions=True, quiet=True):
+            if not isinstance(row, dict):
+                continue
+            yield {
+                key: value
+                for key, value in row.items()
+                if not key.startswith("_jc") and value is not None
+            }
+
     def _parse_sar(self, output: str) -> Dict[str, Any]:
         """
         Minimal parser for `sar -u` output when jc lacks a parser.
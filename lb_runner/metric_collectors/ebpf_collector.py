@@ -0,0 +1,226 @@
+"""
+eBPF collector implementation for kernel latency histograms.
+
+This module runs a bpftrace sidecar for the whole collection. The kernel side
+only folds events into log2 histograms (block I/O, run-queue and syscall
+latency); every interval bpftrace prints the bucket counts and clears them, so
+the data streamed back stays bounded no matter how many events fire.
+"""
+
+import json
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from typing import Any, Dict, IO, Iterator, List, Optional
+
+from ._base_collector import BaseCollector
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTOGRAMS = ["bio_latency_us", "runq_latency_us", "syscall_latency_us"]
+_INTERVAL_MARKER = "lb-interval"
+_STOP_TIMEOUT_SECONDS = 5.0
+
+# Probes feeding each histogram. Start timestamps live in per-key maps that
+# are deleted on completion; only the hist() maps are ever printed.
+_PROBES: Dict[str, str] = {
+    "bio_latency_us": """
+tracepoint:block:block_rq_issue { @bio_start[args->dev, args->sector] = nsecs; }
+tracepoint:block:block_rq_complete /@bio_start[args->dev, args->sector]/ {
+  @bio_latency_us = hist((nsecs - @bio_start[args->dev, args->sector]) / 1000);
+  delete(@bio_start[args->dev, args->sector]);
+}
+""",
+    "runq_latency_us": """
+tracepoint:sched:sched_wakeup, tracepoint:sched:sched_wakeup_new {
+  @runq_start[args->pid] = nsecs;
+}
+tracepoint:sched:sched_switch {
+  if (args->prev_state == 0) { @runq_start[args->prev_pid] = nsecs; }
+  $queued = @runq_start[args->next_pid];
+  if ($queued) { @runq_latency_us = hist((nsecs - $queued) / 1000); }
+  delete(@runq_start[args->next_pid]);
+}
+""",
+    "syscall_latency_us": """
+tracepoint:raw_syscalls:sys_enter { @syscall_start[tid] = nsecs; }
+tracepoint:raw_syscalls:sys_exit /@syscall_start[tid]/ {
+  @syscall_latency_us = hist((nsecs - @syscall_start[tid]) / 1000);
+  delete(@syscall_start[tid]);
+}
+""",
+}
+_START_MAPS = {
+    "bio_latency_us": "@bio_start",
+    "runq_latency_us": "@runq_start",
+    "syscall_latency_us": "@syscall_start",
+}
+
+
+class EBPFCollector(BaseCollector):
+    """Metric collector streaming bpftrace latency histograms."""
+
+    def __init__(
+        self,
+        name: str = "EBPFCollector",
+        interval_seconds: float = 1.0,
+        histograms: Optional[List[str]] = None,
+        max_samples: Optional[int] = None,
+    ):
+        """
+        Initialize the eBPF collector.
+
+        Args:
+            name: Name of the collector
+            interval_seconds: Histogram flush interval in seconds
+            histograms: Histograms to collect (all supported ones by default)
+            max_samples: Optional in-memory ring-buffer bound
+        """
+        super().__init__(name, interval_seconds, max_samples=max_samples)
+        self.histograms: List[str] = list(histograms or DEFAULT_HISTOGRAMS)
+        unknown = [hist for hist in self.histograms if hist not in _PROBES]
+        if unknown:
+            raise ValueError(f"Unsupported eBPF histograms: {', '.join(unknown)}")
+        self._process: Optional[subprocess.Popen[str]] = None
+        # Guards _process and _stopping so a stop() that lands while the
+        # loop thread is still launching bpftrace cannot miss the process.
+        self._process_lock = threading.Lock()
+        self._stopping = False
+
+    def start(self) -> None:
+        """Launch bpftrace in the background."""
+        with self._process_lock:
+            self._stopping = False
+        super().start()
+
+    def stop(self) -> None:
+        """Stop bpftrace, keeping the histogram of the last partial interval."""
+        with self._process_lock:
+            self._stopping = True
+            process, self._process = self._process, None
+        if process is not None:
+            _terminate(process)
+        super().stop()
+
+    def build_script(self) -> str:
+        """Return the bpftrace program for the selected histograms."""
+        interval_ms = max(1, int(self.interval_seconds * 1000))
+        probes = "".join(_PROBES[hist] for hist in self.histograms)
+        prints = " ".join(
+            f"print(@{hist}); clear(@{hist});" for hist in self.histograms
+        )
+        cleanup = " ".join(f"clear({_START_MAPS[hist]});" for hist in self.histograms)
+        return (
+            f"{probes}\n"
+            f"interval:ms:{interval_ms} {{ {prints} "
+            f'printf("{_INTERVAL_MARKER}\\n"); }}\n'
+            f"END {{ {cleanup} }}\n"
+        )
+
+    def _collection_loop(self) -> None:
+        """Read histogram snapshots until bpftrace exits or the collector stops."""
+        try:
+            process = subprocess.Popen(
+                ["bpftrace", "-f", "json", "-e", self.build_script()],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as exc:
+            logger.error("Failed to launch bpftrace: %s", exc)
+            return
+        with self._process_lock:
+            stopping = self._stopping
+            if not stopping:
+                self._process = process
+        if stopping:
+            # stop() ran while bpftrace was starting and found nothing to end.
+            _terminate(process)
+            return
+        if process.stdout is None:
+            return
+        for row in _iter_snapshots(process.stdout, set(self.histograms)):
+            self._store_sample(time.time(), row)
+        process.wait()
+
+    def _collect_metrics(self) -> Dict[str, Any]:
+        """
+        Collect metrics.
+
+        bpftrace pushes one snapshot per interval from its own stream, so
+        there is nothing to poll.
+
+        Returns:
+            An empty dictionary
+        """
+        return {}
+
+    def _validate_environment(self) -> bool:
+        """
+        Validate that bpftrace is installed and can load programs.
+
+        Returns:
+            True if the environment is valid, False otherwise
+        """
+        if shutil.which("bpftrace") is None:
+            logger.error("bpftrace is not installed")
+            return False
+        if os.geteuid() != 0:
+            logger.error("eBPF collection requires root privileges")
+            return False
+        return True
+
+
+def _terminate(process: "subprocess.Popen[str]") -> None:
+    """Stop bpftrace with SIGINT, escalating to SIGKILL if it does not exit."""
+    if process.poll() is None:
+        # SIGINT runs the END probe and prints the maps still pending.
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=_STOP_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _histogram_columns(name: str, buckets: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Flatten bpftrace hist buckets into ``<name>_le_<upper>`` count columns."""
+    columns: Dict[str, int] = {}
+    for bucket in buckets:
+        count = bucket.get("count", 0)
+        upper = bucket.get("max")
+        if not count or not isinstance(upper, int) or upper < 0:
+            continue
+        columns[f"{name}_le_{upper}"] = int(count)
+    return columns
+
+
+def _iter_snapshots(stream: IO[str], histograms: set[str]) -> Iterator[Dict[str, int]]:
+    """Group bpftrace JSON output into one row per interval marker."""
+    row: Dict[str, int] = {}
+    for line in stream:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(message, dict):
+            continue
+        kind = message.get("type")
+        data = message.get("data")
+        if kind == "printf" and str(data).strip() == _INTERVAL_MARKER:
+            if row:
+                yield row
+            row = {}
+        elif kind == "hist" and isinstance(data, dict):
+            for map_name, buckets in data.items():
+                name = map_name.lstrip("@")
+                if name in histograms and isinstance(buckets, list):
+                    row.update(_histogram_columns(name, buckets))
+    if row:
+        yield row
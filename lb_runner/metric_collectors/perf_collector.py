@@ -0,0 +1,314 @@
+"""
+Perf stat collector implementation for hardware performance counters.
+
+This module runs ``perf stat -I <interval> -x,`` for the whole collection and
+turns its interval CSV stream into a time series. Instructions-per-cycle,
+cache-miss and branch-miss rates are derived per interval. When the PMU is
+not accessible (virtual machines, restrictive ``perf_event_paranoid``) the
+collector falls back to kernel software events.
+"""
+
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+from ._base_collector import BaseCollector
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EVENTS = [
+    "cpu-cycles",
+    "instructions",
+    "cache-references",
+    "cache-misses",
+    "branches",
+    "branch-misses",
+]
+SOFTWARE_EVENTS = [
+    "task-clock",
+    "context-switches",
+    "cpu-migrations",
+    "page-faults",
+]
+_EVENT_ALIASES = {"cycles": "cpu-cycles"}
+_UNCOUNTED_PREFIX = "<"
+_PROBE_TIMEOUT_SECONDS = 10.0
+_STOP_TIMEOUT_SECONDS = 2.0
+
+
+class PerfStatCollector(BaseCollector):
+    """Metric collector streaming ``perf stat`` interval counters."""
+
+    def __init__(
+        self,
+        name: str = "PerfStatCollector",
+        events: Optional[List[str]] = None,
+        interval_ms: int = 1000,
+        pid: Optional[int] = None,
+        cpu: Optional[int] = None,
+        max_samples: Optional[int] = None,
+    ):
+        """
+        Initialize the perf stat collector.
+
+        Args:
+            name: Name of the collector
+            events: perf events to count (hardware counters by default)
+            interval_ms: Counter print interval in milliseconds
+            pid: Count only this process instead of the whole system
+            cpu: Count only this CPU
+            max_samples: Optional in-memory ring-buffer bound
+        """
+        super().__init__(name, interval_ms / 1000.0, max_samples=max_samples)
+        self.events: List[str] = list(events or DEFAULT_EVENTS)
+        self.interval_ms = interval_ms
+        self.pid = pid
+        self.cpu = cpu
+        self.active_events: List[str] = []
+        self._process: Optional[subprocess.Popen[str]] = None
+        # Guards _process and _stopping so a stop() that lands while the
+        # loop thread is still launching perf cannot miss the process.
+        self._process_lock = threading.Lock()
+        self._stopping = False
+
+    def start(self) -> None:
+        """Pick countable events, then launch perf in the background."""
+        self.active_events = self._resolve_events()
+        with self._process_lock:
+            self._stopping = False
+        super().start()
+
+    def stop(self) -> None:
+        """Ask perf to print its last interval and wait for it to exit."""
+        with self._process_lock:
+            self._stopping = True
+            process, self._process = self._process, None
+        if process is not None:
+            _terminate(process)
+        super().stop()
+
+    def _target_args(self) -> List[str]:
+        if self.pid is not None:
+            return ["-p", str(self.pid)]
+        if self.cpu is not None:
+            return ["-a", "-C", str(self.cpu)]
+        return ["-a"]
+
+    def _build_command(self, events: List[str]) -> List[str]:
+        return [
+            "perf",
+            "stat",
+            "-I",
+            str(self.interval_ms),
+            "-x,",
+            "-e",
+            ",".join(events),
+            *self._target_args(),
+        ]
+
+    def _resolve_events(self) -> List[str]:
+        """
+        Return the configured events that the PMU can count.
+
+        Falls back to software events when none of the configured events are
+        countable, and to an empty list when perf cannot run at all.
+        """
+        counted = self._probe(self.events)
+        if counted:
+            skipped = [event for event in self.events if event not in counted]
+            if skipped:
+                logger.warning("perf cannot count %s; skipping", ", ".join(skipped))
+            return [event for event in self.events if event in counted]
+        logger.warning(
+            "Hardware counters unavailable to perf; falling back to software events"
+        )
+        fallback = self._probe(SOFTWARE_EVENTS)
+        return [event for event in SOFTWARE_EVENTS if event in fallback]
+
+    def _probe(self, events: List[str]) -> set[str]:
+        """Run a short perf stat and return the events that produced counts."""
+        if not events:
+            return set()
+        command = [
+            "perf",
+            "stat",
+            "-x,",
+            "-e",
+            ",".join(events),
+            *self._target_args(),
+            "--",
+            "sleep",
+            "0.01",
+        ]
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                timeout=_PROBE_TIMEOUT_SECONDS,
+                env={**os.environ, "LC_ALL": "C"},
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            logger.debug("perf probe failed: %s", exc)
+            return set()
+        counted: set[str] = set()
+        requested = {_normalize_event(event): event for event in events}
+        for line in result.stderr.splitlines():
+            parts = line.split(",")
+            if len(parts) < 3 or parts[0].startswith(_UNCOUNTED_PREFIX):
+                continue
+            event = requested.get(_normalize_event(parts[2]))
+            if event is not None and _to_float(parts[0]) is not None:
+                counted.add(event)
+        return counted
+
+    def _collection_loop(self) -> None:
+        """Read perf's interval output until it exits or the collector stops."""
+        command = self._build_command(self.active_events)
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                env={**os.environ, "LC_ALL": "C"},
+            )
+        except OSError as exc:
+            logger.error("Failed to launch perf: %s", exc)
+            return
+        with self._process_lock:
+            stopping = self._stopping
+            if not stopping:
+                self._process = process
+        if stopping:
+            # stop() ran while perf was starting and found nothing to end.
+            _terminate(process)
+            return
+        started = time.time()
+        if process.stderr is None:
+            return
+        for offset, row in _iter_intervals(process.stderr):
+            self._store_sample(started + offset, _with_derived_metrics(row))
+        process.wait()
+
+    def _collect_metrics(self) -> Dict[str, Any]:
+        """
+        Collect metrics.
+
+        perf pushes one row per interval from its own stream, so there is
+        nothing to poll.
+
+        Returns:
+            An empty dictionary
+        """
+        return {}
+
+    def _validate_environment(self) -> bool:
+        """
+        Validate that perf is installed and can count at least one event.
+
+        Returns:
+            True if the environment is valid, False otherwise
+        """
+        if shutil.which("perf") is None:
+            logger.error("perf is not installed")
+            return False
+        return bool(self.active_events)
+
+
+def _terminate(process: "subprocess.Popen[str]") -> None:
+    """Stop perf with SIGINT, escalating to SIGKILL if it does not exit."""
+    if process.poll() is None:
+        # SIGINT makes perf flush the interval in progress before exiting.
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(timeout=_STOP_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _normalize_event(name: str) -> str:
+    """Strip PMU prefixes and modifiers (``cpu_core/cycles/u`` -> cpu-cycles)."""
+    name = name.strip()
+    if "/" in name:
+        parts = [part for part in name.split("/") if part]
+        name = parts[1] if len(parts) > 1 else parts[0]
+    name = name.split(":", 1)[0]
+    return _EVENT_ALIASES.get(name, name)
+
+
+def _to_float(raw: str) -> Optional[float]:
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def _parse_interval_line(line: str) -> Optional[Tuple[float, str, Optional[float]]]:
+    """
+    Parse one ``perf stat -I -x,`` line.
+
+    The layout is ``time,value,unit,event,run-time,pct,...``. Events perf
+    could not count report ``<not counted>`` or ``<not supported>`` and are
+    returned with a None value.
+    """
+    if not line.strip() or line.startswith("#"):
+        return None
+    parts = line.strip().split(",")
+    if len(parts) < 4:
+        return None
+    offset = _to_float(parts[0])
+    if offset is None:
+        return None
+    return offset, _normalize_event(parts[3]), _to_float(parts[1])
+
+
+def _iter_intervals(stream: IO[str]) -> Iterator[Tuple[float, Dict[str, float]]]:
+    """Group perf lines by interval timestamp into one row per interval."""
+    current: Optional[float] = None
+    row: Dict[str, float] = {}
+    for line in stream:
+        parsed = _parse_interval_line(line)
+        if parsed is None:
+            continue
+        offset, event, value = parsed
+        if current is not None and offset != current:
+            yield current, row
+            row = {}
+        current = offset
+        if value is None:
+            continue
+        column = event.replace("-", "_")
+        # Hybrid CPUs report one line per core type for the same event.
+        row[column] = row.get(column, 0.0) + value
+    if current is not None and row:
+        yield current, row
+
+
+def _ratio(numerator: Optional[float], denominator: Optional[float]) -> Optional[float]:
+    if numerator is None or not denominator:
+        return None
+    return numerator / denominator
+
+
+def _with_derived_metrics(row: Dict[str, float]) -> Dict[str, Any]:
+    """Add IPC and miss-rate columns when their inputs were counted."""
+    metrics: Dict[str, Any] = dict(row)
+    ipc = _ratio(row.get("instructions"), row.get("cpu_cycles"))
+    if ipc is not None:
+        metrics["ipc"] = ipc
+    cache_miss = _ratio(row.get("cache_misses"), row.get("cache_references"))
+    if cache_miss is not None:
+        metrics["cache_miss_percent"] = 100.0 * cache_miss
+    branch_miss = _ratio(row.get("branch_misses"), row.get("branches"))
+    if branch_miss is not None:
+        metrics["branch_miss_percent"] = 100.0 * branch_miss
+    return metrics
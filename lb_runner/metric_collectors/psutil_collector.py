@@ -5,7 +5,7 @@ This module collects system metrics using the psutil library.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import psutil
 
@@ -18,15 +18,21 @@ logger = logging.getLogger(__name__)
 class PSUtilCollector(BaseCollector):
     """Metric collector using psutil."""
 
-    def __init__(self, name: str = "PSUtilCollector", interval_seconds: float = 1.0):
+    def __init__(
+        self,
+        name: str = "PSUtilCollector",
+        interval_seconds: float = 1.0,
+        max_samples: Optional[int] = None,
+    ):
         """
         Initialize the PSUtil collector.
 
         Args:
             name: Name of the collector
             interval_seconds: Sampling interval in seconds
+            max_samples: Optional in-memory ring-buffer bound
         """
-        super().__init__(name, interval_seconds)
+        super().__init__(name, interval_seconds, max_samples=max_samples)
 
     def _collect_metrics(self) -> Dict[str, Any]:
         """
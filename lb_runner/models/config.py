@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Self
+from typing import Any, Dict, List, Literal, Optional, Self
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -55,12 +55,59 @@ class MetricCollectorConfig(BaseModel):
         ],
         description="List of CLI commands to execute for metric collection",
     )
+    cli_streaming: bool = Field(
+        default=False,
+        description=(
+            "Launch vmstat/iostat/mpstat/pidstat/sar once in continuous mode and "
+            "parse their output as it streams instead of forking every interval"
+        ),
+    )
     perf_config: PerfConfig = Field(
         default_factory=PerfConfig, description="Configuration for perf profiling"
     )
+    enable_perf: bool = Field(
+        default=False,
+        description="Stream perf_config events with perf stat for each repetition",
+    )
     enable_ebpf: bool = Field(
         default=False, description="Enable eBPF-based metric collection"
     )
+    ebpf_histograms: List[str] = Field(
+        default_factory=lambda: [
+            "bio_latency_us",
+            "runq_latency_us",
+            "syscall_latency_us",
+        ],
+        description="Latency histograms traced by the eBPF collector",
+    )
+    enable_procfs: bool = Field(
+        default=False,
+        description="Enable the high-frequency /proc collector (per-CPU/disk/NIC)",
+    )
+    procfs_interval: float = Field(
+        default=0.1, gt=0, description="Interval for procfs collector in seconds"
+    )
+    max_samples: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Keep only the most recent N samples per collector in memory "
+            "(ring buffer); unbounded when unset"
+        ),
+    )
+    spill_to_disk: bool = Field(
+        default=False,
+        description=(
+            "Flush collector samples incrementally to the per-repetition CSV "
+            "instead of holding them in memory until the repetition ends"
+        ),
+    )
+    spill_flush_samples: int = Field(
+        default=1000, gt=0, description="Spill after this many buffered samples"
+    )
+    spill_flush_interval_seconds: float = Field(
+        default=10.0, gt=0, description="Spill at least this often, in seconds"
+    )
 
 
 class LokiConfig(BaseModel):
@@ -201,6 +248,63 @@ class RemoteExecutionConfig(BaseModel):
     use_container_fallback: bool = Field(
         default=False, description="Use container-based fallback for remote execution"
     )
+    event_transport: Literal["poll", "stream"] = Field(
+        default="poll",
+        description=(
+            "How LB_EVENT lines reach the controller: 'poll' re-reads the remote "
+            "stream log from Ansible, 'stream' keeps one SSH channel per host open"
+        ),
+    )
+    resident_agent: bool = Field(
+        default=False,
+        description=(
+            "Start a runner agent during setup that keeps plugin and collector "
+            "registries loaded and forks each repetition from it"
+        ),
+    )
+    batch_repetitions: bool = Field(
+        default=False,
+        description=(
+            "Run all pending repetitions of a workload in one LocalRunner process "
+            "per host instead of one Ansible round per repetition"
+        ),
+    )
+    collect_mode: Literal["archive", "incremental"] = Field(
+        default="archive",
+        description=(
+            "How workload artifacts are fetched after each repetition: 'archive' "
+            "re-sends the whole workload directory, 'incremental' only the files "
+            "changed since the last collect"
+        ),
+    )
+    host_strategy: Literal["lockstep", "per_host"] = Field(
+        default="lockstep",
+        description=(
+            "'lockstep' runs each workload phase on all hosts at once; "
+            "'per_host' lets every host work through its workload queue on its "
+            "own, except for workloads whose plugin requires a host barrier"
+        ),
+    )
+    max_parallel_hosts: int = Field(
+        default=4,
+        ge=1,
+        description="Hosts progressing concurrently with host_strategy='per_host'",
+    )
+    setup_cache: bool = Field(
+        default=True,
+        description=(
+            "Skip source upload, APT and uv sync during global setup when the "
+            "host already has an install for the same sources and system"
+        ),
+    )
+    source_upload: Literal["archive", "delta"] = Field(
+        default="archive",
+        description=(
+            "How global setup ships the library sources: 'archive' uploads "
+            "a full tar.gz to every host; 'delta' keeps a content-addressed "
+            "blob store on each host and uploads only the files it lacks"
+        ),
+    )
 
 
 class WorkloadConfig(BaseModel):
@@ -9,7 +9,7 @@ import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Mapping
+from typing import Dict, List, Mapping, Optional
 from lb_plugins.api import (
     create_registry,
     ensure_workloads_from_plugin_settings,
@@ -18,10 +18,14 @@ from lb_plugins.api import (
 from lb_runner.api import (
     BenchmarkConfig,
     LocalRunner,
+    RunEvent,
     StopToken,
     WorkloadConfig,
 )
 from lb_runner.engine.stop_context import stop_context
+from lb_runner.metric_collectors.registry import CollectorRegistry
+
+_TERMINAL_STATUSES = {"done", "failed", "stopped"}
 
 
 def _env(name: str) -> str:
@@ -31,6 +35,12 @@ def _env(name: str) -> str:
     return value
 
 
+def _repetitions_from_env() -> List[int]:
+    """Return the batch from LB_RUN_REPETITIONS ("1,2,3"), or [] if unset."""
+    raw = os.environ.get("LB_RUN_REPETITIONS", "").strip()
+    return [int(part) for part in raw.split(",") if part.strip()]
+
+
 def _event_logging_enabled(env: dict[str, str] | None = None) -> bool:
     raw = (env or os.environ).get("LB_ENABLE_EVENT_LOGGING", "1").strip().lower()
     return raw not in {"0", "false", "no"}
@@ -74,17 +84,42 @@ def _configure_stream(log_path: Path) -> None:
     sys.stderr = sys.stdout
 
 
-def _write_status(path: Path | None, rc: int) -> None:
+def _write_status(
+    path: Path | None, rc: int, repetitions: Dict[int, str] | None = None
+) -> None:
     if path is None:
         return
-    payload = {
+    payload: dict[str, object] = {
         "rc": rc,
         "timestamp": time.time(),
     }
+    if repetitions is not None:
+        payload["repetitions"] = {str(rep): s for rep, s in repetitions.items()}
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload))
 
 
+def _emit_event(
+    run_id: str,
+    host: str,
+    workload: str,
+    repetition: int,
+    total_reps: int,
+    status: str,
+    message: str,
+) -> None:
+    payload = {
+        "run_id": run_id,
+        "host": host,
+        "workload": workload,
+        "repetition": repetition,
+        "total_repetitions": total_reps,
+        "status": status,
+        "message": message,
+    }
+    print("LB_EVENT " + json.dumps(payload), flush=True)
+
+
 def _maybe_daemonize(env: Mapping[str, str]) -> int | None:
     if env.get("LB_RUN_DAEMONIZE") != "1":
         return None
@@ -105,14 +140,28 @@ def _maybe_daemonize(env: Mapping[str, str]) -> int | None:
     os._exit(0)
 
 
-def main() -> int:
+def main(collector_registry: Optional[CollectorRegistry] = None) -> int:
+    """Run the repetition(s) described by the LB_RUN_* environment variables.
+
+    When LB_RUN_REPETITIONS lists several repetitions they all run in this
+    process; LocalRunner emits the per-repetition LB_EVENTs and the status
+    file records the final status of each one.
+
+    Args:
+        collector_registry: Already-loaded collector registry to reuse (the
+            resident runner agent passes its warm one).
+
+    Returns:
+        Process exit code.
+    """
     # Set up a fallback logger for early startup errors
     logging.basicConfig(level=logging.ERROR)
     start_ts = time.time()
 
     try:
         workload = _env("LB_RUN_WORKLOAD")
-        repetition = int(_env("LB_RUN_REPETITION"))
+        batch_reps = _repetitions_from_env()
+        repetition = batch_reps[0] if batch_reps else int(_env("LB_RUN_REPETITION"))
         total_reps = int(_env("LB_RUN_TOTAL_REPS"))
         run_id = os.environ.get("LB_RUN_ID", "")
         host = os.environ.get("LB_RUN_HOST", "")
@@ -135,6 +184,20 @@ def main() -> int:
     _configure_logging_level()
     _configure_stream(log_path)
 
+    outcomes: Dict[int, str] = {}
+
+    def _record_outcome(event: RunEvent) -> None:
+        if event.status in _TERMINAL_STATUSES:
+            outcomes[event.repetition] = event.status
+
+    def _fail_unfinished(message: str) -> int:
+        for rep in batch_reps:
+            if rep not in outcomes:
+                outcomes[rep] = "failed"
+                _emit_event(run_id, host, workload, rep, total_reps, "failed", message)
+        _write_status(status_path, 1, outcomes)
+        return 1
+
     try:
         cfg = BenchmarkConfig.from_dict(json.loads(config_path.read_text()))
         registry = create_registry()
@@ -147,9 +210,10 @@ def main() -> int:
         runner = LocalRunner(
             cfg,
             registry=registry,
-            progress_callback=None,
+            progress_callback=_record_outcome if batch_reps else None,
             host_name=host or "host",
             stop_token=stop_token,
+            collector_registry=collector_registry,
         )
 
         with stop_context(stop_token):
@@ -158,47 +222,52 @@ def main() -> int:
                 repetition_override=repetition,
                 total_repetitions=total_reps,
                 run_id=run_id,
+                pending_reps=batch_reps or None,
             )
     except Exception as exc:  # noqa: BLE001
         duration = time.time() - start_ts
-        payload = {
-            "run_id": run_id,
-            "host": host,
-            "workload": workload,
-            "repetition": repetition,
-            "total_repetitions": total_reps,
-            "status": "failed",
-            "message": f"error={exc} duration={duration:.1f}s",
-        }
-        print("LB_EVENT " + json.dumps(payload), flush=True)
+        if batch_reps:
+            return _fail_unfinished(f"error={exc} duration={duration:.1f}s")
+        _emit_event(
+            run_id,
+            host,
+            workload,
+            repetition,
+            total_reps,
+            "failed",
+            f"error={exc} duration={duration:.1f}s",
+        )
         _write_status(status_path, 1)
         return 1
 
     duration = time.time() - start_ts
+    if batch_reps:
+        if not success:
+            return _fail_unfinished(f"duration={duration:.1f}s")
+        _write_status(status_path, 0, outcomes)
+        return 0
     if not success:
-        payload = {
-            "run_id": run_id,
-            "host": host,
-            "workload": workload,
-            "repetition": repetition,
-            "total_repetitions": total_reps,
-            "status": "failed",
-            "message": f"duration={duration:.1f}s",
-        }
-        print("LB_EVENT " + json.dumps(payload), flush=True)
+        _emit_event(
+            run_id,
+            host,
+            workload,
+            repetition,
+            total_reps,
+            "failed",
+            f"duration={duration:.1f}s",
+        )
         _write_status(status_path, 1)
         return 1
 
-    payload = {
-        "run_id": run_id,
-        "host": host,
-        "workload": workload,
-        "repetition": repetition,
-        "total_repetitions": total_reps,
-        "status": "done",
-        "message": f"duration={duration:.1f}s",
-    }
-    print("LB_EVENT " + json.dumps(payload), flush=True)
+    _emit_event(
+        run_id,
+        host,
+        workload,
+        repetition,
+        total_reps,
+        "done",
+        f"duration={duration:.1f}s",
+    )
     _write_status(status_path, 0)
     return 0
 
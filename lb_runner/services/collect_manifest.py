@@ -0,0 +1,175 @@
+"""Manifest of collected workload artifacts for incremental collection.
+
+The manifest maps every file under ``<root>/<workload>`` to its size,
+mtime and SHA-256. ``plan`` rescans the directory and writes the list of
+files whose content is new since the committed manifest, plus a pending
+manifest. Once the controller has extracted the delta and stored its own
+copy of the pending manifest, ``commit`` promotes it on the remote side.
+
+The controller passes the SHA-256 of its local manifest copy. If it does not
+match the committed remote manifest (first collect, wiped local results, a
+failed previous collect) every file is listed again, so both sides always
+converge on the same set of files.
+
+Usage::
+
+    python -m lb_runner.services.collect_manifest plan --root DIR \\
+        --subdir WORKLOAD --manifest PATH --list PATH [--expect SHA256]
+    python -m lb_runner.services.collect_manifest commit --manifest PATH
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from lb_runner.services.source_sync import file_sha256, load_manifest
+
+_PENDING_SUFFIX = ".pending"
+
+
+def scan(
+    root: Path, subdir: str, previous: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Describe every file under ``root/subdir``.
+
+    Hashes are reused from ``previous`` when size and mtime are unchanged, so
+    only new or modified files are read.
+
+    Args:
+        root: Directory the manifest paths are relative to.
+        subdir: Directory below ``root`` to scan.
+        previous: Entries of the last committed manifest.
+
+    Returns:
+        Mapping of relative path to ``{"size", "mtime_ns", "sha256"}``.
+    """
+    files: Dict[str, Dict[str, Any]] = {}
+    base = root / subdir
+    if not base.is_dir():
+        return files
+    for dirpath, _dirnames, filenames in os.walk(base):
+        for name in filenames:
+            path = Path(dirpath) / name
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rel = path.relative_to(root).as_posix()
+            prev = previous.get(rel)
+            if (
+                prev is not None
+                and prev.get("size") == stat.st_size
+                and prev.get("mtime_ns") == stat.st_mtime_ns
+            ):
+                sha = prev.get("sha256")
+            else:
+                try:
+                    sha = file_sha256(path)
+                except OSError:
+                    continue
+            files[rel] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha,
+            }
+    return files
+
+
+def changed_files(
+    files: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> List[str]:
+    """Return the paths whose content is not in ``baseline``."""
+    return sorted(
+        rel
+        for rel, entry in files.items()
+        if baseline.get(rel, {}).get("sha256") != entry["sha256"]
+    )
+
+
+def plan(
+    root: Path,
+    subdir: str,
+    manifest_path: Path,
+    list_path: Path,
+    expected_sha256: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Write the delta file list and the pending manifest for one workload.
+
+    Args:
+        root: Host output directory the archive is rooted at.
+        subdir: Workload directory below ``root``.
+        manifest_path: Committed manifest; the pending one sits next to it.
+        list_path: Receives the NUL-separated paths to transfer.
+        expected_sha256: SHA-256 of the controller's manifest copy.
+
+    Returns:
+        Summary with the number of changed files and whether the delta
+        had to fall back to a full transfer.
+    """
+    previous = load_manifest(manifest_path)
+    in_sync = bool(expected_sha256) and manifest_path.exists()
+    if in_sync:
+        in_sync = file_sha256(manifest_path) == expected_sha256
+    files = scan(root, subdir, previous)
+    delta = changed_files(files, previous if in_sync else {})
+
+    list_path.parent.mkdir(parents=True, exist_ok=True)
+    list_path.write_bytes(b"".join(rel.encode("utf-8") + b"\0" for rel in delta))
+    pending = _pending_path(manifest_path)
+    pending.parent.mkdir(parents=True, exist_ok=True)
+    pending.write_text(json.dumps({"files": files}, sort_keys=True), encoding="utf-8")
+    return {
+        "changed": len(delta),
+        "changed_bytes": sum(files[rel]["size"] for rel in delta),
+        "full": not in_sync,
+    }
+
+
+def commit(manifest_path: Path) -> bool:
+    """Promote the pending manifest; return False when there is none."""
+    pending = _pending_path(manifest_path)
+    if not pending.exists():
+        return False
+    os.replace(pending, manifest_path)
+    return True
+
+
+def _pending_path(manifest_path: Path) -> Path:
+    return manifest_path.with_name(manifest_path.name + _PENDING_SUFFIX)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    plan_parser = sub.add_parser("plan")
+    plan_parser.add_argument("--root", required=True, type=Path)
+    plan_parser.add_argument("--subdir", required=True)
+    plan_parser.add_argument("--manifest", required=True, type=Path)
+    plan_parser.add_argument("--list", required=True, type=Path)
+    plan_parser.add_argument("--expect", default="")
+    commit_parser = sub.add_parser("commit")
+    commit_parser.add_argument("--manifest", required=True, type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "plan":
+        summary = plan(
+            args.root,
+            args.subdir,
+            args.manifest,
+            args.list,
+            expected_sha256=args.expect or None,
+        )
+        print(json.dumps(summary))
+        return 0
+    commit(args.manifest)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from lb_common.api import MetricCollectionError, error_to_payload
-from lb_runner.services.results import collect_metrics
+from lb_runner.services.results import collect_metrics, collector_data_filename
 
 
 class CollectorCoordinator:
@@ -19,6 +19,33 @@ class CollectorCoordinator:
     def create_collectors(self, config: Any) -> list[Any]:
         return cast(list[Any], self._registry.create_collectors(config))
 
+    def enable_spill(
+        self,
+        collectors: list[Any],
+        config: Any,
+        rep_dir: Path,
+        test_name: str,
+        repetition: int,
+        logger: logging.Logger,
+    ) -> None:
+        """Point collectors at their per-repetition CSV for incremental spill."""
+        settings = config.collectors
+        if settings.spill_to_disk is not True:
+            return
+        for collector in collectors:
+            enable = getattr(collector, "enable_spill", None)
+            if not callable(enable):
+                continue
+            name = getattr(collector, "name", "unknown")
+            try:
+                enable(
+                    rep_dir / collector_data_filename(test_name, repetition, name),
+                    flush_samples=settings.spill_flush_samples,
+                    flush_interval_seconds=settings.spill_flush_interval_seconds,
+                )
+            except Exception:
+                logger.exception("Failed to enable spill for collector %s", name)
+
     def start(self, collectors: list[Any], logger: logging.Logger) -> None:
         errors: list[MetricCollectionError] = []
         for collector in collectors:
@@ -7,24 +7,30 @@ from typing import Any
 
 from lb_plugins.api import WorkloadPlugin
 from lb_runner.services.results import (
+    DateTimeEncoder,
     export_plugin_results,
-    merge_result_entries,
     merge_results,
     persist_rep_result,
     persist_results,
 )
+from lb_runner.services.results_log import ResultsLog, results_log_path
 
 
 class ResultPersister:
-    """Persist and export workload results for a run."""
+    """Persist and export workload results for a run.
+
+    Repetition results are appended to a per-workload JSONL journal as they
+    arrive; the ``<workload>_results.json`` array is only materialized when
+    the workload is finalized (``export_results=True``).
+    """
 
     def __init__(self, run_id: str | None = None) -> None:
         self._run_id = run_id or ""
-        self._merged_results: dict[Path, list[dict[str, Any]]] = {}
+        self._logs: dict[Path, ResultsLog] = {}
 
     def set_run_id(self, run_id: str | None) -> None:
         self._run_id = run_id or ""
-        self._merged_results.clear()
+        self._logs.clear()
 
     def persist_rep_result(self, rep_dir: Path, result: dict[str, Any]) -> None:
         persist_rep_result(rep_dir, result)
@@ -39,29 +45,30 @@ class ResultPersister:
         export_results: bool = True,
     ) -> None:
         results_file = target_root / f"{test_name}_results.json"
-        merged_results = self._merge_results(results_file, results)
+        log = self._log(results_file)
+        log.append(results)
+        if not export_results:
+            return
+
+        merged_results = merge_results(results_file, [])
+        self._logs.pop(results_file, None)
         if not merged_results and not results_file.exists():
-            self._merged_results.pop(results_file, None)
+            log.clear()
             return
 
         persist_results(results_file, merged_results)
-        if export_results:
-            export_plugin_results(
-                plugin,
-                merged_results,
-                target_root,
-                test_name,
-                self._run_id,
-            )
-            self._merged_results.pop(results_file, None)
+        log.clear()
+        export_plugin_results(
+            plugin,
+            merged_results,
+            target_root,
+            test_name,
+            self._run_id,
+        )
 
-    def _merge_results(
-        self, results_file: Path, new_results: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        cached = self._merged_results.get(results_file)
-        if cached is None:
-            merged = merge_results(results_file, new_results)
-        else:
-            merged = merge_result_entries(cached, new_results)
-        self._merged_results[results_file] = merged
-        return merged
+    def _log(self, results_file: Path) -> ResultsLog:
+        log = self._logs.get(results_file)
+        if log is None:
+            log = ResultsLog(results_log_path(results_file), encoder=DateTimeEncoder)
+            self._logs[results_file] = log
+        return log
@@ -7,7 +7,9 @@ import logging
 from datetime import datetime
 from json import JSONEncoder
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+
+import pandas as pd
 
 from lb_common.api import (
     MetricCollectionError,
@@ -15,6 +17,11 @@ from lb_common.api import (
     error_to_payload,
 )
 from lb_plugins.api import WorkloadPlugin
+from lb_runner.metric_collectors._base_collector import (
+    BaseCollector,
+    summarize_samples,
+)
+from lb_runner.services.results_log import ResultsLog, results_log_path
 
 
 logger = logging.getLogger(__name__)
@@ -67,6 +74,58 @@ def is_generator_success(gen_result: Any) -> bool:
     return gen_result in (None, 0, True)
 
 
+def collector_data_filename(test_name: str, repetition: int, name: str) -> str:
+    """Return the per-repetition CSV filename for a collector's samples."""
+    return f"{test_name}_rep{repetition}_{name}.csv"
+
+
+def build_metrics_reference(
+    sample_count: int,
+    stats: dict[str, dict[str, float]],
+    samples_file: str | None,
+) -> dict[str, Any]:
+    """Describe a collector's samples without embedding them in the result.
+
+    ``samples_file`` is relative to the workload directory (the one holding
+    ``<workload>_results.json``) so the reference survives artifact collection.
+    """
+    summary = {
+        column: {
+            stat: (None if pd.isna(value) else float(value))
+            for stat, value in column_stats.items()
+        }
+        for column, column_stats in stats.items()
+    }
+    return {
+        "samples_file": samples_file,
+        "format": "csv",
+        "sample_count": sample_count,
+        "summary": summary,
+    }
+
+
+def _collector_frame(collector: Any) -> pd.DataFrame:
+    get_dataframe = getattr(collector, "get_dataframe", None)
+    if callable(get_dataframe):
+        return cast(pd.DataFrame, get_dataframe())
+    return pd.DataFrame(collector.get_data())
+
+
+def _collector_summary(collector: Any) -> tuple[int, dict[str, dict[str, float]]]:
+    # Spilling collectors summarize their CSV without loading the whole run.
+    if isinstance(collector, BaseCollector):
+        return collector.get_sample_summary()
+    samples = _collector_frame(collector)
+    return len(samples), summarize_samples(samples)
+
+
+def _relative_samples_path(path: Path, workload_dir: Path) -> str:
+    try:
+        return path.relative_to(workload_dir).as_posix()
+    except ValueError:
+        return str(path)
+
+
 def collect_metrics(
     collectors: list[Any],
     workload_dir: Path,
@@ -79,8 +138,7 @@ def collect_metrics(
     for collector in collectors:
         name = getattr(collector, "name", "unknown")
         try:
-            collector_data = collector.get_data()
-            result["metrics"][name] = collector_data
+            sample_count, stats = _collector_summary(collector)
         except Exception as exc:
             logger.exception("Collector %s failed to return metrics", name)
             error = MetricCollectionError(
@@ -91,8 +149,8 @@ def collect_metrics(
             metric_errors.append(error_to_payload(error))
             continue
 
-        filename = f"{test_name}_rep{repetition}_{name}.csv"
-        rep_filepath = rep_dir / filename
+        rep_filepath = rep_dir / collector_data_filename(test_name, repetition, name)
+        samples_file: str | None = _relative_samples_path(rep_filepath, workload_dir)
         try:
             collector.save_data(rep_filepath)
         except Exception as exc:
@@ -103,6 +161,10 @@ def collect_metrics(
                 cause=exc,
             )
             metric_errors.append(error_to_payload(error))
+            samples_file = None
+        result["metrics"][name] = build_metrics_reference(
+            sample_count, stats, samples_file
+        )
 
         get_errors = getattr(collector, "get_errors", None)
         if callable(get_errors):
@@ -142,6 +204,7 @@ def merge_results(
     results_file: Path,
     new_results: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
+    """Merge the materialized results, their pending journal and new entries."""
     merged: list[dict[str, Any]] = []
     if results_file.exists():
         try:
@@ -151,7 +214,8 @@ def merge_results(
         except Exception:
             merged = []
 
-    return merge_result_entries(merged, new_results)
+    pending = ResultsLog(results_log_path(results_file)).entries()
+    return merge_result_entries(merged, pending + new_results)
 
 
 def merge_result_entries(
@@ -0,0 +1,108 @@
+"""Append-only JSONL journal of repetition results for a workload."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
+
+logger = logging.getLogger(__name__)
+
+_TAIL_BLOCK_SIZE = 4096
+
+
+def results_log_path(results_file: Path) -> Path:
+    """Return the JSONL journal that sits next to ``<workload>_results.json``."""
+    return results_file.with_suffix(".jsonl")
+
+
+class ResultsLog:
+    """Append-only results journal.
+
+    Each entry is written as one compact JSON line, so recording a repetition
+    costs a single append regardless of how many entries came before.
+    """
+
+    def __init__(self, path: Path, encoder: type[json.JSONEncoder] | None = None):
+        self.path = path
+        self._encoder = encoder
+
+    def append(self, entries: list[dict[str, Any]]) -> None:
+        """Append entries and fsync so a crash keeps completed repetitions."""
+        if not entries:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._repair_tail()
+        with self.path.open("ab") as handle:
+            for entry in entries:
+                line = json.dumps(entry, cls=self._encoder, separators=(",", ":"))
+                handle.write(line.encode("utf-8") + b"\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return every entry in append order."""
+        return [entry for _, entry in self._scan()]
+
+    def clear(self) -> None:
+        """Delete the journal once its entries have been materialized."""
+        self.path.unlink(missing_ok=True)
+
+    def _repair_tail(self) -> None:
+        """Drop a torn last line so the next append starts on a fresh line.
+
+        Without this a line left half-written by a crash would swallow the
+        first entry appended after it.
+        """
+        if not self.path.exists():
+            return
+        with self.path.open("r+b") as handle:
+            end = handle.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            handle.seek(end - 1)
+            if handle.read(1) == b"\n":
+                return
+            keep = _last_line_end(handle, end)
+            logger.warning(
+                "Dropping torn trailing line at offset %s in %s", keep, self.path
+            )
+            handle.truncate(keep)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _scan(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as handle:
+            offset = 0
+            for raw in handle:
+                line_offset = offset
+                offset += len(raw)
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    # A torn trailing line means the writer died mid-append.
+                    logger.warning(
+                        "Skipping unreadable line at offset %s in %s",
+                        line_offset,
+                        self.path,
+                    )
+                    continue
+                if isinstance(entry, dict):
+                    yield line_offset, entry
+
+
+def _last_line_end(handle: BinaryIO, end: int) -> int:
+    """Return the offset just past the last newline before ``end``."""
+    position = end
+    while position > 0:
+        start = max(0, position - _TAIL_BLOCK_SIZE)
+        handle.seek(start)
+        newline = handle.read(position - start).rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        position = start
+    return 0
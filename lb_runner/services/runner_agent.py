@@ -0,0 +1,279 @@
+"""Resident runner agent that keeps plugin and collector registries warm.
+
+Launching ``uv run python -m lb_runner.services.async_localrunner`` for every
+repetition pays for uv resolution, interpreter startup, plugin discovery and
+collector discovery each time. The agent pays those once: it loads both
+registries, listens on a local UNIX socket and forks a child per submitted
+repetition. The child runs the regular ``async_localrunner.main`` with the
+submitted environment, so the pid, status and STOP files keep their usual
+meaning and Ansible waits on them exactly as it does for a daemonized runner.
+
+Usage::
+
+    python -m lb_runner.services.runner_agent start --socket PATH
+    python -m lb_runner.services.runner_agent submit --socket PATH
+    python -m lb_runner.services.runner_agent stop --socket PATH
+
+``submit`` forwards the caller's ``LB_*`` environment and working directory,
+and exits with ``EXIT_UNAVAILABLE`` when no agent answers so callers can fall
+back to a one-shot runner.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+EXIT_UNAVAILABLE = 3
+DEFAULT_IDLE_TIMEOUT_SECONDS = 6 * 3600.0
+_START_TIMEOUT_SECONDS = 30.0
+_REQUEST_TIMEOUT_SECONDS = 10.0
+_ENV_PREFIX = "LB_"
+# Set by async_localrunner's own daemonization; the agent already detaches.
+_DROPPED_ENV = ("LB_RUN_DAEMONIZE",)
+
+
+class AgentUnavailable(RuntimeError):
+    """Raised when no agent is listening on the socket."""
+
+
+def request(
+    socket_path: Path,
+    payload: Dict[str, Any],
+    timeout: float = _REQUEST_TIMEOUT_SECONDS,
+) -> Dict[str, Any]:
+    """Send one request to the agent and return its reply."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        try:
+            client.connect(str(socket_path))
+        except OSError as exc:
+            raise AgentUnavailable(str(exc)) from exc
+        client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        reply = client.makefile("rb").readline()
+    finally:
+        client.close()
+    if not reply:
+        raise AgentUnavailable("agent closed the connection")
+    return dict(json.loads(reply))
+
+
+class RunnerAgent:
+    """Serve repetition requests from a warm interpreter."""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        Args:
+            socket_path: UNIX socket to listen on.
+            idle_timeout: Exit after this many seconds without a request.
+        """
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.collector_registry: Any = None
+        self._running = False
+        self._server: Optional[socket.socket] = None
+        self._conn: Optional[socket.socket] = None
+
+    def warm_up(self) -> None:
+        """Import plugins and collectors once so forked children inherit them."""
+        from lb_plugins.api import create_registry
+        from lb_runner.metric_collectors.builtin import builtin_collectors
+        from lb_runner.metric_collectors.registry import CollectorRegistry
+        import lb_runner.services.async_localrunner  # noqa: F401
+
+        create_registry().available(load_entrypoints=True)
+        self.collector_registry = CollectorRegistry(builtin_collectors())
+        self.collector_registry.available(load_entrypoints=True)
+
+    def serve(self) -> None:
+        """Accept requests until asked to stop or idle for too long."""
+        self.warm_up()
+        # Children are detached runs; let the kernel reap them.
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server = server
+        inode = None
+        try:
+            server.bind(str(self.socket_path))
+            inode = self.socket_path.stat().st_ino
+            os.chmod(self.socket_path, 0o600)
+            server.listen()
+            server.settimeout(self.idle_timeout)
+            self._running = True
+            while self._running:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break
+                with conn:
+                    self._conn = conn
+                    self._handle(conn)
+                    self._conn = None
+        finally:
+            server.close()
+            self._remove_socket(inode)
+
+    def _remove_socket(self, inode: Optional[int]) -> None:
+        # A replacement agent may already be listening on the same path.
+        try:
+            if inode is not None and self.socket_path.stat().st_ino == inode:
+                self.socket_path.unlink()
+        except OSError:
+            pass
+
+    def _handle(self, conn: socket.socket) -> None:
+        conn.settimeout(_REQUEST_TIMEOUT_SECONDS)
+        try:
+            raw = conn.makefile("rb").readline()
+            message = json.loads(raw)
+            reply = self._dispatch(message)
+        except Exception as exc:  # noqa: BLE001
+            reply = {"ok": False, "error": str(exc)}
+        try:
+            conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+
+    def _dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "shutdown":
+            self._running = False
+            return {"ok": True}
+        if op == "run":
+            env = {str(k): str(v) for k, v in (message.get("env") or {}).items()}
+            pid = self._spawn(env, message.get("cwd"))
+            return {"ok": True, "pid": pid}
+        raise ValueError(f"Unknown agent request: {op!r}")
+
+    def _spawn(self, env: Dict[str, str], cwd: Optional[str]) -> int:
+        """Fork a child that runs one repetition and record its pid."""
+        pid_path_raw = env.get("LB_RUN_PID_PATH")
+        pid = os.fork()
+        if pid == 0:
+            self._run_child(env, cwd)
+        if pid_path_raw:
+            pid_path = Path(pid_path_raw)
+            pid_path.parent.mkdir(parents=True, exist_ok=True)
+            pid_path.write_text(str(pid))
+        return pid
+
+    def _run_child(self, env: Dict[str, str], cwd: Optional[str]) -> None:
+        rc = 1
+        try:
+            for inherited in (self._server, self._conn):
+                if inherited is not None:
+                    inherited.close()
+            os.setsid()
+            # The runner waits on its own subprocesses.
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            if cwd:
+                os.chdir(cwd)
+            for name in _DROPPED_ENV:
+                env.pop(name, None)
+            os.environ.update(env)
+            from lb_runner.services import async_localrunner
+
+            rc = async_localrunner.main(collector_registry=self.collector_registry)
+        finally:
+            os._exit(rc)
+
+
+def start_agent(
+    socket_path: Path,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+) -> int:
+    """Replace any running agent with a fresh one and wait until it answers."""
+    try:
+        request(socket_path, {"op": "shutdown"})
+    except AgentUnavailable:
+        pass
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "lb_runner.services.runner_agent",
+            "serve",
+            "--socket",
+            str(socket_path),
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+    deadline = time.monotonic() + _START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            break
+        try:
+            reply = request(socket_path, {"op": "ping"})
+        except AgentUnavailable:
+            time.sleep(0.1)
+            continue
+        if reply.get("pid") == proc.pid:
+            return 0
+        time.sleep(0.1)
+    sys.stderr.write(f"Runner agent did not start on {socket_path}\n")
+    return 1
+
+
+def submit(socket_path: Path) -> int:
+    """Hand the current LB_* environment to the agent as one repetition."""
+    env = {k: v for k, v in os.environ.items() if k.startswith(_ENV_PREFIX)}
+    try:
+        reply = request(socket_path, {"op": "run", "env": env, "cwd": os.getcwd()})
+    except AgentUnavailable as exc:
+        sys.stderr.write(f"Runner agent unavailable: {exc}\n")
+        return EXIT_UNAVAILABLE
+    if not reply.get("ok"):
+        sys.stderr.write(f"Runner agent error: {reply.get('error')}\n")
+        return 1
+    print(json.dumps(reply))
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["serve", "start", "submit", "stop"])
+    parser.add_argument("--socket", required=True, type=Path)
+    parser.add_argument(
+        "--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT_SECONDS
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        RunnerAgent(args.socket, idle_timeout=args.idle_timeout).serve()
+        return 0
+    if args.command == "start":
+        return start_agent(args.socket, idle_timeout=args.idle_timeout)
+    if args.command == "submit":
+        return submit(args.socket)
+    try:
+        request(args.socket, {"op": "shutdown"})
+    except AgentUnavailable:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
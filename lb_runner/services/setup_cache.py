@@ -0,0 +1,124 @@
+"""Setup cache marker that lets repeated runs skip the host install.
+
+Global setup uploads the library sources, installs APT packages and runs
+``uv sync`` on every host. The controller hashes everything that install
+depends on (the uploaded sources, which include the setup playbook itself,
+uv extras and collector APT packages) into a setup hash. After a successful
+install the host records that hash and its ``setup_fingerprint`` in
+``<lb_workdir>/.lb_setup.json``; the next setup skips upload, APT and uv when
+both still match.
+
+Usage::
+
+    python -m lb_runner.services.setup_cache check --marker PATH --hash HASH
+    python -m lb_runner.services.setup_cache write --marker PATH --hash HASH
+
+``check`` exits 0 on a cache hit and ``EXIT_MISS`` otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from lb_runner.services.source_sync import file_sha256, iter_files
+from lb_runner.services.system_info_collectors import setup_fingerprint
+
+MARKER_NAME = ".lb_setup.json"
+EXIT_MISS = 1
+# Keep in sync with the archive built by the global setup playbook.
+SOURCE_PATHS = (
+    "lb_app",
+    "lb_analytics",
+    "lb_common",
+    "lb_controller",
+    "lb_plugins",
+    "lb_provisioner",
+    "lb_runner",
+    "lb_ui",
+    "pyproject.toml",
+    "README.md",
+    "uv.lock",
+)
+
+
+def setup_hash(
+    root: Path,
+    *,
+    uv_extras: Iterable[str] = (),
+    apt_packages: Iterable[str] = (),
+    paths: Iterable[str] = SOURCE_PATHS,
+) -> str:
+    """
+    Return the hex SHA-256 of everything a host install depends on.
+
+    Args:
+        root: Source root the setup archive is built from.
+        uv_extras: Extras passed to ``uv sync``.
+        apt_packages: Collector APT packages installed during setup.
+        paths: Files and directories below ``root`` that are uploaded.
+    """
+    digest = hashlib.sha256()
+    settings = {
+        "uv_extras": sorted(set(uv_extras)),
+        "apt_packages": sorted(set(apt_packages)),
+    }
+    digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    for path in iter_files(root, paths):
+        digest.update(b"\0" + path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(b"\0" + file_sha256(path).encode("ascii"))
+    return digest.hexdigest()
+
+
+def read_marker(marker_path: Path) -> Dict[str, Any]:
+    """Return the recorded marker, or an empty dict if it is unreadable."""
+    try:
+        data = json.loads(marker_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def is_current(marker_path: Path, expected_hash: str) -> bool:
+    """Return True when the marker matches the setup hash and this host."""
+    marker = read_marker(marker_path)
+    return (
+        bool(expected_hash)
+        and marker.get("setup_hash") == expected_hash
+        and marker.get("fingerprint") == setup_fingerprint()
+    )
+
+
+def write_marker(marker_path: Path, expected_hash: str) -> None:
+    """Record a completed install for ``expected_hash`` on this host."""
+    marker_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = marker_path.with_name(marker_path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {"setup_hash": expected_hash, "fingerprint": setup_fingerprint()},
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, marker_path)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["check", "write"])
+    parser.add_argument("--marker", required=True, type=Path)
+    parser.add_argument("--hash", required=True, dest="setup_hash")
+    args = parser.parse_args(argv)
+
+    if args.command == "check":
+        return 0 if is_current(args.marker, args.setup_hash) else EXIT_MISS
+    write_marker(args.marker, args.setup_hash)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
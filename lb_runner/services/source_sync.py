@@ -0,0 +1,277 @@
+"""Content-addressed upload of the benchmark library sources.
+
+The controller describes the source tree as a manifest of
+``path -> (sha256, size, mode)``. Every host keeps the file contents it has
+received in a blob store under ``lb_workdir`` keyed by SHA-256, reports the
+blobs it lacks, and receives a tar.gz holding only those files. ``apply``
+then moves them into the store and rewrites the files of the working tree
+that changed since the last applied manifest.
+
+This file only uses the standard library and runs as a plain script, because
+the host side runs before the library is installed there. The hashing and
+manifest helpers are shared from here with ``setup_cache`` and
+``collect_manifest``.
+
+Usage::
+
+    source_sync.py manifest --root DIR --out MANIFEST PATH [PATH ...]
+    source_sync.py missing --store DIR --manifest MANIFEST --list PATH
+    source_sync.py apply --store DIR --manifest MANIFEST --dest DIR
+        [--archive TAR_GZ]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tarfile
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+APPLIED_MANIFEST_NAME = ".lb_src_manifest.json"
+_SKIPPED_DIRS = {"__pycache__"}
+_SKIPPED_SUFFIXES = (".pyc", ".pyo")
+_CHUNK_SIZE = 1 << 20
+
+
+class SourceSyncError(RuntimeError):
+    """Raised when the store cannot provide the files of a manifest."""
+
+
+def iter_files(root: Path, paths: Iterable[str]) -> Iterator[Path]:
+    """Yield the files below ``root/<path>`` in a stable order."""
+    for rel in sorted(paths):
+        path = root / rel
+        if path.is_file():
+            yield path
+            continue
+        if not path.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(d for d in dirnames if d not in _SKIPPED_DIRS)
+            for name in sorted(filenames):
+                if not name.endswith(_SKIPPED_SUFFIXES):
+                    yield Path(dirpath) / name
+
+
+def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(root: Path, paths: Iterable[str]) -> Dict[str, Any]:
+    """Describe every source file below ``root`` that setup uploads."""
+    files: Dict[str, Dict[str, Any]] = {}
+    for path in iter_files(root, paths):
+        info = path.stat()
+        files[path.relative_to(root).as_posix()] = {
+            "sha256": file_sha256(path),
+            "size": info.st_size,
+            "mode": stat.S_IMODE(info.st_mode),
+        }
+    return {"files": files}
+
+
+def load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return the file entries of a manifest, or an empty dict if unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    files = data.get("files") if isinstance(data, dict) else None
+    return files if isinstance(files, dict) else {}
+
+
+def blob_path(store: Path, sha256: str) -> Path:
+    return store / sha256[:2] / sha256
+
+
+def missing_files(store: Path, files: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Return one path per blob of ``files`` that the store does not hold."""
+    wanted: Dict[str, str] = {}
+    for rel in sorted(files):
+        sha = files[rel]["sha256"]
+        if sha not in wanted and not blob_path(store, sha).is_file():
+            wanted[sha] = rel
+    return sorted(wanted.values())
+
+
+def ingest_archive(
+    store: Path, archive: Path, files: Dict[str, Dict[str, Any]]
+) -> int:
+    """
+    Move the files of a tar.gz into the store, verifying their content.
+
+    Returns:
+        Number of blobs added.
+    """
+    added = 0
+    with tarfile.open(archive, "r|gz") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            entry = files.get(member.name)
+            if entry is None:
+                raise SourceSyncError(f"Unexpected file in archive: {member.name}")
+            source = tar.extractfile(member)
+            if source is None:
+                continue
+            _store_blob(store, entry["sha256"], source, member.name)
+            added += 1
+    return added
+
+
+def _store_blob(store: Path, sha256: str, source: IO[bytes], name: str) -> None:
+    target = blob_path(store, sha256)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    digest = hashlib.sha256()
+    with tmp.open("wb") as handle:
+        for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            handle.write(chunk)
+    if digest.hexdigest() != sha256:
+        tmp.unlink()
+        raise SourceSyncError(f"Content of {name} does not match the manifest")
+    os.replace(tmp, target)
+
+
+def apply_manifest(
+    store: Path,
+    manifest_path: Path,
+    dest: Path,
+    archive: Optional[Path] = None,
+) -> Dict[str, int]:
+    """
+    Bring ``dest`` in line with a manifest using the blob store.
+
+    Files are only rewritten when their entry changed since the last applied
+    manifest or they went missing; files the previous manifest tracked and
+    the new one drops are removed. Blobs no manifest entry refers to are
+    pruned from the store afterwards.
+
+    Args:
+        store: Blob store directory.
+        manifest_path: Manifest to apply.
+        dest: Working tree (``lb_workdir``).
+        archive: Optional tar.gz with the blobs the store was missing.
+
+    Returns:
+        Counts of added blobs, written, removed and pruned files.
+    """
+    files = load_manifest(manifest_path)
+    if not files:
+        raise SourceSyncError(f"Empty or unreadable manifest: {manifest_path}")
+    added = ingest_archive(store, archive, files) if archive else 0
+    still_missing = missing_files(store, files)
+    if still_missing:
+        raise SourceSyncError(f"Store lacks {len(still_missing)} file(s)")
+
+    applied_path = dest / APPLIED_MANIFEST_NAME
+    previous = load_manifest(applied_path)
+    written = 0
+    for rel, entry in files.items():
+        target = dest / rel
+        if previous.get(rel) == entry and _size(target) == entry["size"]:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".lb-tmp")
+        shutil.copyfile(blob_path(store, entry["sha256"]), tmp)
+        os.chmod(tmp, int(entry.get("mode", 0o644)))
+        os.replace(tmp, target)
+        written += 1
+    removed = 0
+    for rel in set(previous) - set(files):
+        try:
+            (dest / rel).unlink()
+            removed += 1
+        except OSError:
+            pass
+    shutil.copyfile(manifest_path, applied_path)
+    return {
+        "added": added,
+        "written": written,
+        "removed": removed,
+        "pruned": _prune(store, {entry["sha256"] for entry in files.values()}),
+    }
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return -1
+
+
+def _prune(store: Path, keep: set[str]) -> int:
+    pruned = 0
+    if not store.is_dir():
+        return pruned
+    for bucket in store.iterdir():
+        if not bucket.is_dir():
+            continue
+        for blob in bucket.iterdir():
+            if blob.name not in keep:
+                blob.unlink()
+                pruned += 1
+    return pruned
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    manifest_parser = sub.add_parser("manifest")
+    manifest_parser.add_argument("--root", required=True, type=Path)
+    manifest_parser.add_argument("--out", required=True, type=Path)
+    manifest_parser.add_argument("paths", nargs="+")
+    missing_parser = sub.add_parser("missing")
+    missing_parser.add_argument("--store", required=True, type=Path)
+    missing_parser.add_argument("--manifest", required=True, type=Path)
+    missing_parser.add_argument("--list", required=True, type=Path)
+    apply_parser = sub.add_parser("apply")
+    apply_parser.add_argument("--store", required=True, type=Path)
+    apply_parser.add_argument("--manifest", required=True, type=Path)
+    apply_parser.add_argument("--dest", required=True, type=Path)
+    apply_parser.add_argument("--archive", type=Path)
+    args = parser.parse_args(argv)
+
+    if args.command == "manifest":
+        manifest = build_manifest(args.root, args.paths)
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(manifest, sort_keys=True), encoding="utf-8")
+        print(json.dumps({"files": len(manifest["files"])}))
+        return 0
+    if args.command == "missing":
+        files = load_manifest(args.manifest)
+        missing = missing_files(args.store, files)
+        args.list.parent.mkdir(parents=True, exist_ok=True)
+        args.list.write_bytes(b"".join(rel.encode("utf-8") + b"\0" for rel in missing))
+        print(
+            json.dumps(
+                {
+                    "missing": len(missing),
+                    "missing_bytes": sum(files[rel]["size"] for rel in missing),
+                }
+            )
+        )
+        return 0
+    try:
+        summary = apply_manifest(args.store, args.manifest, args.dest, args.archive)
+    except (SourceSyncError, OSError, tarfile.TarError) as exc:
+        sys.stderr.write(f"{exc}\n")
+        return 1
+    print(json.dumps(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -352,6 +352,26 @@ def _calculate_fingerprint(info: SystemInfo) -> str:
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
+def setup_fingerprint() -> str:
+    """
+    Hash the host properties that a benchmark library install depends on.
+
+    Unlike ``_calculate_fingerprint`` this leaves out volatile data (free
+    memory, running services) and skips the slow collectors, so it is cheap
+    and stays equal across runs on an unchanged host.
+    """
+    uname = platform.uname()
+    os_release = _read_os_release()
+    data = {
+        "os": {key: os_release.get(key, "") for key in ("ID", "VERSION_ID")},
+        "kernel": {"release": uname.release, "version": uname.version},
+        "machine": uname.machine,
+        "system": uname.system,
+    }
+    canonical = json.dumps(data, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 def collect_system_info() -> SystemInfo:
     """Collect system information into a structured dataclass."""
     now = datetime.now(timezone.utc).isoformat()
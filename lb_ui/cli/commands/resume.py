@@ -53,9 +53,8 @@ def register_resume_command(app: typer.Typer, ctx: UIContext) -> None:
                 return "unknown", False, f"Journal error: {exc}", run_info.workloads
             if not journal.tasks:
                 return "unknown", False, "Journal has no tasks", run_info.workloads
-            pending = any(
-                task.status != RunStatus.COMPLETED for task in journal.tasks.values()
-            )
+            completed = journal.status_counts().get(RunStatus.COMPLETED, 0)
+            pending = completed < len(journal.tasks)
             if pending:
                 return (
                     "incomplete",
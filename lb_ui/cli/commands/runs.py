@@ -182,6 +182,13 @@ def create_runs_app(ctx: UIContext) -> typer.Typer:
             "-c",
             help="Config file to infer output/report/export roots.",
         ),
+        workers: int = typer.Option(
+            1,
+            "--workers",
+            "-j",
+            min=1,
+            help="Worker processes to aggregate hosts/workloads in parallel.",
+        ),
     ) -> None:
         """Run analytics on an existing benchmark run."""
         cfg, _, _ = ctx.config_service.load_for_read(config)
@@ -246,6 +253,7 @@ def create_runs_app(ctx: UIContext) -> typer.Typer:
             kind="aggregate",
             hosts=selected_hosts,
             workloads=selected_workloads,
+            workers=workers,
         )
         with ctx.ui.progress.status(
             f"Running analytics '{selected_kind}' on {run.run_id}"
@@ -118,14 +118,16 @@ class TestRealBenchmarkIntegration(unittest.TestCase):
         # Verify metrics were collected
         self.assertIn("PSUtilCollector", result["metrics"])
         psutil_metrics = result["metrics"]["PSUtilCollector"]
-        self.assertIsInstance(psutil_metrics, list)
-        self.assertGreater(len(psutil_metrics), 0)
-
-        # Verify metric data structure
-        for metric in psutil_metrics:
-            self.assertIn("timestamp", metric)
-            self.assertIn("cpu_percent", metric)
-            self.assertIn("memory_usage", metric)
+        self.assertIsInstance(psutil_metrics, dict)
+        self.assertGreater(psutil_metrics["sample_count"], 0)
+        self.assertIn("cpu_percent", psutil_metrics["summary"])
+        self.assertIn("memory_usage", psutil_metrics["summary"])
+
+        # Verify the referenced samples file carries the raw metric data
+        samples_path = workload_dir / psutil_metrics["samples_file"]
+        header = samples_path.read_text().splitlines()[0]
+        self.assertIn("timestamp", header)
+        self.assertIn("cpu_percent", header)
 
         # Aggregated CSVs are no longer produced by the runner; analytics runs via UI/CLI.
 
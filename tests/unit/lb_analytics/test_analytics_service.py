@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from lb_analytics.api import AnalyticsRequest, AnalyticsService
+from lb_common.api import RunInfo
+
+pytestmark = pytest.mark.unit_analytics
+
+
+def _make_run(tmp_path: Path, hosts: list[str], workloads: list[str]) -> RunInfo:
+    for host in hosts:
+        for workload in workloads:
+            workload_dir = tmp_path / host / workload
+            workload_dir.mkdir(parents=True)
+            results = [
+                {
+                    "repetition": 1,
+                    "metrics": {
+                        "CLICollector": [
+                            {"timestamp": "2024-01-01T00:00:00", "foo": 1},
+                            {"timestamp": "2024-01-01T00:00:01", "foo": 3},
+                        ]
+                    },
+                    "start_time": None,
+                    "end_time": None,
+                }
+            ]
+            (workload_dir / f"{workload}_results.json").write_text(json.dumps(results))
+    return RunInfo(
+        run_id="run-1",
+        output_root=tmp_path,
+        report_root=None,
+        data_export_root=None,
+        hosts=hosts,
+        workloads=workloads,
+        created_at=None,
+        journal_path=None,
+    )
+
+
+def test_serial_run_follows_host_then_workload_order(tmp_path):
+    run = _make_run(tmp_path, ["h1", "h2"], ["fio", "dd"])
+
+    produced = AnalyticsService().run(AnalyticsRequest(run=run))
+
+    assert produced == [
+        tmp_path / "h1" / "exports" / "fio_aggregated.csv",
+        tmp_path / "h1" / "exports" / "dd_aggregated.csv",
+        tmp_path / "h2" / "exports" / "fio_aggregated.csv",
+        tmp_path / "h2" / "exports" / "dd_aggregated.csv",
+    ]
+    assert "foo_avg" in produced[0].read_text()
+
+
+def test_pooled_run_streams_every_artifact_once(tmp_path):
+    run = _make_run(tmp_path, ["h1", "h2", "h3"], ["fio"])
+    request = AnalyticsRequest(run=run, hosts=["h1", "h2", "h3", "h1"], workers=2)
+
+    produced = list(AnalyticsService().iter_run(request))
+
+    assert sorted(produced) == [
+        tmp_path / host / "exports" / "fio_aggregated.csv"
+        for host in ("h1", "h2", "h3")
+    ]
+
+
+def test_missing_results_are_skipped(tmp_path):
+    run = _make_run(tmp_path, ["h1"], ["fio"])
+    request = AnalyticsRequest(run=run, hosts=["h1", "ghost"], workloads=["fio", "dd"])
+
+    assert AnalyticsService().run(request) == [
+        tmp_path / "h1" / "exports" / "fio_aggregated.csv"
+    ]
@@ -39,3 +39,122 @@ def test_data_handler_uses_registered_aggregator():
     assert df is not None
     assert df.loc["total", "Repetition_1"] == 3
     assert called.get("df_type") is pd.DataFrame
+
+
+def test_data_handler_loads_samples_file_reference(tmp_path):
+    rep_dir = tmp_path / "rep1"
+    rep_dir.mkdir()
+    (rep_dir / "custom_rep1_CustomCollector.csv").write_text(
+        "timestamp,value,collector\n"
+        "2024-01-01T00:00:00,1,CustomCollector\n"
+        "2024-01-01T00:00:01,2,CustomCollector\n"
+        "2024-01-01T00:00:05,40,CustomCollector\n"
+    )
+
+    class _FakeCollector:
+        aggregator = staticmethod(lambda df: {"total": df["value"].sum()})
+
+    handler = DataHandler(collectors={"CustomCollector": _FakeCollector()})
+    results = [
+        {
+            "repetition": 1,
+            "metrics": {
+                "CustomCollector": {
+                    "samples_file": "rep1/custom_rep1_CustomCollector.csv",
+                    "format": "csv",
+                    "sample_count": 3,
+                    "summary": {},
+                }
+            },
+            "start_time": "2024-01-01T00:00:00",
+            "end_time": "2024-01-01T00:00:01",
+        }
+    ]
+
+    df = handler.process_test_results("custom", results, base_dir=tmp_path)
+
+    assert df is not None
+    assert df.loc["total", "Repetition_1"] == 3
+
+
+def test_data_handler_skips_missing_samples_file(tmp_path):
+    handler = DataHandler()
+    results = [
+        {
+            "repetition": 1,
+            "metrics": {
+                "PSUtilCollector": {
+                    "samples_file": "rep1/missing.csv",
+                    "sample_count": 3,
+                }
+            },
+            "start_time": None,
+            "end_time": None,
+        }
+    ]
+
+    df = handler.process_test_results("custom", results, base_dir=tmp_path)
+
+    assert df is not None
+    assert df.empty
+
+
+def test_data_handler_batches_repetitions_with_per_rep_windows():
+    def _samples(rep: int):
+        return [
+            {
+                "timestamp": f"2024-01-0{rep}T00:00:0{sec}",
+                "cpu_percent": float(10 * rep + sec),
+                "disk_read_bytes": 1024 * 1024 * sec * rep,
+            }
+            for sec in range(4)
+        ]
+
+    results = [
+        {
+            "repetition": rep,
+            "metrics": {"PSUtilCollector": _samples(rep)},
+            "start_time": f"2024-01-0{rep}T00:00:00",
+            "end_time": f"2024-01-0{rep}T00:00:02",
+        }
+        for rep in (1, 2, 3)
+    ]
+
+    df = DataHandler().process_test_results("psutil", results)
+
+    assert df is not None
+    assert list(df.columns) == ["Repetition_1", "Repetition_2", "Repetition_3"]
+    # The sample at second 3 falls outside every repetition's window.
+    assert df.loc["cpu_usage_percent_max"].tolist() == [12.0, 22.0, 32.0]
+    assert df.loc["cpu_usage_percent_avg", "Repetition_2"] == 21.0
+    assert df.loc["disk_read_mbps_avg"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_data_handler_keeps_per_repetition_calls_for_custom_aggregators():
+    calls = []
+
+    class _FakeCollector:
+        @staticmethod
+        def aggregator(df: pd.DataFrame):
+            calls.append(list(df.columns))
+            return {"total": df["value"].sum()}
+
+    results = [
+        {
+            "repetition": rep,
+            "metrics": {
+                "CustomCollector": [{"timestamp": "2024-01-01T00:00:00", "value": rep}]
+            },
+            "start_time": None,
+            "end_time": None,
+        }
+        for rep in (1, 2)
+    ]
+
+    df = DataHandler(
+        collectors={"CustomCollector": _FakeCollector()}
+    ).process_test_results("custom", results)
+
+    assert df is not None
+    assert df.loc["total"].tolist() == [1, 2]
+    assert calls == [["value"], ["value"]]
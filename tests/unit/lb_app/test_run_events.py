@@ -0,0 +1,112 @@
+"""Tests for JsonEventTailer file following."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from lb_app.services.run_events import JsonEventTailer
+
+pytestmark = pytest.mark.unit_ui
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.batches: list[list[dict[str, Any]]] = []
+        self._changed = threading.Condition()
+
+    def __call__(self, events: list[dict[str, Any]]) -> None:
+        with self._changed:
+            self.batches.append(events)
+            self._changed.notify_all()
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        return [event for batch in self.batches for event in batch]
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while len(self.events) < count:
+                remaining = deadline - time.monotonic()
+                assert remaining > 0, f"only got {self.events}"
+                self._changed.wait(remaining)
+
+
+def _line(rep: int) -> str:
+    return json.dumps({"repetition": rep}) + "\n"
+
+
+def _start(path: Path, use_inotify: bool) -> tuple[JsonEventTailer, _Collector]:
+    collector = _Collector()
+    tailer = JsonEventTailer(
+        path,
+        lambda _event: None,
+        poll_interval=0.01,
+        on_batch=collector,
+        use_inotify=use_inotify,
+    )
+    tailer.start()
+    return tailer, collector
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_tailer_skips_old_events_and_batches_new_lines(
+    tmp_path: Path, use_inotify: bool
+) -> None:
+    path = tmp_path / "events.jsonl"
+    path.write_text(_line(0))
+    tailer, collector = _start(path, use_inotify)
+    try:
+        with path.open("a") as handle:
+            handle.write(_line(1) + _line(2) + '{"repetition": ')
+        collector.wait_for(2)
+        with path.open("a") as handle:
+            handle.write("3}\n")
+        collector.wait_for(3)
+    finally:
+        tailer.stop()
+
+    assert [event["repetition"] for event in collector.events] == [1, 2, 3]
+    assert collector.batches[0] == [{"repetition": 1}, {"repetition": 2}]
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_tailer_follows_truncation_and_rotation(
+    tmp_path: Path, use_inotify: bool
+) -> None:
+    path = tmp_path / "events.jsonl"
+    tailer, collector = _start(path, use_inotify)
+    try:
+        path.write_text(_line(1) + _line(2))
+        collector.wait_for(2)
+        path.write_text(_line(3))
+        collector.wait_for(3)
+        rotated = tmp_path / "events.jsonl.new"
+        rotated.write_text(_line(4))
+        rotated.replace(path)
+        collector.wait_for(4)
+    finally:
+        tailer.stop()
+
+    assert [event["repetition"] for event in collector.events] == [1, 2, 3, 4]
+
+
+def test_tailer_stop_reads_pending_lines_and_returns_promptly(tmp_path: Path):
+    path = tmp_path / "events.jsonl"
+    path.write_text("")
+    events: list[dict[str, Any]] = []
+    tailer = JsonEventTailer(path, events.append)
+    tailer.start()
+    path.write_text(_line(1))
+
+    started = time.monotonic()
+    tailer.stop()
+
+    assert time.monotonic() - started < 1.0
+    assert events == [{"repetition": 1}]
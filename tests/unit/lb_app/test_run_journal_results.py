@@ -0,0 +1,52 @@
+"""Tests for rebuilding resume state from results files."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lb_app.services.run_journal import (
+    find_results_file,
+    load_results_entries,
+    results_exist_for_run,
+)
+
+
+pytestmark = pytest.mark.unit_ui
+
+
+def test_unfinalized_workload_is_read_from_its_results_log(tmp_path: Path) -> None:
+    workload_dir = tmp_path / "host1" / "stress_ng"
+    workload_dir.mkdir(parents=True)
+    (workload_dir / "stress_ng_results.jsonl").write_text(
+        json.dumps({"repetition": 1}) + "\n" + json.dumps({"repetition": 2}) + "\n"
+    )
+
+    results_file = find_results_file(tmp_path / "host1", "stress_ng")
+
+    assert results_file == workload_dir / "stress_ng_results.json"
+    assert results_exist_for_run(tmp_path)
+    assert [entry["repetition"] for entry in load_results_entries(results_file)] == [
+        1,
+        2,
+    ]
+
+
+def test_results_log_entries_extend_the_materialized_array(tmp_path: Path) -> None:
+    results_file = tmp_path / "stress_ng_results.json"
+    results_file.write_text(json.dumps([{"repetition": 1, "status": "old"}]))
+    (tmp_path / "stress_ng_results.jsonl").write_text(
+        json.dumps({"repetition": 1, "status": "new"})
+        + "\n"
+        + json.dumps({"repetition": 2})
+        + "\n"
+    )
+
+    entries = load_results_entries(results_file)
+
+    assert [(entry["repetition"], entry.get("status")) for entry in entries] == [
+        (1, "new"),
+        (2, None),
+    ]
@@ -1,3 +1,4 @@
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -90,3 +91,204 @@ def test_log_sink_records_error_type(tmp_path):
     task = saved.get_task("localhost", "geekbench", 1)
     assert task.error_type == "WorkloadError"
     assert task.error_context == {"detail": "x"}
+
+
+def _seeded_journal(run_id: str, repetitions: int) -> RunJournal:
+    return RunJournal.initialize(
+        run_id,
+        SimpleNamespace(
+            remote_hosts=[SimpleNamespace(name="localhost")],
+            repetitions=repetitions,
+            workloads={"geekbench": SimpleNamespace()},
+            plugin_settings={},
+            collectors=None,
+        ),
+        ["geekbench"],
+    )
+
+
+def _event(run_id: str, rep: int, status: str) -> RunEvent:
+    return RunEvent(
+        run_id=run_id,
+        host="localhost",
+        workload="geekbench",
+        repetition=rep,
+        total_repetitions=3,
+        status=status,
+        message="",
+    )
+
+
+def test_log_sink_appends_transitions_to_wal_between_snapshots(tmp_path):
+    journal = _seeded_journal("run-3", 3)
+    journal_path = tmp_path / "run_journal.json"
+    journal.save(journal_path)
+    snapshot = journal_path.read_text()
+    sink = LogSink(journal, journal_path, compact_interval_seconds=3600)
+
+    sink.emit(_event("run-3", 1, "running"))
+    sink.emit(_event("run-3", 1, "done"))
+    sink.emit(_event("run-3", 2, "running"))
+
+    # The snapshot is untouched; transitions live in the WAL.
+    assert journal_path.read_text() == snapshot
+    wal_path = tmp_path / "run_journal.wal"
+    assert len(wal_path.read_text().splitlines()) == 3
+    replayed = RunJournal.load(journal_path)
+    assert replayed.get_task("localhost", "geekbench", 1).status == RunStatus.COMPLETED
+    assert replayed.get_task("localhost", "geekbench", 2).status == RunStatus.RUNNING
+
+    sink.close()
+
+    assert wal_path.read_text() == ""
+    saved = RunJournal.load(journal_path)
+    assert saved.get_task("localhost", "geekbench", 2).status == RunStatus.RUNNING
+
+
+def test_log_sink_compacts_after_record_threshold(tmp_path):
+    journal = _seeded_journal("run-4", 3)
+    journal_path = tmp_path / "run_journal.json"
+    journal.save(journal_path)
+    sink = LogSink(journal, journal_path, compact_every=2)
+
+    sink.emit(_event("run-4", 1, "running"))
+    sink.emit(_event("run-4", 1, "done"))
+
+    assert (tmp_path / "run_journal.wal").read_text() == ""
+    snapshot = RunJournal.load(journal_path)
+    assert snapshot.get_task("localhost", "geekbench", 1).status == RunStatus.COMPLETED
+    sink.close()
+
+
+def test_log_sink_appends_wait_for_a_direct_save(tmp_path):
+    journal = _seeded_journal("run-6", 2)
+    journal_path = tmp_path / "run_journal.json"
+    journal.save(journal_path)
+    sink = LogSink(journal, journal_path, compact_interval_seconds=3600)
+
+    # Hold the lock RunJournal.save snapshots and truncates under.
+    with journal.lock:
+        emitter = threading.Thread(
+            target=sink.emit, args=(_event("run-6", 1, "done"),)
+        )
+        emitter.start()
+        emitter.join(timeout=0.2)
+        assert emitter.is_alive()
+        assert journal.get_task("localhost", "geekbench", 1).status == (
+            RunStatus.PENDING
+        )
+    emitter.join()
+
+    assert len((tmp_path / "run_journal.wal").read_text().splitlines()) == 1
+    loaded = RunJournal.load(journal_path)
+    assert loaded.get_task("localhost", "geekbench", 1).status == RunStatus.COMPLETED
+    sink.close()
+
+
+def test_journal_replay_skips_stale_and_torn_wal_records(tmp_path):
+    journal = _seeded_journal("run-5", 1)
+    journal_path = tmp_path / "run_journal.json"
+    wal_path = tmp_path / "run_journal.wal"
+    journal.update_task("localhost", "geekbench", 1, RunStatus.COMPLETED)
+    journal.save(journal_path)
+    # A record older than the snapshot, then a line cut short by a crash.
+    wal_path.write_text(
+        '{"host":"localhost","workload":"geekbench","repetition":1,'
+        '"status":"RUNNING","timestamp":0}\n'
+        '{"host":"localhost","workl'
+    )
+
+    loaded = RunJournal.load(journal_path)
+
+    assert loaded.get_task("localhost", "geekbench", 1).status == RunStatus.COMPLETED
+
+
+def _multi_host_journal() -> RunJournal:
+    cfg = SimpleNamespace(
+        repetitions=2,
+        workloads={"fio": {}, "stream": {}},
+        remote_hosts=[SimpleNamespace(name="node-b"), SimpleNamespace(name="node-a")],
+    )
+    return RunJournal.initialize("run-idx", cfg, ["fio", "stream"])
+
+
+def test_journal_indexes_follow_task_updates():
+    journal = _multi_host_journal()
+
+    assert journal.hosts() == ["node-a", "node-b"]
+    assert journal.host_workload_pairs()[0] == ("node-a", "fio")
+    assert [t.repetition for t in journal.get_tasks_by_host("node-a")] == [
+        1,
+        1,
+        2,
+        2,
+    ]
+    assert len(journal.get_tasks_by_workload("stream")) == 4
+    assert journal.status_counts() == {RunStatus.PENDING: 8}
+
+    journal.update_task("node-a", "fio", 1, RunStatus.RUNNING)
+    journal.set_status(journal.get_task("node-b", "fio", 2), RunStatus.FAILED)
+
+    assert journal.status_counts() == {
+        RunStatus.PENDING: 6,
+        RunStatus.RUNNING: 1,
+        RunStatus.FAILED: 1,
+    }
+    assert [t.key for t in journal.get_tasks_by_status(RunStatus.RUNNING)] == [
+        "node-a::fio::1"
+    ]
+    assert set(journal.get_repetitions("node-a", "fio")) == {1, 2}
+
+
+def test_journal_indexes_survive_reassignment_and_reload(tmp_path):
+    journal = _multi_host_journal()
+    journal.update_task("node-a", "stream", 2, RunStatus.COMPLETED)
+    path = tmp_path / "run_journal.json"
+    journal.save(path)
+
+    loaded = RunJournal.load(path)
+    assert loaded.status_counts()[RunStatus.COMPLETED] == 1
+
+    replaced = RunJournal(run_id="copy")
+    replaced.tasks = {
+        task.key: task for task in loaded.get_tasks_by_workload("stream")
+    }
+    del replaced.tasks["node-a::stream::2"]
+    assert replaced.status_counts() == {RunStatus.PENDING: 3}
+    assert replaced.get_repetitions("node-a", "stream").keys() == {1}
+
+
+def test_journal_indexes_stay_consistent_across_host_lanes():
+    cfg = SimpleNamespace(
+        repetitions=50,
+        workloads={"fio": {}},
+        remote_hosts=[SimpleNamespace(name=f"node-{i}") for i in range(4)],
+    )
+    journal = RunJournal.initialize("run-lanes", cfg, ["fio"])
+    statuses = [RunStatus.RUNNING, RunStatus.FAILED, RunStatus.COMPLETED]
+    totals: list[int] = []
+    done = threading.Event()
+
+    def lane(host: str) -> None:
+        for status in statuses:
+            for rep in range(1, 51):
+                journal.update_task(host, "fio", rep, status)
+
+    def reader() -> None:
+        while not done.is_set():
+            totals.append(sum(journal.status_counts().values()))
+
+    watcher = threading.Thread(target=reader)
+    watcher.start()
+    lanes = [
+        threading.Thread(target=lane, args=(host.name,)) for host in cfg.remote_hosts
+    ]
+    for thread in lanes:
+        thread.start()
+    for thread in lanes:
+        thread.join()
+    done.set()
+    watcher.join()
+
+    assert journal.status_counts() == {RunStatus.COMPLETED: 200}
+    assert set(totals) <= {200}
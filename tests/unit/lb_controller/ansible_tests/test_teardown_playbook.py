@@ -0,0 +1,87 @@
+"""Tests for what the global teardown playbook removes from lb_workdir."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import jinja2
+import pytest
+import yaml
+
+from lb_controller.engine.run_state_builders import ExtravarsBuilder
+from lb_runner.api import BenchmarkConfig
+from lb_runner.services.setup_cache import MARKER_NAME
+from lb_runner.services.source_sync import APPLIED_MANIFEST_NAME
+
+
+pytestmark = pytest.mark.unit_controller
+
+_TEARDOWN = Path("lb_controller/ansible/playbooks/teardown.yml")
+_ENV = jinja2.Environment()
+_ENV.filters["bool"] = lambda value: str(value).lower() in {"true", "1", "yes"}
+
+
+def _extravars(tmp_path: Path, *, setup_cache: bool) -> dict:
+    cfg = BenchmarkConfig(output_dir=tmp_path / "out")
+    cfg.remote_execution.setup_cache = setup_cache
+    return ExtravarsBuilder(cfg).build(
+        run_id="run-1",
+        output_root=tmp_path / "out",
+        report_root=tmp_path / "rep",
+        data_export_root=tmp_path / "exp",
+        per_host_output={},
+        target_reps=1,
+        collector_packages=[],
+    )
+
+
+def _render_context(play: dict, extravars: dict) -> dict:
+    context = dict(extravars)
+    for name, value in (play.get("vars") or {}).items():
+        items = value if isinstance(value, list) else [value]
+        context[name] = [_ENV.from_string(item).render(context) for item in items]
+    return context
+
+
+def _task_paths(action: dict, loop: str | None, context: dict) -> list[str]:
+    if loop:
+        return context[loop.strip("{} ")]
+    return [_ENV.from_string(action["path"]).render(context)]
+
+
+def _removed_paths(extravars: dict) -> list[str]:
+    """Return the paths the teardown file tasks delete for these extravars."""
+    play = yaml.safe_load(_TEARDOWN.read_text())[0]
+    context = _render_context(play, extravars)
+    removed: list[str] = []
+    for task in play["tasks"]:
+        action = task.get("ansible.builtin.file") or {}
+        when = task.get("when")
+        if action.get("state") != "absent":
+            continue
+        if when is None or _ENV.compile_expression(when)(**context):
+            removed.extend(_task_paths(action, task.get("loop"), context))
+    return removed
+
+
+def test_teardown_keeps_install_and_source_store_with_setup_cache(tmp_path) -> None:
+    extravars = _extravars(tmp_path, setup_cache=True)
+    workdir = Path(extravars["lb_workdir"])
+
+    removed = [Path(path) for path in _removed_paths(extravars)]
+
+    assert workdir / "lb_agent.sock" in removed
+    inside = [path for path in removed if workdir in (path, *path.parents)]
+    # Only single run files directly below lb_workdir may go.
+    assert all(path.parent == workdir for path in inside)
+    kept = {MARKER_NAME, ".venv", ".local", ".lb_blobs", APPLIED_MANIFEST_NAME}
+    assert not kept & {path.name for path in inside}
+
+
+def test_teardown_removes_workspace_without_setup_cache(tmp_path) -> None:
+    extravars = _extravars(tmp_path, setup_cache=False)
+
+    removed = _removed_paths(extravars)
+
+    assert extravars["lb_workdir"] in removed
+    assert extravars["remote_output_root"] in removed
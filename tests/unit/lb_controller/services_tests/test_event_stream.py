@@ -0,0 +1,177 @@
+"""Tests for SSH streaming of remote LB_EVENT logs."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from lb_controller.services import event_stream
+from lb_controller.services.event_stream import (
+    RemoteEventStream,
+    build_stream_command,
+    streamable_hosts,
+)
+from lb_runner.api import RemoteHostConfig
+
+pytestmark = pytest.mark.unit_controller
+
+
+def _event_line(rep: int, status: str) -> str:
+    payload = {"workload": "stress_ng", "repetition": rep, "status": status}
+    return f"LB_EVENT {json.dumps(payload)}\n"
+
+
+def _local_command(_host: RemoteHostConfig, remote_dir: str) -> list[str]:
+    """Run the remote follower script locally instead of over ssh."""
+    script = event_stream._REMOTE_SCRIPT.format(
+        log=f"{remote_dir}/{event_stream.STREAM_LOG_NAME}",
+        offset=f"{remote_dir}/{event_stream.OFFSET_NAME}",
+    )
+    return ["sh", "-c", script]
+
+
+def _init_stream_files_script(remote_dir: Path) -> str:
+    """Return the role's per-repetition stream reset, rendered for remote_dir."""
+    tasks_file = (
+        Path(event_stream.__file__).resolve().parents[1]
+        / "ansible/roles/workload_runner/tasks/run_single_rep.yml"
+    )
+    tasks = yaml.safe_load(tasks_file.read_text())
+    task = next(t for t in tasks if "Initialize event stream files" in t["name"])
+    return task["ansible.builtin.shell"]["cmd"].replace(
+        "{{ workload_runner_output_dir | default('/tmp') }}", str(remote_dir)
+    )
+
+
+def _wait_for_lines(path: Path, count: int, timeout: float = 5.0) -> list[dict]:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists():
+            lines = path.read_text().splitlines()
+            if len(lines) >= count:
+                return [json.loads(line) for line in lines]
+        time.sleep(0.02)
+    raise AssertionError(f"expected {count} events in {path}")
+
+
+def test_build_stream_command_uses_ssh_options_and_sudo():
+    host = RemoteHostConfig(
+        name="node1",
+        address="10.0.0.5",
+        user="ubuntu",
+        port=2222,
+        vars={"ansible_ssh_private_key_file": "/keys/id"},
+    )
+
+    command = build_stream_command(host, "/tmp/benchmark_results/run-1/node1")
+
+    assert command[0] == "ssh"
+    assert "ServerAliveInterval=15" in command
+    assert command[command.index("-p") + 1] == "2222"
+    assert command[command.index("-i") + 1] == "/keys/id"
+    assert command[-2] == "ubuntu@10.0.0.5"
+    assert command[-1].startswith("sudo -n sh -c ")
+    assert "/tmp/benchmark_results/run-1/node1/lb_events.stream.offset" in command[-1]
+
+
+def test_streamable_hosts_skips_non_ssh_connections():
+    hosts = [
+        RemoteHostConfig(name="a", address="a"),
+        RemoteHostConfig(name="b", address="b", vars={"ansible_connection": "local"}),
+    ]
+
+    assert [host.name for host in streamable_hosts(hosts)] == ["a"]
+
+
+@pytest.mark.skipif(shutil.which("tail") is None, reason="tail not available")
+def test_stream_forwards_events_and_resumes_from_offset(tmp_path: Path):
+    host = RemoteHostConfig(name="node1", address="localhost")
+    remote_dir = tmp_path / "remote" / "node1"
+    remote_dir.mkdir(parents=True)
+    stream_log = remote_dir / "lb_events.stream.log"
+    offset_file = remote_dir / "lb_events.stream.offset"
+    already_sent = _event_line(1, "done")
+    stream_log.write_text(already_sent + _event_line(2, "running"))
+    offset_file.write_text(str(len(already_sent)))
+    event_log = tmp_path / "lb_events.jsonl"
+
+    stream = RemoteEventStream(
+        [host],
+        str(tmp_path / "remote"),
+        event_log,
+        command_builder=_local_command,
+    )
+    with stream:
+        with stream_log.open("a") as handle:
+            handle.write("plain log line\n" + _event_line(2, "done"))
+        events = _wait_for_lines(event_log, 2)
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if int(offset_file.read_text() or 0) == stream_log.stat().st_size:
+                break
+            time.sleep(0.02)
+
+    assert [(e["repetition"], e["status"]) for e in events] == [
+        (2, "running"),
+        (2, "done"),
+    ]
+    assert all(event["host"] == "node1" for event in events)
+    assert int(offset_file.read_text()) == stream_log.stat().st_size
+
+
+@pytest.mark.skipif(shutil.which("tail") is None, reason="tail not available")
+def test_stream_without_offset_starts_at_end_of_log(tmp_path: Path):
+    host = RemoteHostConfig(name="node1", address="localhost")
+    remote_dir = tmp_path / "node1"
+    remote_dir.mkdir()
+    stream_log = remote_dir / "lb_events.stream.log"
+    stream_log.write_text(_event_line(1, "done"))
+    event_log = tmp_path / "lb_events.jsonl"
+
+    with RemoteEventStream(
+        [host], str(tmp_path), event_log, command_builder=_local_command
+    ):
+        # Give the follower time to attach before new events arrive.
+        time.sleep(0.3)
+        with stream_log.open("a") as handle:
+            handle.write(_event_line(2, "running"))
+        events = _wait_for_lines(event_log, 1)
+
+    assert [e["repetition"] for e in events] == [2]
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+def test_stream_reconnect_after_repetition_reset_keeps_trailing_events(
+    tmp_path: Path,
+):
+    host = RemoteHostConfig(name="node1", address="localhost")
+    remote_dir = tmp_path / "node1"
+    remote_dir.mkdir()
+    stream_log = remote_dir / "lb_events.stream.log"
+    offset_file = remote_dir / event_stream.OFFSET_NAME
+    forwarded = _event_line(1, "running")
+    stream_log.write_text(forwarded)
+    offset_file.write_text(str(len(forwarded)))
+    # Repetition 1 finishes while the channel is down, then the role resets
+    # the event files for repetition 2 before the controller reconnects.
+    with stream_log.open("a") as handle:
+        handle.write(_event_line(1, "done"))
+    subprocess.run(
+        ["bash", "-c", _init_stream_files_script(remote_dir)], check=True
+    )
+    polling_offset = remote_dir / "lb_events.offset"
+    assert int(polling_offset.read_text()) == stream_log.stat().st_size
+    event_log = tmp_path / "lb_events.jsonl"
+
+    with RemoteEventStream(
+        [host], str(tmp_path), event_log, command_builder=_local_command
+    ):
+        events = _wait_for_lines(event_log, 1)
+
+    assert [(e["repetition"], e["status"]) for e in events] == [(1, "done")]
@@ -181,6 +181,31 @@ def test_ansible_runner_interrupt_is_idempotent(tmp_path: Path):
     assert executor.is_running is False
 
 
+def test_ansible_runner_lane_limits_hosts_and_shares_event_log(tmp_path: Path):
+    calls: list[dict] = []
+
+    def fake_runner(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(rc=0, status="ok", stats={})
+
+    executor = AnsibleRunnerExecutor(
+        private_data_dir=tmp_path / "ansible", runner_fn=fake_runner
+    )
+    lane = executor.lane("node2", ["node2"])
+    playbook = tmp_path / "play.yml"
+    playbook.write_text("- hosts: all\n  tasks: []\n")
+    inventory = InventorySpec(
+        hosts=[RemoteHostConfig(name="node2", address="127.0.0.2", user="root")]
+    )
+
+    assert lane.run_playbook(playbook, inventory).success
+    assert executor.lane("node2", ["node2"]) is lane
+    assert lane.event_log_path == executor.event_log_path
+    assert calls[0]["limit"] == "node2"
+    assert calls[0]["private_data_dir"] == str(tmp_path / "ansible/lanes/node2")
+    assert calls[0]["envvars"]["LB_EVENT_LOG_PATH"] == str(executor.event_log_path)
+
+
 def test_controller_merges_plugin_extravars_into_setup(tmp_path: Path) -> None:
     """Controller should merge plugin-provided extravars into setup/teardown runs."""
     config = BenchmarkConfig(
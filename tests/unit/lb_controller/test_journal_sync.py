@@ -70,6 +70,26 @@ def test_backfill_marks_failed_on_error(tmp_path: Path):
     assert "cmd=cmd" in task.error
 
 
+def test_backfill_reads_the_results_log_of_an_unfinalized_workload(tmp_path: Path):
+    journal, _ = _journal_for()
+    results = tmp_path / "host1" / "stress_ng"
+    results.mkdir(parents=True)
+    entry = {"repetition": 1, "duration_seconds": 4.0, "generator_result": {}}
+    (results / "stress_ng_results.jsonl").write_text(json_dumps(entry) + "\n")
+
+    backfill_timings_from_results(
+        journal,
+        tmp_path / "journal.json",
+        [RemoteHostConfig(name="host1", address="1.2.3.4")],
+        "stress_ng",
+        {"host1": tmp_path / "host1"},
+    )
+
+    task = journal.get_task("host1", "stress_ng", 1)
+    assert task.status == RunStatus.COMPLETED
+    assert task.duration_seconds == 4.0
+
+
 def test_update_all_reps_saves_once(tmp_path: Path):
     journal, cfg = _journal_for()
     journal.save = MagicMock()
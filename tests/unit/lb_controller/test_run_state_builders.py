@@ -111,3 +111,29 @@ def test_extravars_builder_collects_uv_extras_for_enabled_workloads(tmp_path) ->
     )
 
     assert extravars["lb_uv_extras"] == ["other", "peva_faas"]
+
+
+def _build_extravars(cfg: BenchmarkConfig, tmp_path, packages) -> dict:
+    return ExtravarsBuilder(cfg).build(
+        run_id="run-1",
+        output_root=tmp_path / "out",
+        report_root=tmp_path / "rep",
+        data_export_root=tmp_path / "exp",
+        per_host_output={},
+        target_reps=1,
+        collector_packages=packages,
+    )
+
+
+def test_extravars_builder_setup_hash_tracks_apt_packages(tmp_path) -> None:
+    cfg = BenchmarkConfig(output_dir=tmp_path / "out")
+
+    first = _build_extravars(cfg, tmp_path, ["sysstat"])["lb_setup_hash"]
+    again = _build_extravars(cfg, tmp_path, ["sysstat"])["lb_setup_hash"]
+    other = _build_extravars(cfg, tmp_path, ["sysstat", "perf"])["lb_setup_hash"]
+
+    assert first and first == again
+    assert other != first
+
+    cfg.remote_execution.setup_cache = False
+    assert _build_extravars(cfg, tmp_path, ["sysstat"])["lb_setup_hash"] == ""
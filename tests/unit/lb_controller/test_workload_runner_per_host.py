@@ -0,0 +1,177 @@
+"""Unit tests for the per-host workload strategy."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from lb_controller.engine.run_state import RunFlags
+from lb_controller.engine.session_builder import RunSessionBuilder
+from lb_controller.models.state import ControllerStateMachine
+from lb_controller.models.types import ExecutionResult, InventorySpec
+from lb_controller.services.services import ControllerServices
+from lb_controller.services.ui_notifier import UINotifier
+from lb_controller.services.workload_runner import WorkloadRunner
+from lb_plugins.api import PluginAssetConfig
+from lb_runner.api import BenchmarkConfig, RemoteHostConfig, WorkloadConfig
+
+pytestmark = pytest.mark.unit_controller
+
+
+class RecordingExecutor:
+    """Executor stub recording playbook calls, with optional host lanes."""
+
+    def __init__(self, name: str = "root", log: list | None = None) -> None:
+        self.name = name
+        self.log = log if log is not None else []
+        self.lanes: dict[str, RecordingExecutor] = {}
+        self.hooks: dict[tuple[str, str], threading.Event] = {}
+        self.lock = threading.Lock()
+
+    def lane(self, name: str, hosts: list[str]) -> "RecordingExecutor":
+        lane = RecordingExecutor(name, self.log)
+        lane.hooks = self.hooks
+        lane.lock = self.lock
+        self.lanes[name] = lane
+        return lane
+
+    def run_playbook(
+        self,
+        playbook_path: Path,
+        inventory: InventorySpec,
+        extravars=None,
+        tags=None,
+        limit_hosts=None,
+        *,
+        cancellable: bool = True,
+    ) -> ExecutionResult:
+        tests = (extravars or {}).get("tests") or []
+        hosts = [host.name for host in inventory.hosts]
+        with self.lock:
+            self.log.append((self.name, Path(playbook_path).name, tests, hosts))
+        for test_name in tests:
+            hook = self.hooks.get((self.name, test_name))
+            if hook is not None:
+                assert hook.wait(timeout=5)
+        return ExecutionResult(rc=0, status="successful")
+
+
+def _runner_and_state(tmp_path: Path, workloads: list[str], strategy: str):
+    config = BenchmarkConfig(
+        output_dir=tmp_path / "out",
+        report_dir=tmp_path / "rep",
+        data_export_dir=tmp_path / "exp",
+        remote_hosts=[
+            RemoteHostConfig(name="node1", address="127.0.0.1"),
+            RemoteHostConfig(name="node2", address="127.0.0.2"),
+        ],
+    )
+    config.workloads = {
+        name: WorkloadConfig(plugin=name) for name in ("fio", "stress_ng", "dfaas")
+    }
+    config.plugin_assets = {"dfaas": PluginAssetConfig(host_barrier=True)}
+    config.repetitions = 1
+    config.remote_execution.host_strategy = strategy
+    config.remote_execution.run_playbook = tmp_path / "run_benchmark.yml"
+    config.remote_execution.collect_playbook = tmp_path / "collect.yml"
+    builder = RunSessionBuilder(
+        config=config,
+        state_machine=ControllerStateMachine(),
+        stop_timeout_s=0.0,
+        journal_refresh=None,
+        collector_packages=lambda: set(),
+    )
+    session = builder.build(
+        test_types=workloads, run_id="run-1", journal=None, journal_path=None
+    )
+    return config, session
+
+
+def _run(config, session, executor) -> dict[str, ExecutionResult]:
+    services = ControllerServices(config=config, executor=executor)
+    phases: dict[str, ExecutionResult] = {}
+    flags = WorkloadRunner(config, UINotifier()).run_workloads(
+        services, session, session.state, phases, RunFlags(), False, lambda _: None
+    )
+    assert flags.all_tests_success
+    return phases
+
+
+def _runs(log: list) -> list[tuple[str, str, str]]:
+    """Return ``(executor, workload, hosts)`` for every run playbook call."""
+    return [
+        (lane, tests[0], ",".join(hosts))
+        for lane, playbook, tests, hosts in log
+        if playbook == "run_benchmark.yml"
+    ]
+
+
+def test_lockstep_runs_each_workload_on_all_hosts(tmp_path: Path) -> None:
+    config, session = _runner_and_state(tmp_path, ["fio", "stress_ng"], "lockstep")
+    executor = RecordingExecutor()
+
+    phases = _run(config, session, executor)
+
+    assert executor.lanes == {}
+    assert _runs(executor.log) == [
+        ("root", "fio", "node1,node2"),
+        ("root", "stress_ng", "node1,node2"),
+    ]
+    assert "run_fio" in phases
+
+
+def test_per_host_runs_each_host_in_its_own_lane(tmp_path: Path) -> None:
+    config, session = _runner_and_state(tmp_path, ["fio", "stress_ng"], "per_host")
+    executor = RecordingExecutor()
+    # node1 is held on its first workload until node2 has started its second.
+    release = threading.Event()
+    executor.hooks[("node1", "fio")] = release
+    original = executor.lane
+
+    def lane(name: str, hosts: list[str]) -> RecordingExecutor:
+        lane_executor = original(name, hosts)
+        if name == "node2":
+            run_playbook = lane_executor.run_playbook
+
+            def _run_and_release(playbook_path, inventory, extravars=None, **kw):
+                result = run_playbook(playbook_path, inventory, extravars, **kw)
+                if (extravars or {}).get("tests") == ["stress_ng"]:
+                    release.set()
+                return result
+
+            lane_executor.run_playbook = _run_and_release
+        return lane_executor
+
+    executor.lane = lane
+
+    phases = _run(config, session, executor)
+
+    runs = _runs(executor.log)
+    assert ("node2", "stress_ng", "node2") in runs
+    assert runs.index(("node2", "stress_ng", "node2")) < runs.index(
+        ("node1", "stress_ng", "node1")
+    )
+    assert all(lane != "root" for lane, _, _ in runs)
+    assert {"run_fio[node1]", "run_stress_ng[node2]"} <= set(phases)
+
+
+def test_per_host_waits_for_all_hosts_at_a_barrier(tmp_path: Path) -> None:
+    config, session = _runner_and_state(
+        tmp_path, ["fio", "dfaas", "stress_ng"], "per_host"
+    )
+    executor = RecordingExecutor()
+
+    phases = _run(config, session, executor)
+
+    runs = _runs(executor.log)
+    barrier = runs.index(("root", "dfaas", "node1,node2"))
+    before = set(runs[:barrier])
+    after = set(runs[barrier + 1 :])
+    assert before == {("node1", "fio", "node1"), ("node2", "fio", "node2")}
+    assert after == {
+        ("node1", "stress_ng", "node1"),
+        ("node2", "stress_ng", "node2"),
+    }
+    assert "run_dfaas" in phases
@@ -14,6 +14,8 @@ from lb_plugins.plugins.dfaas.services.k6_runner import K6Runner
 from lb_plugins.plugins.dfaas.services.annotation_service import DfaasAnnotationService
 from lb_plugins.plugins.dfaas.services.plan_builder import (
     DfaasPlanBuilder,
+    DominanceIndex,
+    config_key,
     dominates,
     generate_configurations,
     generate_rates_list,
@@ -110,6 +112,37 @@ def test_dominates_checks_per_function() -> None:
     assert not dominates(base, [("a", 0), ("b", 10)])
 
 
+def test_dominance_index_matches_pairwise_dominates() -> None:
+    overloaded = [
+        [("a", 20), ("b", 10)],
+        [("b", 30), ("a", 10)],
+        [("a", 30), ("b", 30)],
+        [("a", 10)],
+    ]
+    index = DominanceIndex()
+    index.sync(overloaded)
+    functions = ["a", "b"]
+    candidates = generate_configurations(functions, [0, 10, 20, 30, 40], 1, 3)
+    for candidate in candidates:
+        expected = any(dominates(over, candidate) for over in overloaded)
+        assert index.dominates(config_key(candidate)) is expected
+
+
+def test_dominance_index_sync_tracks_appends_and_new_lists() -> None:
+    overloaded: list[list[tuple[str, int]]] = []
+    index = DominanceIndex()
+    key = config_key([("a", 20), ("b", 20)])
+    index.sync(overloaded)
+    assert not index.dominates(key)
+
+    overloaded.append([("a", 10), ("b", 20)])
+    index.sync(overloaded)
+    assert index.dominates(key)
+
+    index.sync([[("a", 30), ("b", 10)]])
+    assert not index.dominates(key)
+
+
 def test_build_k6_script_includes_scenarios() -> None:
     functions = [
         DfaasFunctionConfig(name="figlet", method="POST", body="hi"),
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -435,6 +436,230 @@ class TestCollectAllMetrics:
             assert call_args.kwargs["end_time"] is None
 
 
+class TestConcurrentCollection:
+    @staticmethod
+    def _collector(
+        queries_path: Path, runner: MagicMock, **kwargs
+    ) -> MetricsCollector:
+        with patch(
+            "lb_plugins.plugins.dfaas.services.metrics_collector.PrometheusQueryRunner",
+            return_value=runner,
+        ):
+            return MetricsCollector(
+                prometheus_url="http://localhost:9090",
+                queries_path=queries_path,
+                duration="30s",
+                **kwargs,
+            )
+
+    @staticmethod
+    def _values(query, **kwargs) -> float:
+        values = {
+            ("cpu_usage_node", None): 10.0,
+            ("ram_usage_node", None): 2048.0,
+            ("ram_usage_node_pct", None): 50.0,
+            ("power_usage_node", None): 70.0,
+            ("cpu_usage_function", "func1"): 3.0,
+            ("ram_usage_function", "func1"): 256.0,
+            ("cpu_usage_function", "func2"): 4.0,
+            ("ram_usage_function", "func2"): 384.0,
+            ("power_usage_function", None): 5.0,
+        }
+        return values[(query.name, kwargs.get("function_name"))]
+
+    def test_issues_all_queries_at_once(self, queries_path: Path) -> None:
+        # Every query waits until all seven are in flight.
+        barrier = threading.Barrier(7, timeout=5)
+        mock_runner = MagicMock()
+
+        def execute(query, **kwargs) -> float:
+            barrier.wait()
+            return self._values(query, **kwargs)
+
+        mock_runner.execute.side_effect = execute
+        collector = self._collector(queries_path, mock_runner, query_workers=8)
+
+        metrics = collector.collect_all_metrics(
+            ["func1", "func2"],
+            start_time=1000.0,
+            end_time=1030.0,
+            duration_seconds=30,
+        )
+
+        serial_runner = MagicMock()
+        serial_runner.execute.side_effect = self._values
+        serial = self._collector(queries_path, serial_runner).collect_all_metrics(
+            ["func1", "func2"],
+            start_time=1000.0,
+            end_time=1030.0,
+            duration_seconds=30,
+        )
+        for name in ("func1", "func2"):
+            for key in ("cpu", "ram"):
+                assert metrics["functions"][name][key] == serial["functions"][name][key]
+        assert metrics["cpu_usage_node"] == 10.0
+        assert metrics["ram_usage_node_pct"] == 50.0
+        assert math.isnan(metrics["power_usage_node"])
+        assert metrics["functions"]["func2"]["ram"] == 384.0
+
+    def test_failed_function_query_only_affects_that_function(
+        self, queries_path: Path
+    ) -> None:
+        mock_runner = MagicMock()
+
+        def execute(query, **kwargs) -> float:
+            if kwargs.get("function_name") == "func1" and query.name.startswith("ram"):
+                raise PrometheusQueryError("timed out")
+            return self._values(query, **kwargs)
+
+        mock_runner.execute.side_effect = execute
+        collector = self._collector(
+            queries_path,
+            mock_runner,
+            scaphandre_enabled=True,
+            function_pid_regexes={"func2": "func2"},
+            query_workers=4,
+            query_deadline_seconds=15.0,
+        )
+
+        metrics = collector.collect_all_metrics(
+            ["func1", "func2"],
+            start_time=1000.0,
+            end_time=1030.0,
+            duration_seconds=30,
+        )
+
+        assert math.isnan(metrics["functions"]["func1"]["cpu"])
+        assert math.isnan(metrics["functions"]["func1"]["ram"])
+        assert metrics["functions"]["func2"] == {
+            "cpu": 4.0,
+            "ram": 384.0,
+            "power": 5.0,
+        }
+        assert metrics["power_usage_node"] == 70.0
+        assert mock_runner.execute.call_count == 9
+        deadlines = {
+            call.kwargs["deadline"] for call in mock_runner.execute.call_args_list
+        }
+        assert len(deadlines) == 1
+
+    def test_node_query_error_propagates(self, queries_path: Path) -> None:
+        mock_runner = MagicMock()
+
+        def execute(query, **kwargs) -> float:
+            if query.name == "ram_usage_node":
+                raise PrometheusQueryError("timed out")
+            return self._values(query, **kwargs)
+
+        mock_runner.execute.side_effect = execute
+        collector = self._collector(queries_path, mock_runner, query_workers=4)
+
+        with pytest.raises(PrometheusQueryError):
+            collector.get_node_snapshot()
+
+
+class TestBatchedFunctionQueries:
+    @pytest.fixture
+    def batched_queries_path(self, tmp_path: Path) -> Path:
+        queries_file = tmp_path / "queries.yml"
+        queries_file.write_text(
+            """
+queries:
+  - name: cpu_usage_node
+    query: "node_cpu"
+  - name: ram_usage_node
+    query: "node_ram"
+  - name: ram_usage_node_pct
+    query: "node_ram_pct"
+  - name: cpu_usage_function
+    query: "fn_cpu{container='{function_name}'}"
+    batch_query: "sum by (container) (fn_cpu{container=~'{function_regex}'})"
+    batch_label: container
+  - name: ram_usage_function
+    query: "fn_ram{container='{function_name}'}"
+    batch_query: "sum by (container) (fn_ram{container=~'{function_regex}'})"
+    batch_label: container
+"""
+        )
+        return queries_file
+
+    @staticmethod
+    def _runner() -> MagicMock:
+        mock_runner = MagicMock()
+        mock_runner.execute.side_effect = lambda query, **_kw: {
+            "cpu_usage_node": 10.0,
+            "ram_usage_node": 2048.0,
+            "ram_usage_node_pct": 50.0,
+        }[query.name]
+
+        def execute_grouped(query, **kwargs):
+            assert kwargs["function_names"] == ["func1", "func2", "func3"]
+            if query.name == "cpu_usage_function":
+                return {"func1": 3.0, "func2": 4.0, "func3": 5.0}
+            return {"func1": 256.0, "func3": 512.0}
+
+        mock_runner.execute_grouped.side_effect = execute_grouped
+        return mock_runner
+
+    @pytest.mark.parametrize("query_workers", [1, 4])
+    def test_queries_each_function_metric_once(
+        self, batched_queries_path: Path, query_workers: int
+    ) -> None:
+        mock_runner = self._runner()
+        with patch(
+            "lb_plugins.plugins.dfaas.services.metrics_collector.PrometheusQueryRunner",
+            return_value=mock_runner,
+        ):
+            collector = MetricsCollector(
+                prometheus_url="http://localhost:9090",
+                queries_path=batched_queries_path,
+                duration="30s",
+                query_workers=query_workers,
+            )
+            metrics = collector.collect_all_metrics(
+                ["func1", "func2", "func3"],
+                start_time=1000.0,
+                end_time=1030.0,
+                duration_seconds=30,
+            )
+
+        assert mock_runner.execute.call_count == 3
+        assert mock_runner.execute_grouped.call_count == 2
+        assert metrics["cpu_usage_node"] == 10.0
+        assert metrics["functions"]["func1"]["cpu"] == 3.0
+        assert metrics["functions"]["func3"]["ram"] == 512.0
+        # func2 has no RAM series, so it is recorded like a failed query.
+        assert math.isnan(metrics["functions"]["func2"]["cpu"])
+        assert math.isnan(metrics["functions"]["func2"]["ram"])
+
+    def test_failed_batched_query_marks_all_functions_nan(
+        self, batched_queries_path: Path
+    ) -> None:
+        mock_runner = self._runner()
+        mock_runner.execute_grouped.side_effect = PrometheusQueryError("timed out")
+        with patch(
+            "lb_plugins.plugins.dfaas.services.metrics_collector.PrometheusQueryRunner",
+            return_value=mock_runner,
+        ):
+            collector = MetricsCollector(
+                prometheus_url="http://localhost:9090",
+                queries_path=batched_queries_path,
+                duration="30s",
+            )
+            metrics = collector.collect_all_metrics(
+                ["func1", "func2", "func3"],
+                start_time=1000.0,
+                end_time=1030.0,
+                duration_seconds=30,
+            )
+
+        assert metrics["ram_usage_node_pct"] == 50.0
+        assert all(
+            math.isnan(values["cpu"]) and math.isnan(values["ram"])
+            for values in metrics["functions"].values()
+        )
+
+
 class TestDataClasses:
     def test_function_metrics_values(self) -> None:
         metrics = FunctionMetrics(cpu=5.5, ram=1024.0, power=10.0)
@@ -3,6 +3,8 @@ from pathlib import Path
 import pytest
 
 from lb_plugins.plugins.dfaas.queries import (
+    PrometheusQueryRunner,
+    function_regex,
     load_queries,
     parse_instant_value,
     parse_range_average,
@@ -64,3 +66,51 @@ def test_parse_range_average_aggregates_multiple_series() -> None:
     }
 
     assert parse_range_average(payload) == 10.0
+
+
+def test_function_regex_escapes_names_for_promql() -> None:
+    assert function_regex(["figlet", "a.b", "figlet"]) == "a\\\\.b|figlet"
+
+
+def test_execute_grouped_splits_series_per_function(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_root = Path(__file__).resolve().parents[4]
+    queries = {
+        query.name: query
+        for query in load_queries(
+            repo_root / "lb_plugins" / "plugins" / "dfaas" / "queries.yml"
+        )
+    }
+    label = "container_label_io_kubernetes_container_name"
+    requests: list[tuple[str, dict[str, str]]] = []
+
+    def fake_request(url: str, params: dict[str, str]) -> dict:
+        requests.append((url, params))
+        return {
+            "data": {
+                "result": [
+                    {"metric": {label: "figlet"}, "values": [[1, "2"], [2, "4"]]},
+                    {"metric": {label: "figlet"}, "values": [[1, "1"], [2, "1"]]},
+                    {"metric": {label: "env"}, "values": [[1, "5"], [2, "7"]]},
+                ]
+            }
+        }
+
+    runner = PrometheusQueryRunner("http://prom")
+    monkeypatch.setattr(runner, "_request_json", fake_request)
+
+    values = runner.execute_grouped(
+        queries["ram_usage_function"],
+        time_span="30s",
+        function_names=["figlet", "env", "shasum"],
+        start_time=1.0,
+        end_time=2.0,
+    )
+
+    assert values == {"figlet": 4.0, "env": 6.0}
+    assert len(requests) == 1
+    url, params = requests[0]
+    assert url.endswith("/api/v1/query_range")
+    assert f'{label}=~"env|figlet|shasum"' in params["query"]
+    assert f"sum by ({label})" in params["query"]
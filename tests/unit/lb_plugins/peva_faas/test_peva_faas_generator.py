@@ -16,7 +16,10 @@ from lb_plugins.plugins.peva_faas.services.annotation_service import (
     DfaasAnnotationService,
 )
 from lb_plugins.plugins.peva_faas.services.plan_builder import (
+    ConfigurationSpace,
     DfaasPlanBuilder,
+    DominanceIndex,
+    config_key,
     dominates,
     generate_configurations,
     generate_rates_list,
@@ -56,6 +59,21 @@ def test_generate_configurations_respects_per_function_rates() -> None:
                 assert rate in rates_by_function["a"]
 
 
+def test_configuration_space_is_lazy_and_reiterable() -> None:
+    rates = generate_rates_list(0, 20, 10)
+    rates_by_function = {"a": [0, 10]}
+    space = ConfigurationSpace(
+        ["a", "b"], rates, 1, 3, rates_by_function=rates_by_function
+    )
+    expected = generate_configurations(
+        ["a", "b"], rates, 1, 3, rates_by_function=rates_by_function
+    )
+
+    assert len(space) == len(expected)
+    assert list(space) == expected
+    assert list(space) == expected
+
+
 def test_plan_builder_generates_deterministic_configs() -> None:
     config = DfaasConfig(
         functions=[
@@ -122,6 +140,37 @@ def test_dominates_checks_per_function() -> None:
     assert not dominates(base, [("a", 0), ("b", 10)])
 
 
+def test_dominance_index_matches_pairwise_dominates() -> None:
+    overloaded = [
+        [("a", 20), ("b", 10)],
+        [("b", 30), ("a", 10)],
+        [("a", 30), ("b", 30)],
+        [("a", 10)],
+    ]
+    index = DominanceIndex()
+    index.sync(overloaded)
+    functions = ["a", "b"]
+    candidates = generate_configurations(functions, [0, 10, 20, 30, 40], 1, 3)
+    for candidate in candidates:
+        expected = any(dominates(over, candidate) for over in overloaded)
+        assert index.dominates(config_key(candidate)) is expected
+
+
+def test_dominance_index_sync_tracks_appends_and_new_lists() -> None:
+    overloaded: list[list[tuple[str, int]]] = []
+    index = DominanceIndex()
+    key = config_key([("a", 20), ("b", 20)])
+    index.sync(overloaded)
+    assert not index.dominates(key)
+
+    overloaded.append([("a", 10), ("b", 20)])
+    index.sync(overloaded)
+    assert index.dominates(key)
+
+    index.sync([[("a", 30), ("b", 10)]])
+    assert not index.dominates(key)
+
+
 def test_build_k6_script_includes_scenarios() -> None:
     functions = [
         DfaasFunctionConfig(name="figlet", method="POST", body="hi"),
@@ -14,6 +14,7 @@ from lb_plugins.plugins.peva_faas.queries import (
     parse_instant_value,
     parse_range_average,
     render_query,
+    split_by_label,
 )
 
 pytestmark = [pytest.mark.unit_plugins]
@@ -219,3 +220,103 @@ def test_request_json_builds_request_and_parses_response(
     assert payload["data"]["result"][0]["value"][1] == "7.0"
     assert captured["timeout"] == 2.5
     assert "query=up" in str(captured["url"])
+
+
+def test_retry_until_result_stops_at_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    runner = PrometheusQueryRunner("http://prom", retry_seconds=120, sleep_seconds=0)
+    calls = {"count": 0}
+
+    def fake_request(_url, _params):
+        calls["count"] += 1
+        return {"data": {"result": []}}
+
+    monkeypatch.setattr(runner, "_request_json", fake_request)
+    monkeypatch.setattr(queries_mod.time, "sleep", lambda _seconds: None)
+    tick = {"value": 0}
+
+    def fake_time() -> float:
+        tick["value"] += 1
+        return float(tick["value"])
+
+    monkeypatch.setattr(queries_mod.time, "time", fake_time)
+
+    with pytest.raises(PrometheusQueryError, match="timed out"):
+        runner._retry_until_result("http://prom", {"query": "up"}, deadline=4.0)
+    assert calls["count"] == 3
+
+
+def test_load_queries_requires_batch_label_with_batch_query(tmp_path: Path) -> None:
+    path = tmp_path / "queries.yml"
+    path.write_text(
+        "queries:\n"
+        "  - name: cpu_usage_function\n"
+        "    query: up\n"
+        "    batch_query: up{job=~'{function_regex}'}\n"
+    )
+
+    with pytest.raises(ValueError, match="batch_label"):
+        load_queries(path)
+
+
+def test_split_by_label_parses_each_function_and_skips_malformed() -> None:
+    payload = {
+        "data": {
+            "result": [
+                {"metric": {"fn": "figlet"}, "value": [1, "3.5"]},
+                {"metric": {"fn": "env"}, "value": [1]},
+                {"metric": {"other": "x"}, "value": [1, "9"]},
+            ]
+        }
+    }
+
+    assert split_by_label(payload, "fn", parse_instant_value) == {"figlet": 3.5}
+
+
+def test_runner_execute_grouped_uses_instant_query_without_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    query = QueryDefinition(
+        name="cpu_usage_function",
+        query="unused",
+        batch_query='sum by (fn) (cpu{fn=~"{function_regex}"}[{time_span}])',
+        batch_label="fn",
+    )
+    calls: list[dict[str, str]] = []
+
+    def fake_request(_url: str, params: dict[str, str]) -> dict:
+        calls.append(params)
+        return {"data": {"result": [{"metric": {"fn": "b"}, "value": [1, "2"]}]}}
+
+    runner = PrometheusQueryRunner("http://prom")
+    monkeypatch.setattr(runner, "_request_json", fake_request)
+
+    values = runner.execute_grouped(query, time_span="30s", function_names=["b", "a"])
+
+    assert values == {"b": 2.0}
+    assert calls == [{"query": 'sum by (fn) (cpu{fn=~"a|b"}[30s])'}]
+
+
+def test_runner_execute_grouped_requires_batched_form() -> None:
+    query = QueryDefinition(name="cpu_usage_function", query="up")
+
+    with pytest.raises(ValueError, match="no batched form"):
+        PrometheusQueryRunner("http://prom").execute_grouped(
+            query, time_span="30s", function_names=["a"]
+        )
+
+
+def test_runner_execute_pins_instant_query_to_eval_time(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[dict[str, str]] = []
+
+    def fake_request(_url: str, params: dict[str, str]) -> dict:
+        calls.append(params)
+        return {"data": {"result": [{"value": [1, "2"]}]}}
+
+    runner = PrometheusQueryRunner("http://prom")
+    monkeypatch.setattr(runner, "_request_json", fake_request)
+    query = QueryDefinition(name="cpu", query="up[{time_span}]", range=False)
+
+    assert runner.execute(query, time_span="30s", eval_time=1234.5) == 2.0
+    assert calls == [{"query": "up[30s]", "time": "1234.5"}]
@@ -56,9 +56,15 @@ def test_config_executor_skip_reason_detects_indexed() -> None:
     assert reason == "already_indexed"
 
 
-def _make_executor(scheduler: MagicMock | None = None) -> DfaasConfigExecutor:
+def _make_executor(
+    scheduler: MagicMock | None = None,
+    policy: MagicMock | None = None,
+    **config_overrides: object,
+) -> DfaasConfigExecutor:
     return DfaasConfigExecutor(
-        config=DfaasConfig(functions=[DfaasFunctionConfig(name="f1")]),
+        config=DfaasConfig(
+            functions=[DfaasFunctionConfig(name="f1")], **config_overrides
+        ),
         k6_runner=MagicMock(),
         metrics_collector=MagicMock(),
         result_builder=MagicMock(),
@@ -69,16 +75,17 @@ def _make_executor(scheduler: MagicMock | None = None) -> DfaasConfigExecutor:
         tags_provider=lambda _: {},
         replicas_provider=lambda _: {"f1": 1},
         scheduler=scheduler,
+        policy=policy,
     )
 
 
-def test_executor_requests_sequential_batch_from_scheduler() -> None:
+def test_executor_requests_batches_from_scheduler() -> None:
     ctx = _make_context(function_names=["f1"])
     ctx.configs = [[("f1", 10)], [("f1", 20)]]
     scheduler = MagicMock()
-    scheduler.propose_batch.return_value = [[("f1", 10)]]
+    scheduler.propose_batch.side_effect = [[[("f1", 10)]], []]
     executed: list[list[tuple[str, int]]] = []
-    executor = _make_executor(scheduler=scheduler)
+    executor = _make_executor(scheduler=scheduler, scheduler_batch_size=4)
 
     setattr(
         executor,
@@ -88,14 +95,94 @@ def test_executor_requests_sequential_batch_from_scheduler() -> None:
 
     executor.execute(ctx)
 
-    scheduler.propose_batch.assert_called_once_with(
-        candidates=ctx.configs,
-        seen_keys=ctx.existing_index,
-        desired_size=2,
-    )
+    assert scheduler.propose_batch.call_count == 2
+    assert scheduler.propose_batch.call_args.kwargs["desired_size"] == 4
     assert executed == [[("f1", 10)]]
 
 
+def test_executor_pulls_plan_lazily_in_batches() -> None:
+    ctx = _make_context(function_names=["f1"])
+    pulled: list[int] = []
+
+    def plan():
+        for rate in (10, 20, 30, 40, 50):
+            pulled.append(rate)
+            yield [("f1", rate)]
+
+    ctx.configs = plan()
+    executed: list[list[tuple[str, int]]] = []
+    executor = _make_executor(scheduler_batch_size=2)
+
+    def record(*args) -> None:
+        executed.append(args[1])
+        # Only the current batch has been pulled from the plan.
+        assert len(pulled) - len(executed) < 2
+
+    setattr(executor, "_execute_single_config", record)  # type: ignore[misc]
+
+    executor.execute(ctx)
+
+    assert executed == [[("f1", rate)] for rate in (10, 20, 30, 40, 50)]
+
+
+def test_policy_leftovers_are_offered_with_next_batch() -> None:
+    ctx = _make_context(function_names=["f1"])
+    ctx.configs = [[("f1", 10)], [("f1", 20)], [("f1", 30)]]
+    policy = MagicMock()
+    policy.choose_batch.side_effect = lambda *, candidates, desired_size: (
+        candidates[-1:]
+    )
+    executed: list[list[tuple[str, int]]] = []
+    executor = _make_executor(policy=policy, scheduler_batch_size=2)
+
+    setattr(
+        executor,
+        "_execute_single_config",
+        lambda *args: executed.append(args[1]),  # type: ignore[misc]
+    )
+
+    executor.execute(ctx)
+
+    assert executed == [[("f1", 20)], [("f1", 30)], [("f1", 10)]]
+
+
+def test_declined_batch_is_dropped_and_the_sweep_continues() -> None:
+    ctx = _make_context(function_names=["f1"])
+    ctx.configs = [[("f1", 10)], [("f1", 20)], [("f1", 30)]]
+    policy = MagicMock()
+    policy.choose_batch.side_effect = [[], [[("f1", 30)]]]
+    executed: list[list[tuple[str, int]]] = []
+    executor = _make_executor(policy=policy, scheduler_batch_size=2)
+
+    setattr(
+        executor,
+        "_execute_single_config",
+        lambda *args: executed.append(args[1]),  # type: ignore[misc]
+    )
+
+    executor.execute(ctx)
+
+    assert executed == [[("f1", 30)]]
+
+
+def test_progress_total_excludes_seen_configs() -> None:
+    ctx = _make_context(function_names=["f1"])
+    ctx.configs = [[("f1", 10)], [("f1", 20)], [("f1", 30)], [("f1", 40)]]
+    ctx.existing_index.add(config_key([("f1", 20)]))
+    progress: list[tuple[int, int]] = []
+    executor = _make_executor(scheduler_batch_size=8)
+
+    setattr(
+        executor,
+        "_execute_single_config",
+        lambda *args: progress.append((args[2], args[3])),  # type: ignore[misc]
+    )
+
+    executor.execute(ctx)
+
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
 def test_seen_config_is_skipped_without_replacement() -> None:
     ctx = _make_context(function_names=["f1"])
     ctx.configs = [[("f1", 10)], [("f1", 20)], [("f1", 30)]]
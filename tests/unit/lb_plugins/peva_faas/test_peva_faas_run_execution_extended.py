@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import time
+from itertools import islice
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -57,7 +59,9 @@ def _make_executor(
         "scheduler": MagicMock(),
     }
     deps["scheduler"].propose_batch.side_effect = (
-        lambda candidates, **_kwargs: candidates
+        lambda candidates, desired_size, **_kwargs: list(
+            islice(candidates, desired_size)
+        )
     )
     executor = DfaasConfigExecutor(
         config=cfg,
@@ -380,3 +384,104 @@ def test_handle_error_helpers_append_skipped_rows() -> None:
 
 def test_format_pairs_label_sorts_by_function_name() -> None:
     assert DfaasConfigExecutor._format_pairs_label([("b", 20), ("a", 10)]) == "a=10, b=20"
+
+
+def _pipelined_executor(
+    iterations: int,
+) -> tuple[DfaasConfigExecutor, dict[str, MagicMock], DfaasRunContext]:
+    config = DfaasConfig(
+        functions=[DfaasFunctionConfig(name="f1")], iterations=iterations
+    )
+    executor, deps = _make_executor(config=config)
+    ctx = _make_context(configs=[[("f1", 10)], [("f1", 20)]])
+    ctx.cooldown_manager.wait_for_idle.return_value = CooldownResult(
+        snapshot=ctx.base_idle, waited_seconds=0, iterations=1
+    )
+    deps["k6_runner"].build_script.return_value = ("script", {"f1": "id-1"})
+    deps["k6_runner"].execute.return_value = SimpleNamespace(
+        summary={"metrics": {}}, duration_seconds=1.0
+    )
+    deps["k6_runner"].parse_summary.return_value = {"f1": {"success_rate": 1.0}}
+    deps["result_builder"].build_skipped_row.side_effect = lambda _names, pairs: {
+        "skipped": pairs
+    }
+    return executor, deps, ctx
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_pipelined_execution_overlaps_cooldown_with_result_processing() -> None:
+    executor, deps, ctx = _pipelined_executor(iterations=2)
+    ctx.configs = [[("f1", 10)], [("f1", 20)], [("f1", 30)]]
+    cooldowns: list[int] = []
+    processed: list[int] = []
+
+    def wait_for_idle(*_args, **_kwargs) -> CooldownResult:
+        cooldowns.append(len(cooldowns) + 1)
+        return CooldownResult(snapshot=ctx.base_idle, waited_seconds=0, iterations=1)
+
+    def collect_all_metrics(*_args, **_kwargs) -> dict:
+        # Each iteration is processed while the following cooldown runs; only
+        # the very last iteration has no cooldown after it.
+        current = len(processed) + 1
+        if current < 6:
+            assert _wait_until(lambda: len(cooldowns) > current)
+        processed.append(current)
+        return {"cpu_usage_node": 1.0}
+
+    ctx.cooldown_manager.wait_for_idle.side_effect = wait_for_idle
+    deps["metrics_collector"].collect_all_metrics.side_effect = collect_all_metrics
+    rows = iter(range(6))
+    deps["result_builder"].build_result_row.side_effect = lambda *_args: (
+        {"row": next(rows)},
+        False,
+    )
+
+    executor.execute(ctx)
+
+    assert processed == [1, 2, 3, 4, 5, 6]
+    assert len(cooldowns) == 6
+    assert [row["row"] for row in ctx.results_rows] == list(range(6))
+    assert [entry["iteration"] for entry in ctx.metrics_entries] == [1, 2] * 3
+    assert [row["rates"] for row in ctx.index_rows] == [[10], [20], [30]]
+
+
+def test_pipelined_execution_skips_config_dominated_by_pending_overload() -> None:
+    executor, deps, ctx = _pipelined_executor(iterations=1)
+    deps["metrics_collector"].collect_all_metrics.return_value = {}
+    deps["result_builder"].build_result_row.return_value = ({"row": "ok"}, True)
+
+    executor.execute(ctx)
+
+    assert ctx.overloaded_configs == [[("f1", 10)]]
+    assert ctx.skipped_rows == [{"skipped": [("f1", 20)]}]
+    assert deps["k6_runner"].execute.call_count == 1
+    deps["annotations"].annotate_config_change.assert_called_once()
+    assert [row["rates"] for row in ctx.index_rows] == [[10]]
+
+
+def test_pipelined_execution_reports_processing_errors_for_their_config() -> None:
+    executor, deps, ctx = _pipelined_executor(iterations=2)
+    deps["k6_runner"].parse_summary.side_effect = [
+        ValueError("missing"),
+        {"f1": {"success_rate": 1.0}},
+        {"f1": {"success_rate": 1.0}},
+    ]
+    deps["metrics_collector"].collect_all_metrics.return_value = {}
+    deps["result_builder"].build_result_row.return_value = ({"row": "ok"}, False)
+
+    executor.execute(ctx)
+
+    assert ctx.skipped_rows == [{"skipped": [("f1", 10)]}]
+    assert [row["rates"] for row in ctx.index_rows] == [[20]]
+    assert len(ctx.results_rows) == 2
+    # The failed config stops before its second k6 run.
+    assert deps["k6_runner"].execute.call_count == 3
+    deps["annotations"].annotate_error.assert_called_once()
@@ -43,7 +43,7 @@ def test_prepare_builds_context_and_attaches_run_services(tmp_path: Path) -> Non
     planner.build_function_names.return_value = ["f1"]
     planner.build_rates.return_value = [10]
     planner.build_rates_by_function.return_value = {"f1": [10]}
-    planner.build_configurations.return_value = [[("f1", 10)]]
+    planner.build_configuration_space.return_value = [[("f1", 10)]]
     metrics.get_node_snapshot.return_value = MetricsSnapshot(1.0, 2.0, 3.0, 4.0)
     run_planner._load_index = lambda _output_dir: {(("f1",), (10,))}  # type: ignore[method-assign]
 
@@ -51,6 +51,9 @@ def test_prepare_builds_context_and_attaches_run_services(tmp_path: Path) -> Non
 
     assert ctx.function_names == ["f1"]
     assert ctx.configs == [[("f1", 10)]]
+    planner.build_configuration_space.assert_called_once_with(
+        ["f1"], [10], rates_by_function={"f1": [10]}
+    )
     assert ctx.existing_index == {(("f1",), (10,))}
     assert ctx.target_name == "node-1"
     assert ctx.run_id == "run-abc"
@@ -1,11 +1,13 @@
 """Tests for BaseCollector lifecycle and error handling."""
 
+import threading
 import time
 
 import pytest
 
 from lb_common.errors import MetricCollectionError
 from lb_runner.api import BaseCollector
+from lb_runner.metric_collectors._base_collector import summarize_samples
 
 
 pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
@@ -58,3 +60,123 @@ def test_collect_loop_survives_exceptions():
     c.stop()
     # No exception should propagate; data may be empty due to raised collects
     assert c._is_running is False
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not met in time")
+        time.sleep(0.005)
+
+
+def test_spill_flushes_to_csv_and_bounds_memory(tmp_path):
+    c = DummyCollector()
+    spill_path = tmp_path / "dummy.csv"
+    c.enable_spill(spill_path, flush_samples=2, flush_interval_seconds=60)
+    c.start()
+    try:
+        _wait_for(lambda: c._spill.rows >= 4)
+    finally:
+        c.stop()
+    assert len(c._samples) == 0
+
+    data = c.get_data()
+    assert len(data) >= 4
+    assert all(entry["value"] == 1 and entry["collector"] == "Dummy" for entry in data)
+
+    c.save_data(spill_path)
+    assert len(c.get_dataframe()) == len(data)
+    assert spill_path.read_text().count("\n") == len(data) + 1
+
+
+def test_spill_write_does_not_block_sampling(tmp_path):
+    c = DummyCollector()
+    c.enable_spill(tmp_path / "dummy.csv", flush_samples=100)
+    c._store_sample(1.0, {"value": 1})
+    entered = threading.Event()
+    release = threading.Event()
+    write = c._spill.write
+
+    def slow_write(df):
+        entered.set()
+        assert release.wait(timeout=5)
+        write(df)
+
+    c._spill.write = slow_write
+    flusher = threading.Thread(target=c._flush_spill)
+    flusher.start()
+    try:
+        assert entered.wait(timeout=5)
+        c._store_sample(2.0, {"value": 2})
+        assert len(c._samples) == 1
+    finally:
+        release.set()
+        flusher.join()
+
+    assert c.get_dataframe()["value"].tolist() == [1, 2]
+
+
+def test_sample_summary_reads_spill_without_loading_it(tmp_path):
+    c = DummyCollector()
+    c.enable_spill(tmp_path / "dummy.csv", flush_samples=2)
+    for ts, value in enumerate([3.0, 1.0, 4.0, 1.0, 5.0], start=1):
+        c._store_sample(float(ts), {"value": value, "label": "x"})
+    expected = summarize_samples(c.get_dataframe())
+
+    def fail_read():
+        raise AssertionError("spill should not be loaded whole")
+
+    c._spill.read = fail_read
+    count, stats = c.get_sample_summary()
+
+    assert count == 5
+    assert stats.keys() == {"value"}
+    assert stats["value"] == pytest.approx(expected["value"])
+
+
+def test_spill_summary_parses_the_file_once_within_budget(tmp_path, monkeypatch):
+    from lb_runner.metric_collectors import _sample_spill as spill_mod
+
+    c = DummyCollector()
+    c.enable_spill(tmp_path / "dummy.csv", flush_samples=2)
+    for ts in range(1, 6):
+        c._store_sample(float(ts), {"a": ts, "b": ts * 2.0, "c": -ts, "label": "x"})
+    c._flush_spill()
+    read_csv = spill_mod.pd.read_csv
+    calls = []
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(kwargs.get("usecols"))
+        return read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(spill_mod.pd, "read_csv", counting_read_csv)
+    single = dict(c._spill.iter_numeric_columns())
+    assert len(calls) == 1
+
+    # A budget that only fits one column falls back to one pass per column.
+    monkeypatch.setattr(spill_mod, "READ_BUDGET_BYTES", 5 * 8)
+    calls.clear()
+    batched = dict(c._spill.iter_numeric_columns())
+
+    assert len(calls) == len(c._spill._header)
+    assert single.keys() == batched.keys() == {"a", "b", "c"}
+    assert batched["b"].tolist() == [2.0, 4.0, 6.0, 8.0, 10.0]
+
+
+def test_spill_widens_header_for_late_columns(tmp_path):
+    from lb_runner.metric_collectors._sample_spill import CsvSampleSpill
+    from lb_runner.metric_collectors._sample_store import ColumnarSampleStore
+
+    spill = CsvSampleSpill(tmp_path / "s.csv", flush_samples=1)
+    store = ColumnarSampleStore()
+    store.append(1.0, {"a": 1})
+    spill.write(store.to_dataframe())
+    store.clear()
+    store.append(2.0, {"a": 2, "b": 3})
+    spill.write(store.to_dataframe())
+
+    df = spill.read()
+    assert list(df.columns) == ["a", "b"]
+    assert df["a"].tolist() == [1, 2]
+    assert spill.rows == 2
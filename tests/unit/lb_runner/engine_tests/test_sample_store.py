@@ -0,0 +1,84 @@
+"""Tests for the columnar collector sample store."""
+
+import math
+
+import numpy as np
+import pytest
+
+from lb_runner.metric_collectors._sample_store import ColumnarSampleStore
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+
+def test_records_round_trip_across_chunks():
+    store = ColumnarSampleStore(chunk_size=2)
+    for idx in range(5):
+        store.append(1_700_000_000.0 + idx, {"cpu": float(idx), "count": idx})
+
+    records = store.to_records({"collector": "Dummy"})
+
+    assert len(store) == 5
+    assert [r["count"] for r in records] == [0, 1, 2, 3, 4]
+    assert all(r["collector"] == "Dummy" and "timestamp" in r for r in records)
+
+
+def test_missing_and_late_columns_become_nan():
+    store = ColumnarSampleStore(chunk_size=2)
+    store.append(1.0, {"a": 1})
+    store.append(2.0, {"a": 2})
+    store.append(3.0, {"a": 3, "b": 0.5})
+
+    df = store.to_dataframe()
+
+    assert list(df.columns) == ["a", "b"]
+    assert df["a"].tolist() == [1, 2, 3]
+    assert math.isnan(df["b"].iloc[0]) and df["b"].iloc[2] == 0.5
+    assert "b" not in store.to_records()[0]
+
+
+def test_mixed_types_promote_column():
+    store = ColumnarSampleStore()
+    store.append(1.0, {"v": 1})
+    store.append(2.0, {"v": 2.5})
+    store.append(3.0, {"s": "x"})
+    store.append(4.0, {"s": 7})
+
+    assert store.column("v").dtype == np.float64
+    assert store.column("s").tolist() == [None, None, "x", 7]
+
+
+def test_ring_buffer_keeps_latest_samples_and_recycles_chunks():
+    store = ColumnarSampleStore(chunk_size=4, max_samples=5)
+    for idx in range(23):
+        store.append(float(idx), {"v": idx})
+
+    assert len(store) == 5
+    assert store.column("v").tolist() == [18, 19, 20, 21, 22]
+    assert store.timestamps().tolist() == [18.0, 19.0, 20.0, 21.0, 22.0]
+    assert len(store._chunks) <= 3
+
+
+def test_clear_resets_store():
+    store = ColumnarSampleStore()
+    store.append(1.0, {"v": 1})
+    store.clear()
+
+    assert len(store) == 0
+    assert store.to_records() == []
+    assert store.to_dataframe().empty
+
+
+def test_dataframe_index_follows_dst_changes(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Rome")
+    store = ColumnarSampleStore()
+    # 2024-03-31 00:30 and 01:30 UTC straddle the CET -> CEST switch.
+    store.append(1711845000.0, {"v": 1})
+    store.append(1711848600.0, {"v": 2})
+
+    index = store.to_dataframe().index
+
+    assert [str(ts) for ts in index] == [
+        "2024-03-31 01:30:00",
+        "2024-03-31 03:30:00",
+    ]
@@ -1,7 +1,10 @@
 """Unit tests for metrics collection service."""
 
+import json
 from pathlib import Path
 from unittest.mock import MagicMock
+
+import pandas as pd
 import pytest
 from lb_runner.api import collect_metrics
 
@@ -17,7 +20,7 @@ def test_collect_metrics_saves_only_to_rep_dir(tmp_path: Path):
 
     collector = MagicMock()
     collector.name = "test_collector"
-    collector.get_data.return_value = "some_data"
+    collector.get_dataframe.return_value = pd.DataFrame({"value": [1.0, 3.0]})
 
     # Mock save_data to actually write a file so we can check for existence
     def save_data_side_effect(path: Path):
@@ -37,4 +40,39 @@ def test_collect_metrics_saves_only_to_rep_dir(tmp_path: Path):
         not workload_file.exists()
     ), "Collector file should NOT exist in workload directory"
 
-    assert result["metrics"]["test_collector"] == "some_data"
+    reference = result["metrics"]["test_collector"]
+    assert reference["samples_file"] == f"rep1/{expected_filename}"
+    assert reference["sample_count"] == 2
+    assert reference["summary"]["value"]["mean"] == 2.0
+
+
+def test_collect_metrics_does_not_embed_samples(tmp_path: Path):
+    rep_dir = tmp_path / "rep1"
+    rep_dir.mkdir()
+    collector = MagicMock()
+    collector.name = "single"
+    collector.get_dataframe.return_value = pd.DataFrame({"value": [5]})
+    collector.get_errors.return_value = []
+
+    result = {"metrics": {}}
+    collect_metrics([collector], tmp_path, rep_dir, "wl", 1, result)
+
+    reference = result["metrics"]["single"]
+    collector.get_data.assert_not_called()
+    assert reference["summary"]["value"]["std"] is None
+    json.dumps(reference, allow_nan=False)
+
+
+def test_collect_metrics_keeps_summary_when_save_fails(tmp_path: Path):
+    collector = MagicMock()
+    collector.name = "broken"
+    collector.get_dataframe.return_value = pd.DataFrame({"value": [1]})
+    collector.save_data.side_effect = OSError("disk full")
+    collector.get_errors.return_value = []
+
+    result = {"metrics": {}}
+    collect_metrics([collector], tmp_path, tmp_path / "rep1", "wl", 1, result)
+
+    assert result["metrics"]["broken"]["samples_file"] is None
+    assert result["metrics"]["broken"]["sample_count"] == 1
+    assert result["success"] is False
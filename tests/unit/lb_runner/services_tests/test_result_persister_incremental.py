@@ -8,9 +8,10 @@ from unittest.mock import MagicMock
 
 import lb_runner.services.result_persister as result_persister_mod
 from lb_runner.services.result_persister import ResultPersister
+from lb_runner.services.results_log import ResultsLog
 
 
-def test_process_results_writes_aggregate_json_and_exports_once(
+def test_process_results_appends_to_log_and_materializes_on_export(
     monkeypatch,
     tmp_path: Path,
 ) -> None:
@@ -18,6 +19,7 @@ def test_process_results_writes_aggregate_json_and_exports_once(
     plugin.export_results_to_csv.return_value = []
     persister = ResultPersister(run_id="run-1")
     results_path = tmp_path / "stress_ng_results.json"
+    log_path = tmp_path / "stress_ng_results.jsonl"
     merge_spy = MagicMock(wraps=result_persister_mod.merge_results)
     monkeypatch.setattr(result_persister_mod, "merge_results", merge_spy)
 
@@ -28,12 +30,6 @@ def test_process_results_writes_aggregate_json_and_exports_once(
         "stress_ng",
         export_results=False,
     )
-
-    assert results_path.exists()
-    assert json.loads(results_path.read_text()) == [{"repetition": 1, "value": "a"}]
-    assert plugin.export_results_to_csv.call_count == 0
-    assert merge_spy.call_count == 1
-
     persister.process_results(
         plugin,
         [{"repetition": 2, "value": "b"}],
@@ -42,12 +38,10 @@ def test_process_results_writes_aggregate_json_and_exports_once(
         export_results=False,
     )
 
-    assert json.loads(results_path.read_text()) == [
-        {"repetition": 1, "value": "a"},
-        {"repetition": 2, "value": "b"},
-    ]
+    assert not results_path.exists()
+    assert len(log_path.read_text().splitlines()) == 2
     assert plugin.export_results_to_csv.call_count == 0
-    assert merge_spy.call_count == 1
+    assert merge_spy.call_count == 0
 
     persister.process_results(
         plugin,
@@ -65,21 +59,42 @@ def test_process_results_writes_aggregate_json_and_exports_once(
     ]
 
     saved = json.loads(results_path.read_text())
-    assert saved == [
-        {"repetition": 1, "value": "a"},
+    assert saved == exported
+    assert not log_path.exists()
+    assert merge_spy.call_count == 1
+
+
+def test_process_results_latest_repetition_wins(tmp_path: Path) -> None:
+    plugin = MagicMock()
+    plugin.export_results_to_csv.return_value = []
+    results_path = tmp_path / "stress_ng_results.json"
+    results_path.write_text(json.dumps([{"repetition": 1, "value": "old"}]))
+
+    persister = ResultPersister(run_id="run-1")
+    persister.process_results(
+        plugin,
+        [{"repetition": 1, "value": "retry"}],
+        tmp_path,
+        "stress_ng",
+        export_results=False,
+    )
+    persister.process_results(
+        plugin,
+        [{"repetition": 2, "value": "b"}],
+        tmp_path,
+        "stress_ng",
+        export_results=True,
+    )
+
+    assert json.loads(results_path.read_text()) == [
+        {"repetition": 1, "value": "retry"},
         {"repetition": 2, "value": "b"},
     ]
-    assert merge_spy.call_count == 1
 
 
-def test_process_results_cache_is_instance_local(
-    monkeypatch,
-    tmp_path: Path,
-) -> None:
+def test_process_results_log_is_shared_across_instances(tmp_path: Path) -> None:
     plugin = MagicMock()
     plugin.export_results_to_csv.return_value = []
-    merge_spy = MagicMock(wraps=result_persister_mod.merge_results)
-    monkeypatch.setattr(result_persister_mod, "merge_results", merge_spy)
 
     first = ResultPersister(run_id="run-1")
     first.process_results(
@@ -104,5 +119,36 @@ def test_process_results_cache_is_instance_local(
         {"repetition": 1, "value": "a"},
         {"repetition": 2, "value": "b"},
     ]
-    assert merge_spy.call_count == 2
     assert plugin.export_results_to_csv.call_count == 1
+
+
+def test_results_log_skips_torn_tail(tmp_path: Path) -> None:
+    log_path = tmp_path / "wl_results.jsonl"
+    log = ResultsLog(log_path)
+    log.append([{"repetition": 1, "v": 1}, {"repetition": 2, "v": 2}])
+    log.append([{"repetition": 1, "v": 3}])
+    with log_path.open("ab") as handle:
+        handle.write(b'{"repetition": 4, "v"')
+
+    assert [entry["v"] for entry in ResultsLog(log_path).entries()] == [1, 2, 3]
+
+
+def test_append_after_torn_tail_keeps_the_new_entry(tmp_path: Path) -> None:
+    log_path = tmp_path / "wl_results.jsonl"
+    ResultsLog(log_path).append([{"repetition": 1}])
+    with log_path.open("ab") as handle:
+        handle.write(b'{"repetition": 2, "v"')
+
+    ResultsLog(log_path).append([{"repetition": 2}])
+
+    assert ResultsLog(log_path).entries() == [{"repetition": 1}, {"repetition": 2}]
+    assert log_path.read_bytes().endswith(b"\n")
+
+
+def test_append_repairs_a_torn_first_line(tmp_path: Path) -> None:
+    log_path = tmp_path / "wl_results.jsonl"
+    log_path.write_bytes(b'{"repetition": 1, "v"')
+
+    ResultsLog(log_path).append([{"repetition": 2}])
+
+    assert ResultsLog(log_path).entries() == [{"repetition": 2}]
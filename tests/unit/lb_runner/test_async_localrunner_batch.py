@@ -0,0 +1,104 @@
+"""Tests for batched repetitions in the async LocalRunner entrypoint."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lb_runner.api import RunEvent
+from lb_runner.services import async_localrunner
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+
+class _FakeRunner:
+    """Stand-in LocalRunner that reports a fixed status per repetition."""
+
+    calls: list[dict] = []
+    statuses: dict[int, str] = {}
+
+    def __init__(self, cfg, *, progress_callback=None, host_name="host", **_kw):
+        self._callback = progress_callback
+        self._host = host_name
+
+    def run_benchmark(self, test_type, **kwargs):
+        type(self).calls.append(kwargs)
+        for rep in kwargs["pending_reps"] or [kwargs["repetition_override"]]:
+            status = type(self).statuses.get(rep)
+            if status is None:
+                break
+            if self._callback:
+                self._callback(
+                    RunEvent(
+                        run_id=kwargs["run_id"],
+                        host=self._host,
+                        workload=test_type,
+                        repetition=rep,
+                        total_repetitions=kwargs["total_repetitions"],
+                        status=status,
+                    )
+                )
+        return all(s == "done" for s in type(self).statuses.values())
+
+
+@pytest.fixture
+def batch_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    config_path = tmp_path / "benchmark_config.generated.json"
+    config_path.write_text(
+        json.dumps({"workloads": {"stress_ng": {"plugin": "stress_ng"}}})
+    )
+    status_path = tmp_path / "status.json"
+    for name, value in {
+        "LB_RUN_WORKLOAD": "stress_ng",
+        "LB_RUN_REPETITIONS": "2,3,4",
+        "LB_RUN_TOTAL_REPS": "4",
+        "LB_RUN_ID": "run-1",
+        "LB_RUN_HOST": "node1",
+        "LB_BENCH_CONFIG_PATH": str(config_path),
+        "LB_RUN_STOP_FILE": str(tmp_path / "STOP"),
+        "LB_EVENT_STREAM_PATH": str(tmp_path / "lb_events.stream.log"),
+        "LB_RUN_STATUS_PATH": str(status_path),
+    }.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv("LB_RUN_REPETITION", raising=False)
+    monkeypatch.delenv("LB_RUN_DAEMONIZE", raising=False)
+    monkeypatch.setattr(async_localrunner, "_configure_stream", lambda _path: None)
+    monkeypatch.setattr(async_localrunner, "LocalRunner", _FakeRunner)
+    _FakeRunner.calls = []
+    return status_path
+
+
+def _events(out: str) -> list[dict]:
+    return [
+        json.loads(line.split("LB_EVENT", 1)[1])
+        for line in out.splitlines()
+        if line.startswith("LB_EVENT")
+    ]
+
+
+def test_batch_runs_all_repetitions_in_one_runner(batch_env: Path, capsys):
+    _FakeRunner.statuses = {2: "done", 3: "done", 4: "done"}
+
+    assert async_localrunner.main() == 0
+
+    assert len(_FakeRunner.calls) == 1
+    assert _FakeRunner.calls[0]["pending_reps"] == [2, 3, 4]
+    # LocalRunner reports each repetition itself; no summary event is added.
+    assert _events(capsys.readouterr().out) == []
+    status = json.loads(batch_env.read_text())
+    assert status["rc"] == 0
+    assert status["repetitions"] == {"2": "done", "3": "done", "4": "done"}
+
+
+def test_batch_failure_reports_unfinished_repetitions(batch_env: Path, capsys):
+    _FakeRunner.statuses = {2: "done", 3: "failed"}
+
+    assert async_localrunner.main() == 1
+
+    events = _events(capsys.readouterr().out)
+    assert [(e["repetition"], e["status"]) for e in events] == [(4, "failed")]
+    status = json.loads(batch_env.read_text())
+    assert status["rc"] == 1
+    assert status["repetitions"] == {"2": "done", "3": "failed", "4": "failed"}
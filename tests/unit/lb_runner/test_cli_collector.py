@@ -27,3 +27,118 @@ def test_aggregate_cli_ignores_non_numeric():
     result = aggregate_cli(df)
     assert "note_avg" not in result
     assert result["processes_running_avg"] == 2.0
+
+
+def test_streaming_converts_commands_to_continuous_form(monkeypatch):
+    from lb_runner.metric_collectors import cli_collector as cli_mod
+
+    monkeypatch.setattr(cli_mod.shutil, "which", lambda _name: None)
+    collector = cli_mod.CLICollector(interval_seconds=2.0, streaming=True)
+
+    assert collector._continuous_args("vmstat 1 1") == ["vmstat", "1"]
+    assert collector._continuous_args("iostat -d 1 1") == ["iostat", "-d", "1"]
+    assert collector._continuous_args("sar -u") == ["sar", "-u", "2"]
+    assert collector._continuous_args("free -m") is None
+    assert collector._continuous_args("vmstat 1 1 | tail -1") is None
+
+
+def test_streaming_parses_vmstat_rows_incrementally():
+    import io
+
+    from lb_runner.metric_collectors.cli_collector import CLICollector
+
+    output = io.StringIO(
+        "procs -----------memory---------- ---swap-- -----io---- -system-- "
+        "------cpu-----\n"
+        " r  b   swpd   free   buff  cache   si   so    bi    bo   in   cs "
+        "us sy id wa st\n"
+        " 2  0      0 100000  2000  30000    0    0     1     2   10   20  "
+        "5  1 94  0  0\n"
+        " 3  1      0 100000  2000  30000    0    0     3     4   11   21  "
+        "6  2 92  0  0\n"
+    )
+    collector = CLICollector(streaming=True)
+
+    rows = list(collector._iter_stream_rows("vmstat 1", output))
+
+    assert [row["runnable_procs"] for row in rows] == [2, 3]
+    assert all(not key.startswith("_jc") for row in rows for key in row)
+
+
+def test_streaming_mode_collects_from_long_running_process():
+    import shutil
+    import time
+
+    from lb_runner.metric_collectors.cli_collector import CLICollector
+
+    if shutil.which("vmstat") is None:
+        pytest.skip("vmstat not installed")
+    collector = CLICollector(
+        interval_seconds=1.0, commands=["vmstat 1 1"], streaming=True
+    )
+    collector.start()
+    deadline = time.time() + 5
+    while not collector.get_data() and time.time() < deadline:
+        time.sleep(0.1)
+    collector.stop()
+
+    assert collector.get_data()
+    assert collector._streams == []
+
+
+def test_streaming_keeps_first_pidstat_row_per_interval():
+    import io
+
+    from lb_runner.metric_collectors.cli_collector import CLICollector
+
+    output = io.StringIO(
+        "Linux 6.1.0 (host) \t01/01/2024 \t_x86_64_\t(2 CPU)\n"
+        "\n"
+        "#      Time   UID       PID    %usr %system  %guest   %wait    %CPU"
+        "   CPU  Command\n"
+        " 1704103202     0         1    1.00    0.00    0.00    0.00    1.00"
+        "     0  systemd\n"
+        " 1704103202     0        10    2.00    0.00    0.00    0.00    2.00"
+        "     1  kworker\n"
+        "\n"
+        "#      Time   UID       PID    %usr %system  %guest   %wait    %CPU"
+        "   CPU  Command\n"
+        " 1704103203     0        10    3.00    0.00    0.00    0.00    3.00"
+        "     1  kworker\n"
+    )
+    collector = CLICollector(streaming=True)
+
+    rows = list(collector._iter_interval_rows("pidstat -h 1", output))
+
+    assert [(row["time"], row["pid"]) for row in rows] == [
+        (1704103202, 1),
+        (1704103203, 10),
+    ]
+
+
+def test_streaming_drops_vmstat_since_boot_row_and_merges_per_sample():
+    import io
+
+    from lb_runner.metric_collectors.cli_collector import CLICollector
+
+    output = io.StringIO(
+        "procs -----------memory---------- ---swap-- -----io---- -system-- "
+        "------cpu-----\n"
+        " r  b   swpd   free   buff  cache   si   so    bi    bo   in   cs "
+        "us sy id wa st\n"
+        " 9  0      0 100000  2000  30000    0    0     1     2   10   20  "
+        "5  1 94  0  0\n"
+        " 3  1      0 100000  2000  30000    0    0     3     4   11   21  "
+        "6  2 92  0  0\n"
+    )
+    collector = CLICollector(streaming=True)
+
+    rows = list(collector._iter_interval_rows("vmstat 1", output))
+    assert [row["runnable_procs"] for row in rows] == [3]
+
+    collector._polled_commands = []
+    collector._stream_rows = {"vmstat 1": rows[0], "sar -u 1": {"sar_idle_pct": 9.0}}
+    sample = collector._collect_metrics()
+
+    assert sample["runnable_procs"] == 3 and sample["sar_idle_pct"] == 9.0
+    assert collector._collect_metrics() == {}
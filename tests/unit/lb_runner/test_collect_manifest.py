@@ -0,0 +1,92 @@
+"""Tests for the incremental collect manifest."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from lb_runner.services import collect_manifest
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+
+def _listed(path: Path) -> list[str]:
+    return [p.decode() for p in path.read_bytes().split(b"\0") if p]
+
+
+def _plan(root: Path, state: Path, local_copy: Path | None) -> dict:
+    expect = (
+        collect_manifest.file_sha256(local_copy)
+        if local_copy is not None and local_copy.exists()
+        else None
+    )
+    return collect_manifest.plan(
+        root,
+        "fio",
+        state / "fio.json",
+        state / "fio.list",
+        expected_sha256=expect,
+    )
+
+
+def _sync(state: Path, local_copy: Path) -> None:
+    """Mimic the controller storing the pending manifest, then commit."""
+    shutil.copyfile(state / "fio.json.pending", local_copy)
+    assert collect_manifest.commit(state / "fio.json")
+
+
+def test_plan_lists_only_new_or_changed_files(tmp_path: Path):
+    root = tmp_path / "host"
+    (root / "fio" / "rep1").mkdir(parents=True)
+    (root / "fio" / "rep1" / "result.json").write_text("{}")
+    (root / "fio" / "fio.log").write_text("line 1\n")
+    state = root / ".lb_collect"
+    local_copy = tmp_path / "local.json"
+
+    first = _plan(root, state, local_copy)
+    assert first["full"] is True
+    assert _listed(state / "fio.list") == ["fio/fio.log", "fio/rep1/result.json"]
+    _sync(state, local_copy)
+
+    (root / "fio" / "rep2").mkdir()
+    (root / "fio" / "rep2" / "result.json").write_text("{}")
+    with (root / "fio" / "fio.log").open("a") as handle:
+        handle.write("line 2\n")
+    second = _plan(root, state, local_copy)
+    assert second["full"] is False
+    assert _listed(state / "fio.list") == ["fio/fio.log", "fio/rep2/result.json"]
+    _sync(state, local_copy)
+
+    # Touching a file without changing it does not resend it.
+    log = root / "fio" / "fio.log"
+    os.utime(log, ns=(log.stat().st_atime_ns, log.stat().st_mtime_ns + 10**9))
+    assert _plan(root, state, local_copy)["changed"] == 0
+
+
+def test_plan_resends_everything_when_manifests_disagree(tmp_path: Path):
+    root = tmp_path / "host"
+    (root / "fio").mkdir(parents=True)
+    (root / "fio" / "a.log").write_text("a")
+    state = root / ".lb_collect"
+    local_copy = tmp_path / "local.json"
+    _plan(root, state, local_copy)
+    _sync(state, local_copy)
+
+    # A collect that never reached the controller leaves the copies apart.
+    (root / "fio" / "b.log").write_text("b")
+    _plan(root, state, local_copy)
+    collect_manifest.commit(state / "fio.json")
+
+    summary = _plan(root, state, local_copy)
+    assert summary["full"] is True
+    assert _listed(state / "fio.list") == ["fio/a.log", "fio/b.log"]
+    pending = json.loads((state / "fio.json.pending").read_text())
+    assert set(pending["files"]) == {"fio/a.log", "fio/b.log"}
+
+
+def test_commit_without_pending_manifest_is_a_no_op(tmp_path: Path):
+    assert collect_manifest.commit(tmp_path / "fio.json") is False
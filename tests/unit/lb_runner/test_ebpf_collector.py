@@ -0,0 +1,107 @@
+"""Tests for EBPFCollector histogram streaming and aggregation."""
+
+import io
+import json
+
+import pandas as pd
+import pytest
+
+from lb_runner.metric_collectors import ebpf_collector as ebpf_mod
+from lb_runner.metric_collectors.aggregators import aggregate_ebpf
+from lb_runner.metric_collectors.ebpf_collector import EBPFCollector
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+
+def _hist(name, buckets):
+    return json.dumps({"type": "hist", "data": {f"@{name}": buckets}}) + "\n"
+
+
+def _marker():
+    return json.dumps({"type": "printf", "data": "lb-interval\n"}) + "\n"
+
+
+def test_snapshots_are_split_on_interval_markers():
+    stream = io.StringIO(
+        json.dumps({"type": "attached_probes", "data": {"probes": 3}})
+        + "\n"
+        + _hist(
+            "bio_latency_us",
+            [{"min": 2, "max": 3, "count": 4}, {"min": 4, "max": 7, "count": 0}],
+        )
+        + _hist("runq_latency_us", [{"min": 0, "max": 0, "count": 9}])
+        + _marker()
+        + _hist("bio_latency_us", [{"min": 8, "max": 15, "count": 1}])
+        + _hist("bio_start", [{"min": 0, "max": 1, "count": 1}])
+    )
+
+    rows = list(
+        ebpf_mod._iter_snapshots(stream, {"bio_latency_us", "runq_latency_us"})
+    )
+
+    assert rows == [
+        {"bio_latency_us_le_3": 4, "runq_latency_us_le_0": 9},
+        {"bio_latency_us_le_15": 1},
+    ]
+
+
+def test_script_only_includes_selected_histograms():
+    collector = EBPFCollector(interval_seconds=0.5, histograms=["runq_latency_us"])
+
+    script = collector.build_script()
+
+    assert "interval:ms:500" in script
+    assert "@runq_latency_us = hist(" in script
+    assert "block_rq_issue" not in script and "sys_enter" not in script
+
+
+def test_stop_during_launch_still_ends_bpftrace(monkeypatch):
+    collector = EBPFCollector()
+    signals: list[int] = []
+
+    class FakeProcess:
+        stdout = io.StringIO("")
+
+        def __init__(self, *args, **kwargs):
+            # stop() lands after Popen was called but before the loop
+            # thread has published the process.
+            collector.stop()
+
+        def poll(self):
+            return None if not signals else 0
+
+        def send_signal(self, sig):
+            signals.append(sig)
+
+        def wait(self, timeout=None):
+            return 0
+
+    monkeypatch.setattr(ebpf_mod.subprocess, "Popen", FakeProcess)
+    collector._is_running = True
+
+    collector._collection_loop()
+
+    assert signals == [ebpf_mod.signal.SIGINT]
+    assert collector._process is None
+
+
+def test_unknown_histogram_is_rejected():
+    with pytest.raises(ValueError):
+        EBPFCollector(histograms=["tcp_latency_us"])
+
+
+def test_aggregate_ebpf_merges_buckets_before_percentiles():
+    df = pd.DataFrame(
+        {
+            "bio_latency_us_le_3": [40, 50],
+            "bio_latency_us_le_7": [5, 4],
+            "bio_latency_us_le_1023": [None, 1],
+        }
+    )
+
+    summary = aggregate_ebpf(df)
+
+    assert summary["bio_latency_us_count"] == 100
+    assert summary["bio_latency_us_p50"] == 3.0
+    assert summary["bio_latency_us_p99"] == 7.0
@@ -0,0 +1,116 @@
+"""Tests for PerfStatCollector stream parsing and event fallback."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from lb_runner.metric_collectors import perf_collector as perf_mod
+from lb_runner.metric_collectors.aggregators import aggregate_perf
+from lb_runner.metric_collectors.perf_collector import PerfStatCollector
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+INTERVAL_OUTPUT = """# started on Mon Jan  1 00:00:00 2024
+
+     1.001000000,2000,,cpu-cycles,1000000,100.00,,
+     1.001000000,3000,,instructions,1000000,100.00,1.50,insn per cycle
+     1.001000000,100,,cache-references,1000000,100.00,,
+     1.001000000,25,,cache-misses,1000000,100.00,,
+     1.001000000,<not counted>,,branches,0,0.00,,
+     2.002000000,1000,,cpu_core/cycles/,1000000,100.00,,
+     2.002000000,1000,,cpu_atom/cycles/,1000000,100.00,,
+     2.002000000,1000,,instructions,1000000,100.00,,
+"""
+
+
+def test_intervals_are_grouped_with_derived_rates():
+    rows = [
+        (offset, perf_mod._with_derived_metrics(row))
+        for offset, row in perf_mod._iter_intervals(io.StringIO(INTERVAL_OUTPUT))
+    ]
+
+    assert [offset for offset, _ in rows] == [1.001, 2.002]
+    first, second = rows[0][1], rows[1][1]
+    assert first["ipc"] == pytest.approx(1.5)
+    assert first["cache_miss_percent"] == pytest.approx(25.0)
+    assert "branches" not in first and "branch_miss_percent" not in first
+    assert second["cpu_cycles"] == 2000
+    assert second["ipc"] == pytest.approx(0.5)
+
+
+def test_falls_back_to_software_events_when_pmu_is_blocked(monkeypatch):
+    collector = PerfStatCollector(events=["cpu-cycles", "instructions"])
+
+    def fake_probe(events):
+        return {"task-clock", "page-faults"} if "task-clock" in events else set()
+
+    monkeypatch.setattr(collector, "_probe", fake_probe)
+
+    assert collector._resolve_events() == ["task-clock", "page-faults"]
+
+
+def test_build_command_targets_pid_or_cpu():
+    by_pid = PerfStatCollector(events=["instructions"], interval_ms=200, pid=42)
+    by_cpu = PerfStatCollector(events=["instructions"], cpu=3)
+
+    assert by_pid._build_command(["instructions"]) == [
+        "perf",
+        "stat",
+        "-I",
+        "200",
+        "-x,",
+        "-e",
+        "instructions",
+        "-p",
+        "42",
+    ]
+    assert by_cpu._build_command(["a", "b"])[-4:] == ["a,b", "-a", "-C", "3"]
+
+
+def test_stop_during_launch_still_ends_perf(monkeypatch):
+    collector = PerfStatCollector(events=["instructions"])
+    signals: list[int] = []
+
+    class FakeProcess:
+        stderr = io.StringIO("")
+
+        def __init__(self, *args, **kwargs):
+            # stop() lands after Popen was called but before the loop
+            # thread has published the process.
+            collector.stop()
+
+        def poll(self):
+            return None if not signals else 0
+
+        def send_signal(self, sig):
+            signals.append(sig)
+
+        def wait(self, timeout=None):
+            return 0
+
+    monkeypatch.setattr(perf_mod.subprocess, "Popen", FakeProcess)
+    collector._is_running = True
+
+    collector._collection_loop()
+
+    assert signals == [perf_mod.signal.SIGINT]
+    assert collector._process is None
+
+
+def test_aggregate_perf_summarizes_ipc_and_miss_rates():
+    df = pd.DataFrame(
+        {
+            "ipc": [1.0, 2.0],
+            "cache_miss_percent": [10.0, 30.0],
+            "instructions": [100.0, 300.0],
+        },
+        index=pd.date_range("2024-01-01", periods=2, freq="1s"),
+    )
+
+    summary = aggregate_perf(df)
+
+    assert summary["ipc_avg"] == 1.5
+    assert summary["ipc_min"] == 1.0
+    assert summary["cache_miss_percent_max"] == 30.0
+    assert summary["instructions_total"] == 400.0
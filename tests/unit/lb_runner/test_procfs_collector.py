@@ -0,0 +1,167 @@
+"""Tests for ProcfsCollector parsing and descriptor reuse."""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+import lb_runner.metric_collectors.procfs_collector as procfs_mod
+from lb_runner.metric_collectors.aggregators import aggregate_procfs
+from lb_runner.metric_collectors.procfs_collector import ProcfsCollector
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+STAT_T0 = """cpu  100 0 100 800 0 0 0 0 0 0
+cpu0 50 0 50 400 0 0 0 0 0 0
+cpu1 50 0 50 400 0 0 0 0 0 0
+ctxt 1000
+procs_running 2
+procs_blocked 0
+"""
+
+STAT_T1 = """cpu  150 0 150 850 50 0 0 0 0 0
+cpu0 100 0 100 400 0 0 0 0 0 0
+cpu1 50 0 50 450 50 0 0 0 0 0
+ctxt 1500
+procs_running 3
+procs_blocked 1
+"""
+
+
+@pytest.fixture
+def proc_root(tmp_path: Path, monkeypatch) -> Path:
+    root = tmp_path / "proc"
+    (root / "net").mkdir(parents=True)
+    (root / "pressure").mkdir()
+    (root / "stat").write_text(STAT_T0)
+    (root / "meminfo").write_text(
+        "MemTotal:       1000 kB\n"
+        "MemAvailable:    250 kB\n"
+        "Cached:          100 kB\n"
+        "SwapTotal:       200 kB\n"
+        "SwapFree:        150 kB\n"
+    )
+    (root / "diskstats").write_text(
+        "   8       0 sda 10 0 8 0 20 0 16 0 0 7 0 0 0 0 0\n"
+        "   7       0 loop0 1 0 2 0 3 0 4 0 0 0 0 0 0 0 0\n"
+    )
+    (root / "net" / "dev").write_text(
+        "Inter-|   Receive\n"
+        " face |bytes packets\n"
+        "  eth0: 1000 1 0 0 0 0 0 0 2000 2 0 0 0 0 0 0\n"
+        "    lo: 10 1 0 0 0 0 0 0 10 1 0 0 0 0 0 0\n"
+    )
+    (root / "pressure" / "cpu").write_text(
+        "some avg10=1.50 avg60=0.00 avg300=0.00 total=1234\n"
+    )
+    block = tmp_path / "block"
+    (block / "sda").mkdir(parents=True)
+    (block / "loop0").mkdir()
+    monkeypatch.setattr(procfs_mod, "SYS_BLOCK", block)
+    return root
+
+
+def test_collects_rates_and_counters_from_open_descriptors(proc_root: Path):
+    collector = ProcfsCollector(proc_root=proc_root)
+    collector._open_files()
+    try:
+        first = collector._collect_metrics()
+        assert "cpu_percent" not in first
+
+        # Rewrite in place: the already-open descriptor must see new content.
+        with open(proc_root / "stat", "r+") as handle:
+            handle.write(STAT_T1)
+        second = collector._collect_metrics()
+    finally:
+        collector._close_files()
+
+    assert second["cpu_percent"] == pytest.approx(50.0)
+    assert second["cpu0_percent"] == pytest.approx(100.0)
+    assert second["cpu1_percent"] == pytest.approx(0.0)
+    assert second["cpu_iowait_percent"] == pytest.approx(25.0)
+    assert second["context_switches"] == 1500
+    assert second["memory_usage"] == pytest.approx(75.0)
+    assert second["swap_used_bytes"] == 50 * 1024
+    assert second["disk_sda_read_bytes"] == 8 * 512
+    assert "disk_loop0_read_bytes" not in second
+    assert second["disk_write_bytes"] == 16 * 512
+    assert second["net_eth0_bytes_sent"] == 2000
+    assert second["net_bytes_recv"] == 1010
+    assert second["psi_cpu_some_avg10"] == 1.5
+    assert second["psi_cpu_some_total_us"] == 1234
+    assert collector._fds == {}
+
+
+def test_missing_sources_are_skipped(tmp_path: Path):
+    root = tmp_path / "proc"
+    root.mkdir()
+    (root / "stat").write_text(STAT_T0)
+    collector = ProcfsCollector(proc_root=root)
+    collector._open_files()
+    try:
+        assert set(collector._fds) == {"stat"}
+        assert collector._collect_metrics()["procs_running"] == 2
+    finally:
+        collector._close_files()
+
+
+def test_read_spans_multiple_chunks(tmp_path: Path, monkeypatch):
+    root = tmp_path / "proc"
+    root.mkdir()
+    (root / "stat").write_text(STAT_T0)
+    monkeypatch.setattr(procfs_mod, "_READ_SIZE", 16)
+    collector = ProcfsCollector(proc_root=root)
+    collector._open_files()
+    try:
+        assert collector._read("stat") == STAT_T0.encode()
+        assert collector._collect_metrics()["procs_blocked"] == 0
+    finally:
+        collector._close_files()
+
+
+def test_stop_leaves_descriptors_to_a_sampler_still_reading(tmp_path: Path):
+    root = tmp_path / "proc"
+    root.mkdir()
+    (root / "stat").write_text(STAT_T0)
+    collector = ProcfsCollector(interval_seconds=0.01, proc_root=root)
+    reading = threading.Event()
+    release = threading.Event()
+    read = collector._read
+
+    def slow_read(key):
+        reading.set()
+        release.wait(5)
+        return read(key)
+
+    collector._read = slow_read
+    collector.start()
+    assert reading.wait(5)
+    fd = collector._fds["stat"]
+
+    collector.stop()
+    os.fstat(fd)  # still open: the sampler has not left _read() yet
+
+    release.set()
+    collector._thread.join(5)
+    assert collector._fds == {}
+
+
+def test_aggregate_procfs_adds_tail_metrics():
+    import pandas as pd
+
+    index = pd.date_range("2024-01-01", periods=4, freq="100ms")
+    df = pd.DataFrame(
+        {
+            "cpu_percent": [10.0, 20.0, 90.0, 30.0],
+            "psi_io_some_avg10": [0.0, 2.0, 1.0, 0.5],
+        },
+        index=index,
+    )
+
+    summary = aggregate_procfs(df)
+
+    assert summary["cpu_usage_percent_max"] == 90.0
+    assert "cpu_usage_percent_p99" in summary
+    assert summary["psi_io_some_avg10_max"] == 2.0
@@ -0,0 +1,76 @@
+"""Tests for the resident runner agent."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from lb_runner.services import runner_agent
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+
+def _wait_for(path: Path, timeout: float = 20.0) -> str:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and path.read_text():
+            return path.read_text()
+        time.sleep(0.05)
+    raise AssertionError(f"{path} was not written")
+
+
+def test_submit_without_agent_reports_unavailable(tmp_path: Path):
+    assert runner_agent.submit(tmp_path / "missing.sock") == (
+        runner_agent.EXIT_UNAVAILABLE
+    )
+
+
+def test_agent_runs_repetitions_through_the_file_contract(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    sock = tmp_path / "agent.sock"
+    assert runner_agent.start_agent(sock, idle_timeout=60) == 0
+    try:
+        first_agent = runner_agent.request(sock, {"op": "ping"})["pid"]
+        # Starting again replaces the running agent.
+        assert runner_agent.start_agent(sock, idle_timeout=60) == 0
+        assert runner_agent.request(sock, {"op": "ping"})["pid"] != first_agent
+
+        status_path = tmp_path / "status.json"
+        pid_path = tmp_path / "runner.pid"
+        stream_path = tmp_path / "lb_events.stream.log"
+        monkeypatch.chdir(tmp_path)
+        for name, value in {
+            "LB_RUN_WORKLOAD": "stress_ng",
+            "LB_RUN_REPETITION": "2",
+            "LB_RUN_TOTAL_REPS": "3",
+            "LB_RUN_HOST": "node1",
+            "LB_RUN_DAEMONIZE": "1",
+            "LB_RUN_PID_PATH": str(pid_path),
+            "LB_RUN_STATUS_PATH": str(status_path),
+            "LB_EVENT_STREAM_PATH": str(stream_path),
+            # A missing config makes the repetition fail fast after startup.
+            "LB_BENCH_CONFIG_PATH": str(tmp_path / "missing.json"),
+        }.items():
+            monkeypatch.setenv(name, value)
+
+        assert runner_agent.submit(sock) == 0
+
+        assert int(pid_path.read_text()) > 0
+        assert json.loads(_wait_for(status_path))["rc"] == 1
+        events = [
+            json.loads(line.split("LB_EVENT", 1)[1])
+            for line in stream_path.read_text().splitlines()
+            if line.startswith("LB_EVENT")
+        ]
+        assert events[-1]["status"] == "failed"
+        assert events[-1]["repetition"] == 2
+    finally:
+        runner_agent.main(["stop", "--socket", str(sock)])
+    deadline = time.monotonic() + 5
+    while sock.exists() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not sock.exists()
@@ -0,0 +1,59 @@
+"""Tests for the global setup cache marker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lb_runner.services import setup_cache
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+
+def _tree(root: Path) -> Path:
+    (root / "lb_runner" / "__pycache__").mkdir(parents=True)
+    (root / "lb_runner" / "mod.py").write_text("x = 1\n")
+    (root / "lb_runner" / "__pycache__" / "mod.cpython-312.pyc").write_bytes(b"1")
+    (root / "uv.lock").write_text("lock\n")
+    return root
+
+
+def test_setup_hash_tracks_sources_and_extras(tmp_path: Path) -> None:
+    root = _tree(tmp_path)
+    base = setup_cache.setup_hash(root, uv_extras=["b", "a"])
+
+    assert base == setup_cache.setup_hash(root, uv_extras=["a", "b"])
+    assert base != setup_cache.setup_hash(root, uv_extras=["a"])
+
+    (root / "lb_runner" / "__pycache__" / "mod.cpython-312.pyc").write_bytes(b"2")
+    assert base == setup_cache.setup_hash(root, uv_extras=["a", "b"])
+
+    (root / "lb_runner" / "mod.py").write_text("x = 2\n")
+    assert base != setup_cache.setup_hash(root, uv_extras=["a", "b"])
+
+
+def test_marker_requires_same_hash_and_fingerprint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    marker = tmp_path / "wd" / setup_cache.MARKER_NAME
+    monkeypatch.setattr(setup_cache, "setup_fingerprint", lambda: "host-a")
+
+    assert setup_cache.main(["check", "--marker", str(marker), "--hash", "h1"]) == (
+        setup_cache.EXIT_MISS
+    )
+    assert setup_cache.main(["write", "--marker", str(marker), "--hash", "h1"]) == 0
+    assert setup_cache.is_current(marker, "h1")
+    assert not setup_cache.is_current(marker, "h2")
+    assert not setup_cache.is_current(marker, "")
+
+    monkeypatch.setattr(setup_cache, "setup_fingerprint", lambda: "host-b")
+    assert not setup_cache.is_current(marker, "h1")
+
+
+def test_unreadable_marker_is_a_miss(tmp_path: Path) -> None:
+    marker = tmp_path / setup_cache.MARKER_NAME
+    marker.write_text("{not json")
+
+    assert setup_cache.read_marker(marker) == {}
+    assert not setup_cache.is_current(marker, "h1")
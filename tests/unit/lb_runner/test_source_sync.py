@@ -0,0 +1,136 @@
+"""Tests for the content-addressed source upload."""
+
+from __future__ import annotations
+
+import io
+import json
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from lb_runner.services import source_sync
+
+pytestmark = [pytest.mark.unit, pytest.mark.unit_runner]
+
+PATHS = ["pkg", "uv.lock"]
+
+
+def _source(root: Path) -> Path:
+    (root / "pkg" / "__pycache__").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("a = 1\n")
+    (root / "pkg" / "copy.py").write_text("a = 1\n")
+    (root / "pkg" / "run.sh").write_text("#!/bin/sh\n")
+    (root / "pkg" / "run.sh").chmod(0o755)
+    (root / "pkg" / "__pycache__" / "a.cpython-312.pyc").write_bytes(b"x")
+    (root / "uv.lock").write_text("lock\n")
+    return root
+
+
+def _write_manifest(src: Path, out: Path) -> dict:
+    manifest = source_sync.build_manifest(src, PATHS)
+    out.write_text(json.dumps(manifest))
+    return manifest["files"]
+
+
+def _pack(src: Path, rels: list[str], archive: Path) -> Path:
+    with tarfile.open(archive, "w:gz") as tar:
+        for rel in rels:
+            tar.add(src / rel, arcname=rel)
+    return archive
+
+
+def _sync(src: Path, work: Path) -> dict[str, int]:
+    """Run one manifest/missing/pack/apply round like the setup playbook."""
+    work.mkdir(exist_ok=True)
+    store = work / "store"
+    manifest = work / "manifest.json"
+    files = _write_manifest(src, manifest)
+    missing = source_sync.missing_files(store, files)
+    archive = _pack(src, missing, work / "delta.tar.gz") if missing else None
+    return source_sync.apply_manifest(store, manifest, work / "dest", archive)
+
+
+def test_manifest_skips_bytecode_and_records_modes(tmp_path: Path) -> None:
+    src = _source(tmp_path / "src")
+
+    files = source_sync.build_manifest(src, PATHS)["files"]
+
+    assert sorted(files) == ["pkg/a.py", "pkg/copy.py", "pkg/run.sh", "uv.lock"]
+    assert files["pkg/run.sh"]["mode"] == 0o755
+    assert files["pkg/a.py"]["sha256"] == files["pkg/copy.py"]["sha256"]
+
+
+def test_sync_uploads_each_blob_once_then_only_changes(tmp_path: Path) -> None:
+    src = _source(tmp_path / "src")
+    work = tmp_path / "host"
+
+    first = _sync(src, work)
+    dest = work / "dest"
+    assert first == {"added": 3, "written": 4, "removed": 0, "pruned": 0}
+    assert (dest / "pkg" / "copy.py").read_text() == "a = 1\n"
+    assert (dest / "pkg" / "run.sh").stat().st_mode & 0o777 == 0o755
+
+    assert _sync(src, work) == {"added": 0, "written": 0, "removed": 0, "pruned": 0}
+
+    (src / "pkg" / "a.py").write_text("a = 2\n")
+    (src / "uv.lock").unlink()
+    third = _sync(src, work)
+    assert third == {"added": 1, "written": 1, "removed": 1, "pruned": 1}
+    assert (dest / "pkg" / "a.py").read_text() == "a = 2\n"
+    assert not (dest / "uv.lock").exists()
+
+
+def test_missing_file_in_dest_is_restored_from_store(tmp_path: Path) -> None:
+    src = _source(tmp_path / "src")
+    work = tmp_path / "host"
+    _sync(src, work)
+    (work / "dest" / "pkg" / "a.py").unlink()
+
+    assert _sync(src, work)["written"] == 1
+    assert (work / "dest" / "pkg" / "a.py").exists()
+
+
+def test_apply_rejects_content_that_does_not_match(tmp_path: Path) -> None:
+    src = _source(tmp_path / "src")
+    work = tmp_path / "host"
+    work.mkdir()
+    manifest = work / "manifest.json"
+    _write_manifest(src, manifest)
+    archive = work / "delta.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        data = b"tampered\n"
+        info = tarfile.TarInfo("pkg/a.py")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+
+    with pytest.raises(source_sync.SourceSyncError):
+        source_sync.apply_manifest(work / "store", manifest, work / "dest", archive)
+    assert not (work / "dest").exists()
+
+
+def test_cli_missing_writes_nul_separated_list(tmp_path: Path, capsys) -> None:
+    src = _source(tmp_path / "src")
+    manifest = tmp_path / "manifest.json"
+    _write_manifest(src, manifest)
+    listing = tmp_path / "missing"
+
+    rc = source_sync.main(
+        [
+            "missing",
+            "--store",
+            str(tmp_path / "store"),
+            "--manifest",
+            str(manifest),
+            "--list",
+            str(listing),
+        ]
+    )
+
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["missing"] == 3
+    assert listing.read_bytes().split(b"\0")[:-1] == [
+        b"pkg/a.py",
+        b"pkg/run.sh",
+        b"uv.lock",
+    ]
@@ -19,10 +19,10 @@ def _journal_with_tasks() -> RunJournal:
     task2 = journal.get_task("localhost", "w", 2)
     assert isinstance(task1, TaskState)
     assert isinstance(task2, TaskState)
-    task1.status = RunStatus.COMPLETED
+    journal.set_status(task1, RunStatus.COMPLETED)
     task1.finished_at = 10.0
     task1.duration_seconds = 4.25
-    task2.status = RunStatus.RUNNING
+    journal.set_status(task2, RunStatus.RUNNING)
     task2.current_action = "Doing work"
     return journal
 